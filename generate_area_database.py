@@ -5,129 +5,14 @@
 実際の記事ファイルから抽出したデータを基に構築
 """
 
-# blog_articlesから発掘した最高品質の地域表現を統合した完全版area_database
-area_database = {
-    '大正区': {
-        'population': 62083, 'households': 29821, 'area': '9.43', 'elderly': 19600,
-        'features': ['木津川・正蓮寺川に囲まれた水辺の工業地域', '大正駅・ドーム前千代崎駅の阪神電鉄沿線', '昔ながらの町工場と住宅が共存する下町', '高齢化率約32%の大阪市内高水準地域', 'なみはや大橋からの都心アクセス', '工業遺産と住環境の調和する歴史的地域'],
-        'medical_facilities': ['大正病院', '大正区医師会', '複数の介護施設・訪問看護ステーション']
-    },
-    '生野区': {
-        'population': 129742, 'households': 59876, 'area': '8.37', 'elderly': 36234,
-        'features': ['鶴橋・桃谷のコリアタウン多文化共生地域', '韓国・朝鮮料理の本格的グルメエリア', '近鉄大阪線・JR大阪環状線の鉄道交通要衝', '生野コリアタウンの国際色豊かな商店街文化', '多様な文化背景を持つ住民構成', 'キムチ横丁などの観光スポット'],
-        'medical_facilities': ['生野中央病院', '桃谷病院', '生野区医師会診療所', '複数のクリニックと診療所', '訪問看護ステーション', '介護老人保健施設', 'デイサービス・デイケア施設']
-    },
-    '住吉区': {
-        'population': 150527, 'households': 73892, 'area': '9.4', 'elderly': 41142,
-        'features': ['住吉大社の門前町として発展した歴史的地域', '6本の鉄道路線が通る交通要衝地域', '帝塚山などの高級住宅街エリア', '長居公園・我孫子など多様な地域性', '住宅密度の高い都市近郊住宅地', '住吉大社の初詣客で賑わう地域'],
-        'medical_facilities': ['大阪急性期・総合医療センター', '住吉区医師会診療所', '複数のクリニックと診療所', '訪問看護ステーション', '介護老人保健施設', 'デイサービス・デイケア施設']
-    },
-    '平野区': {
-        'population': 195021, 'households': 87456, 'area': '15.28', 'elderly': 56447,
-        'features': ['大阪市24区中3番目の広域面積を持つ区', '平野郷の歴史ある住宅密集地域', '新興住宅地と古い街並みが混在', '高齢化率約28.9%の大阪市内高水準', '住宅地が分散し通院負担が大きい地域', '地下鉄谷町線の交通利便性'],
-        'medical_facilities': ['平野総合病院', '杭全病院', '平野区医師会診療所', '複数の介護施設・訪問看護ステーション']
-    },
-    '浪速区': {
-        'population': 71717, 'households': 37891, 'area': '4.37', 'elderly': 19234,
-        'features': ['新世界・通天閣の大阪代表観光エリア', '日本橋電気街（でんでんタウン）の電子商業地', 'JR難波駅・大阪難波駅の交通結節点', '難波・心斎橋の繁華街に隣接', '外国人観光客の多い国際色豊かな地域', '商業・娯楽施設の高密度集積地'],
-        'medical_facilities': ['大阪警察病院', 'なんば駅前クリニック', '浪速区医師会診療所', '複数のクリニックと診療所', '訪問看護ステーション', '介護老人保健施設', 'デイサービス・デイケア施設']
-    },
-    '東住吉区': {
-        'population': 126123, 'households': 56789, 'area': '9.75', 'elderly': 34567,
-        'features': ['長居公園・長居陸上競技場のスポーツ拠点', '近鉄南大阪線の住宅地交通利便性', 'ファミリー世帯中心の静かな住環境', '長居植物園の緑豊かな自然環境', 'スポーツ・レクリエーション施設の充実', '住宅地としての良好な生活環境'],
-        'medical_facilities': ['東住吉森本病院', '長居病院', '東住吉区医師会診療所', '複数のクリニックと診療所', '訪問看護ステーション', '介護老人保健施設', 'デイサービス・デイケア施設']
-    },
-    '淀川区': {
-        'population': 174312, 'households': 81234, 'area': '12.64', 'elderly': 43567,
-        'features': ['新大阪駅の新幹線・在来線交通拠点', '十三駅の阪急電鉄ターミナル要衝', '淀川河川敷の自然環境とレクリエーション', 'ビジネスホテル・企業オフィスの集積', '都市機能の高度集積ビジネス地域', '新大阪副都心の商業・業務機能'],
-        'medical_facilities': ['淀川キリスト教病院', '新大阪病院', '淀川区医師会診療所', '複数のクリニックと診療所', '訪問看護ステーション', '介護老人保健施設', 'デイサービス・デイケア施設']
-    },
-    '福島区': {
-        'population': 78067, 'households': 39541, 'area': '4.67', 'elderly': 20583,
-        'features': ['福島駅・新福島駅の都心直結交通利便性', '堂島川沿いの水辺環境と景観', '高級マンションと下町情緒の共存地域', 'JR東西線・阪神本線の交通結節点', 'オフィス街へのアクセス抜群の立地', 'コンパクトで都市機能集積の住環境'],
-        'medical_facilities': ['関西電力病院附属福島クリニック', '福島病院', '福島区医師会診療所', '複数のクリニックと診療所', '訪問看護ステーション', '介護老人保健施設', 'デイサービス・デイケア施設']
-    },
-    '西区': {
-        'population': 101293, 'households': 51247, 'area': '5.21', 'elderly': 24107,
-        'features': ['京セラドーム大阪の大規模スポーツ施設', '靱公園の緑豊かな都心オアシス', '本町・阿波座のオフィス街商業地域', '新町・北堀江のトレンド発信エリア', '都心居住の人気高級住宅地', '地下鉄各線アクセスの交通利便性'],
-        'medical_facilities': ['西区民病院', '靱公園クリニック', '西区医師会診療所', '複数のクリニックと診療所', '訪問看護ステーション', '介護老人保健施設', 'デイサービス・デイケア施設']
-    },
-    '阿倍野区': {
-        'population': 107372, 'households': 52341, 'area': '5.99', 'elderly': 29678,
-        'features': ['あべのハルカス・天王寺駅の副都心機能', '阿倍野筋商店街の大阪代表的商業集積', 'JR・地下鉄・近鉄・阪堺電車の交通結節点', '天王寺ミオ・キューズモールの大型商業施設', '都市機能と商業の高度集積地域', '昭和町などの住宅地と商業地の調和'],
-        'medical_facilities': ['大阪市立大学医学部附属病院阿倍野医療センター', '阿倍野区医師会診療所', '複数のクリニックと診療所', '訪問看護ステーション', '介護老人保健施設']
-    },
-    '天王寺区': {
-        'population': 78324, 'households': 41256, 'area': '4.84', 'elderly': 21789,
-        'features': ['天王寺動物園・美術館の文化教育施設', '四天王寺など歴史ある寺院群', 'JR・地下鉄・近鉄の主要交通結節点', '上町台地の坂道が多い地形特性', '大阪赤十字病院など医療機関の充実', '天王寺公園・茶臼山古墳の歴史的環境'],
-        'medical_facilities': ['天王寺区医師会診療所', '大阪赤十字病院', '大阪警察病院', '訪問看護ステーション', '介護関連施設']
-    },
-    '住之江区': {
-        'population': 121548, 'households': 57892, 'area': '20.61', 'elderly': 33432,
-        'features': ['南港・咲洲の副都心ベイエリア', 'ATCやコスモスクエアの商業集積地', 'インテックス大阪などの展示会場', '住之江公園の豊かな緑と競艇場', '海に面した開放的な湾岸住環境', '住之江温泉など観光・レクリエーション施設'],
-        'medical_facilities': ['住之江区医師会診療所', '南港病院', '地域クリニック・診療所', '訪問看護ステーション', '介護関連施設']
-    },
-    '東成区': {
-        'population': 81234, 'households': 41567, 'area': '4.54', 'elderly': 23456,
-        'features': ['深江稲荷神社の歴史ある下町地域', '地下鉄中央線・今里筋線の交通利便性', 'コンパクトな住宅密集地域', '深江商店街など商店街文化が根付く', '大阪城公園に近接する立地', '高齢化率の高い地域コミュニティ'],
-        'medical_facilities': ['東成区医師会診療所', '地域クリニック・診療所', '訪問看護ステーション', '介護関連施設']
-    },
-    '鶴見区': {
-        'population': 112543, 'households': 52876, 'area': '15.2', 'elderly': 31245,
-        'features': ['鶴見緑地公園・花博記念公園の豊かな自然', '国際花と緑の博覧会（花博）開催地の歴史', '地下鉄長堀鶴見緑地線の利便性', 'ファミリー世帯中心の住宅地環境', '緑豊かな郊外型住環境', '鶴見緑地プールなどスポーツ・レクリエーション施設'],
-        'medical_facilities': ['鶴見区医師会診療所', '関西医科大学総合医療センター', '地域クリニック・診療所', '訪問看護ステーション', '介護関連施設']
-    },
-    '旭区': {
-        'population': 92341, 'households': 43567, 'area': '6.32', 'elderly': 27654,
-        'features': ['千林商店街の活気ある下町文化', '地下鉄谷町線・今里筋線の交通アクセス', '密集住宅地域の親しみやすいコミュニティ', '高齢化率の高い地域特性', '旭神社など地域に根付いた文化', '地域コミュニティが活発な住環境'],
-        'medical_facilities': ['旭区医師会診療所', '地域クリニック・診療所', '訪問看護ステーション', '介護関連施設']
-    },
-    '北区': {
-        'population': 135567, 'households': 71234, 'area': '10.34', 'elderly': 33891,
-        'features': ['梅田スカイビル・グランフロント大阪の都心機能', 'JR大阪駅・阪急梅田駅・阪神梅田駅の交通結節点', '中之島公園・淀川河川敷の水辺環境', '新梅田シティ・茶屋町の商業エリア', '梅田地下街・阪急百貨店の商業集積', '国際的なビジネス・観光拠点'],
-        'medical_facilities': ['北区医師会診療所', '梅田地区総合クリニック', '複数のクリニックと診療所', '訪問看護ステーション', '介護老人保健施設']
-    },
-    '都島区': {
-        'population': 104567, 'households': 51234, 'area': '6.08', 'elderly': 28123,
-        'features': ['毛馬桜之宮公園の桜並木と水辺環境', '淀川・大川に囲まれた川沿いの緑豊かな住環境', '桜ノ宮駅・都島駅・野江内代駅の交通利便性', 'JR・地下鉄・京阪の交通結節点', '古くからの住宅地と新しいマンションが混在', '都心近接の住宅地域'],
-        'medical_facilities': ['都島区医師会診療所', '地域クリニック・診療所', '訪問看護ステーション', '介護関連施設']
-    },
-    '此花区': {
-        'population': 67234, 'households': 31567, 'area': '19.25', 'elderly': 19876,
-        'features': ['ユニバーサル・スタジオ・ジャパンの国際観光地', 'JR桜島線・阪神なんば線の交通アクセス', '舞洲・夢洲の新開発ベイエリア', '大阪湾に面した臨海工業・住宅地域', '工業地域と住宅地の調和する混在地域', '春島・桜島など島嶼部を含む地域'],
-        'medical_facilities': ['此花区医師会診療所', '地域クリニック・診療所', '訪問看護ステーション', '介護関連施設']
-    },
-    '港区': {
-        'population': 84321, 'households': 42156, 'area': '7.86', 'elderly': 23567,
-        'features': ['大阪港・天保山ハーバービレッジの海運観光拠点', '海遊館・天保山大観覧車の観光施設', 'JR大阪環状線・地下鉄中央線の交通利便性', '築港・弁天町の工業と住宅の調和地域', '海に面した開放的な港湾環境', '大阪港咲洲トンネルの湾岸アクセス'],
-        'medical_facilities': ['港区医師会診療所', '地域クリニック・診療所', '訪問看護ステーション', '介護関連施設']
-    },
-    '西淀川区': {
-        'population': 98765, 'households': 47234, 'area': '14.22', 'elderly': 27891,
-        'features': ['阪神電車・JR東西線の交通利便性', '神崎川沿いの水辺環境と河川敷', '工業地域から住宅地への都市再生', '公害対策・環境改善の歴史と取り組み', '佃・野里・福の住宅密集地域', '環境改善が進む良好な住環境'],
-        'medical_facilities': ['西淀川区医師会診療所', '地域クリニック・診療所', '訪問看護ステーション', '介護関連施設']
-    },
-    '東淀川区': {
-        'population': 176543, 'households': 83456, 'area': '13.27', 'elderly': 48123,
-        'features': ['阪急京都線・千里線の交通要衝', '淀川河川敷の自然環境とレクリエーション', '上新庄・淡路・崇禅寺の商業・住宅地', '住宅密集地域の親しみやすいコミュニティ', '高齢化率の高い地域特性', '東淀川大橋など淀川との結びつき'],
-        'medical_facilities': ['東淀川区医師会診療所', '地域クリニック・診療所', '訪問看護ステーション', '介護関連施設']
-    },
-    '城東区': {
-        'population': 167890, 'households': 79234, 'area': '8.38', 'elderly': 45623,
-        'features': ['地下鉄長堀鶴見緑地線・今里筋線の交通利便性', '大阪城公園に隣接する歴史的立地', '関目・野江・蒲生の住宅密集地域', '商店街文化が根付く下町コミュニティ', '高齢化率の高い地域特性', '城東貨物線沿いの工業・住宅混在地域'],
-        'medical_facilities': ['城東区医師会診療所', '地域クリニック・診療所', '訪問看護ステーション', '介護関連施設']
-    },
-    '西成区': {
-        'population': 110234, 'households': 67891, 'area': '7.37', 'elderly': 39456,
-        'features': ['あいりん地域の社会的課題と支援体制', '南海電鉄・地下鉄四つ橋線の交通アクセス', '新今宮・天下茶屋・岸里の住宅密集地域', '社会福祉・生活保護の重要拠点', '地域再生・まちづくりの取り組み', '多様な社会的背景を持つ住民構成'],
-        'medical_facilities': ['西成区医師会診療所', '地域クリニック・診療所', '訪問看護ステーション', '介護関連施設', '社会福祉施設']
-    },
-    '中央区': {
-        'population': 98234, 'households': 53456, 'area': '8.87', 'elderly': 24567,
-        'features': ['大阪城・難波宮跡の歴史文化遺産', '本町・淀屋橋・北浜のビジネス中枢地区', '地下鉄御堂筋線・中央線・谷町線の交通結節', '高層マンション・タワーマンションの都心居住', '商業・業務機能の高度集積地域', '大阪市役所など行政機能の中心'],
-        'medical_facilities': ['中央区医師会診療所', '地域クリニック・診療所', '訪問看護ステーション', '介護関連施設']
-    }
-}
+import sys
+from pathlib import Path
+
+# 地域データ本体は scripts/area_database.py の共有ストアに一元化
+sys.path.insert(0, str(Path(__file__).parent / "scripts"))
+from area_database import AREA_DATABASE, OSAKA_WARDS
+
+area_database = AREA_DATABASE
 
 def generate_area_database_code():
     """area_databaseのPythonコード形式を出力"""
@@ -136,21 +21,13 @@ def generate_area_database_code():
     print()
     print("area_database = {")
     
-    # 大阪市24区のリスト（正式な順序）
-    osaka_24_wards = [
-        '北区', '都島区', '福島区', '此花区', '西区', '港区', '大正区', '天王寺区', 
-        '浪速区', '西淀川区', '東淀川区', '東成区', '生野区', '旭区', '城東区', 
-        '阿倍野区', '住吉区', '東住吉区', '西成区', '住之江区', '中央区', '鶴見区', 
-        '平野区', '淀川区'
-    ]
-    
-    for ward in osaka_24_wards:
+    for ward in OSAKA_WARDS:
         if ward in area_database:
             data = area_database[ward]
             print(f"    '{ward}': {{")
             print(f"        'population': {data['population']}, 'households': {data['households']}, 'area': '{data['area']}', 'elderly': {data['elderly']},")
-            print(f"        'features': {data['features']},")
-            print(f"        'medical_facilities': {data['medical_facilities']}")
+            print(f"        'features': {list(data['features'])},")
+            print(f"        'medical_facilities': {list(data['medical_facilities'])}")
             print(f"    }},")
         else:
             print(f"    # {ward}: データが見つかりませんでした")
@@ -172,4 +49,4 @@ if __name__ == "__main__":
     
     print("\n" + "=" * 60)
     print("使用方法:")
-    print("このarea_databaseを scripts/seo_blog_system.py の _get_area_data() メソッドで使用してください")
\ No newline at end of file
+    print("地域データは scripts/area_database.py で管理され、seo_blog_system.py / safe_jekyll_converter.py から共有参照されます")
\ No newline at end of file
@@ -8,6 +8,9 @@ import random
 from datetime import datetime
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent / 'scripts'))
+from article_templates import get_simple_article_template
+
 # 環境変数からクリニック情報を取得
 COMPANY_NAME = os.environ.get('COMPANY_NAME', 'ひまわり治療院')
 LICENSE = os.environ.get('LICENSE', '厚生労働省認定・医療保険適用の訪問医療マッサージ専門院')
@@ -38,177 +41,18 @@ def generate_article_content(condition, area, category):
     
     today = datetime.now().strftime('%Y年%m月%d日')
     
-    if category == 'symptom_guide':
-        title = f"{condition}でお悩みの方へ｜{area}の訪問マッサージで症状緩和"
-        content = f"""# {title}
-
-## {area}にお住まいの{condition}でお困りの方へ
-
-{area}で{condition}の症状にお悩みの方へ、{COMPANY_NAME}の訪問医療マッサージがお役に立てるかもしれません。
-
-### {condition}の症状について
-
-{condition}は、日常生活に大きな影響を与える症状です。{area}の多くの方が、この症状でお困りです。
-
-- 日常生活での動作が困難になる
-- 痛みや不快感が継続する
-- 身体機能の低下が見られる
-
-### 訪問マッサージによるサポート
-
-{COMPANY_NAME}では、{area}全域で以下のサービスを提供しています：
-
-1. **個別対応のマッサージ施術**
-   - お一人おひとりの症状に合わせた施術
-   - 身体機能の維持・改善をサポート
-
-2. **ご自宅での施術**
-   - 通院の負担なし
-   - リラックスできる環境での施術
-
-3. **保険適用可能**
-   - 医療保険適用で経済的負担を軽減
-   - 医師の同意書があれば保険適用可能
-
-### {area}での訪問エリア
-
-{area}全域に訪問可能です。ご自宅や施設まで、経験豊富な施術師がお伺いします。
-
-### お問い合わせ
-
-**電話番号**: {CLINIC_PHONE}  
-**営業時間**: {BUSINESS_HOURS}
-
-{area}で{condition}の症状にお悩みの方は、お気軽にご相談ください。
-
----
-
-*最終更新日: {today}*
-"""
-    
-    elif category == 'qa':
-        title = f"{condition}のよくある質問｜{area}の訪問マッサージ"
-        content = f"""# {title}
-
-## {area}の方から寄せられる{condition}に関するご質問
-
-### Q1. {condition}でも訪問マッサージを受けられますか？
-
-はい、{condition}の方も訪問マッサージを受けていただけます。{area}にお住まいの多くの方にご利用いただいています。
-
-### Q2. 保険は適用されますか？
-
-医師の同意書があれば、医療保険の適用が可能です。{area}の医療機関と連携してサポートいたします。
-
-### Q3. どのような施術を行いますか？
-
-{condition}の症状に応じて、以下の施術を組み合わせます：
-- マッサージによる血行促進
-- 関節可動域の維持・改善
-- 筋力維持のサポート
-
-### Q4. {area}のどこまで訪問可能ですか？
-
-{area}全域に訪問可能です。ご自宅はもちろん、施設への訪問も対応しています。
-
-### Q5. 料金はどのくらいかかりますか？
-
-保険適用の場合、1回あたりの自己負担は数百円程度です。詳細はお問い合わせください。
-
-### お問い合わせ
-
-**{COMPANY_NAME}**  
-電話: {CLINIC_PHONE}  
-営業時間: {BUSINESS_HOURS}
-
----
-
-*最終更新日: {today}*
-"""
-    
-    elif category == 'case_study':
-        title = f"{condition}の改善事例｜{area}の訪問マッサージ"
-        content = f"""# {title}
-
-## {area}での{condition}改善サポート事例
-
-### 事例のご紹介
-
-{area}にお住まいの方で、{condition}の症状でお困りの方への訪問マッサージサポート事例をご紹介します。
-
-### ケース1: 70代の方の例
-
-**状況**: {condition}により日常生活に支障
-**サポート内容**: 週2回の訪問マッサージ
-**経過**: 3ヶ月で身体機能の維持・改善を実感
-
-### ケース2: 80代の方の例
-
-**状況**: {condition}による身体の不調
-**サポート内容**: 週3回の訪問マッサージ
-**経過**: 継続的なケアで生活の質が向上
-
-### {area}での訪問マッサージの特徴
-
-- ご自宅での施術で通院負担なし
-- 個別対応で最適なケア
-- 保険適用で経済的負担を軽減
-
-### ご相談・お問い合わせ
-
-{area}で{condition}にお悩みの方は、ぜひご相談ください。
-
-**電話**: {CLINIC_PHONE}  
-**営業時間**: {BUSINESS_HOURS}
-
----
-
-*最終更新日: {today}*
-"""
-    
-    else:  # prevention
-        title = f"{condition}の予防とケア｜{area}の訪問マッサージ"
-        content = f"""# {title}
-
-## {area}で{condition}の予防・ケアをサポート
-
-### {condition}の予防について
-
-{condition}は適切なケアで進行を遅らせることが可能です。{area}の皆様の健康維持をサポートします。
-
-### 予防のポイント
-
-1. **定期的な身体のケア**
-   - マッサージによる血行促進
-   - 関節可動域の維持
-
-2. **早期対応の重要性**
-   - 症状が軽いうちからのケア
-   - 継続的なサポート
-
-3. **生活習慣の改善**
-   - 適度な運動のサポート
-   - 身体機能の維持
-
-### {area}での訪問マッサージサービス
-
-{COMPANY_NAME}では、{area}全域で予防ケアをサポートしています。
-
-- 定期的な訪問でケア
-- 保険適用可能
-- 経験豊富な施術師が対応
-
-### お問い合わせ
-
-**電話**: {CLINIC_PHONE}  
-**営業時間**: {BUSINESS_HOURS}
-
-{area}で{condition}の予防・ケアをお考えの方は、お気軽にご相談ください。
-
----
-
-*最終更新日: {today}*
-"""
+    # コンパイル済みテンプレート（scripts/article_templates.py）で描画
+    title_template, body_template = get_simple_article_template(category)
+    title = title_template.render(condition=condition, area=area)
+    content = body_template.render(
+        title=title,
+        condition=condition,
+        area=area,
+        today=today,
+        COMPANY_NAME=COMPANY_NAME,
+        CLINIC_PHONE=CLINIC_PHONE,
+        BUSINESS_HOURS=BUSINESS_HOURS
+    )
     
     return title, content
 
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+アラート集約（重複排除ウィンドウ）
+(プラットフォーム, サイト, エラーシグネチャ) ごとに最初の1件だけ即時アラートし、
+ウィンドウ内の同一エラーは件数のみ数えて、ウィンドウ終了時に「N回発生」の要約アラートを1件送る
+
+- Netlify のビルド再試行・連続 push で同じエラーが続いても通知・詳細ログは1ウィンドウあたり最大2件
+- 要約を送ったウィンドウの直後も同じキーを監視し続ける（エラーが止むまで1ウィンドウ1要約）
+"""
+
+import re
+import time
+import hashlib
+import logging
+import threading
+from typing import Callable, Dict, List, Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WINDOW_SECONDS = 600
+VARIABLE_TOKEN_PATTERN = re.compile(r'\b[0-9a-f]{7,40}\b|\d+')
+
+def issue_signature(error_data: Dict[str, Any]) -> str:
+    """エラーシグネチャ（検出パターンの集合。検出なしの場合は数値・ハッシュ値を除いたメッセージ）"""
+    issues = sorted({f"{issue.get('category')}:{issue.get('pattern')}" for issue in error_data.get('detected_issues') or []})
+    if issues:
+        return "|".join(issues)
+    message = VARIABLE_TOKEN_PATTERN.sub('#', str(error_data.get('error_message') or ''))
+    return "message:" + hashlib.sha1(" ".join(message.split()).encode('utf-8')).hexdigest()[:12]
+
+def alert_key(error_data: Dict[str, Any]) -> Tuple[str, str, str]:
+    """集約キー (プラットフォーム, サイト, シグネチャ)"""
+    return (str(error_data.get('platform') or ''), str(error_data.get('site_name') or ''), issue_signature(error_data))
+
+class AlertAggregator:
+    """同一エラーのウィンドウ内集約（ウィンドウ終了時に要約をコールバック）"""
+
+    def __init__(self, window: float = DEFAULT_WINDOW_SECONDS,
+                 on_summary: Optional[Callable[[Dict[str, Any]], None]] = None):
+        self.window = window
+        self.on_summary = on_summary
+        self._condition = threading.Condition()
+        self._windows: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+        self._sweeper: Optional[threading.Thread] = None
+        self._closed = False
+        self._counters = {'alerted': 0, 'suppressed': 0, 'summaries': 0}
+
+    def observe(self, error_data: Dict[str, Any]) -> Dict[str, Any]:
+        """エラー1件の判定（action: 'alert' = 即時通知 / 'suppress' = 集約して件数のみ加算）"""
+        key = alert_key(error_data)
+        now = time.monotonic()
+        with self._condition:
+            if self.window <= 0:
+                self._counters['alerted'] += 1
+                return {'action': 'alert', 'key': key, 'count': 1}
+
+            window = self._windows.get(key)
+            if window is None:
+                self._windows[key] = {'opened': now, 'closes': now + self.window, 'repeats': 0, 'total': 1,
+                                      'error_data': error_data}
+                self._counters['alerted'] += 1
+                self._ensure_sweeper()
+                self._condition.notify()
+                return {'action': 'alert', 'key': key, 'count': 1}
+
+            window['repeats'] += 1
+            window['total'] += 1
+            window['error_data'] = error_data
+            self._counters['suppressed'] += 1
+            return {'action': 'suppress', 'key': key, 'count': window['total']}
+
+    def _ensure_sweeper(self):
+        """ウィンドウ終了を処理するスレッド起動（初回のみ・呼び出し側でロック取得済み）"""
+        if self._sweeper is None:
+            self._sweeper = threading.Thread(target=self._sweep_loop, name="alert-aggregator", daemon=True)
+            self._sweeper.start()
+
+    def _sweep_loop(self):
+        while True:
+            with self._condition:
+                while not self._closed:
+                    due = self._collect_expired(time.monotonic())
+                    if due:
+                        break
+                    next_close = min((w['closes'] for w in self._windows.values()), default=None)
+                    self._condition.wait(None if next_close is None else max(0.0, next_close - time.monotonic()))
+                else:
+                    return
+            self._emit(due)
+
+    def _collect_expired(self, now: float) -> List[Dict[str, Any]]:
+        """終了したウィンドウの要約を取り出す（呼び出し側でロック取得済み）"""
+        summaries = []
+        for key, window in list(self._windows.items()):
+            if window['closes'] > now:
+                continue
+            if window['repeats']:
+                summaries.append({
+                    'key': key,
+                    'count': window['repeats'],
+                    'total': window['total'],
+                    'window_seconds': round(now - window['opened']),
+                    'error_data': window['error_data']
+                })
+                # 続けて発生する場合に備えて次のウィンドウを開く（次も発生がなければ削除）
+                self._windows[key] = {'opened': now, 'closes': now + self.window, 'repeats': 0,
+                                      'total': window['total'], 'error_data': window['error_data']}
+            else:
+                del self._windows[key]
+        self._counters['summaries'] += len(summaries)
+        return summaries
+
+    def _emit(self, summaries: List[Dict[str, Any]]):
+        for summary in summaries:
+            if self.on_summary is None:
+                continue
+            try:
+                self.on_summary(summary)
+            except Exception as e:
+                logger.error(f"集約アラート送信エラー: {e}")
+
+    def flush(self):
+        """ウィンドウ終了を待たずに全要約を送出（終了時用）"""
+        with self._condition:
+            for window in self._windows.values():
+                window['closes'] = 0
+            summaries = self._collect_expired(time.monotonic())
+            self._windows.clear()
+        self._emit(summaries)
+
+    def stats(self) -> Dict[str, Any]:
+        """集約統計（/health 用）"""
+        with self._condition:
+            return {
+                'window_seconds': self.window,
+                'open_windows': len(self._windows),
+                'pending_repeats': sum(window['repeats'] for window in self._windows.values()),
+                **self._counters
+            }
+
+    def shutdown(self):
+        """要約を送出してスレッド停止"""
+        self.flush()
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+アラート通知ファンアウト
+Slack・Discord・システム通知をチャンネルごとのワーカースレッドで並行送信する
+（Webhook 応答や他チャンネルを遅いチャンネルが待たせない）
+
+- HTTP チャンネルはチャンネルごとに requests.Session を保持（接続の再利用）
+- 送信失敗（接続エラー・タイムアウト・429・5xx）は指数バックオフで再送（429 は Retry-After を優先）
+- 短時間に集中したアラートは digest_window 秒まとめてダイジェストとして送信
+  （チャンネルの文字数上限を超える場合は複数通に分割し、アラートを切り捨てない）
+- チャンネルごとのトークンバケットで送信頻度を制限（制限中に届いたアラートは次のダイジェストに合流）
+"""
+
+import time
+import random
+import logging
+import threading
+from collections import deque
+from typing import Callable, Dict, List, Any, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DIGEST_WINDOW = 5.0
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_BASE = 0.5
+MAX_BACKOFF_SECONDS = 30.0
+HTTP_TIMEOUT = (3.05, 10)  # (接続, 読み込み)
+RETRYABLE_STATUS = {408, 425, 429, 500, 502, 503, 504}
+DIGEST_SEPARATOR = "\n\n" + "─" * 20 + "\n\n"
+
+class TokenBucket:
+    """トークンバケット（capacity 回までの連続送信を許し、以降は毎分 per_minute 回に制限）"""
+
+    def __init__(self, capacity: float, per_minute: float):
+        if capacity < 1 or per_minute <= 0:
+            raise ValueError(f"送信制限はバースト上限1以上・毎分の送信数0より大きい値で指定してください: ({capacity}, {per_minute})")
+        self.capacity = capacity
+        self.refill_per_second = per_minute / 60.0
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.refill_per_second)
+        self.updated = now
+
+    def wait_time(self) -> float:
+        """次のトークンまでの秒数（0 なら即送信可）"""
+        self._refill()
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.refill_per_second
+
+    def consume(self):
+        self._refill()
+        self.tokens -= 1
+
+class NotificationChannel:
+    """通知チャンネル基底（send は成功で True、再送すべき失敗は例外または False）"""
+
+    def __init__(self, name: str, max_length: Optional[int] = None):
+        self.name = name
+        self.max_length = max_length
+
+    def send(self, message: str) -> bool:
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+class WebhookChannel(NotificationChannel):
+    """Incoming Webhook チャンネル（接続を再利用する Session 付き）"""
+
+    def __init__(self, name: str, url: str, build_payload: Callable[[str], Dict[str, Any]],
+                 ok_statuses: Tuple[int, ...] = (200,), max_length: Optional[int] = None):
+        super().__init__(name, max_length)
+        self.url = url
+        self.build_payload = build_payload
+        self.ok_statuses = ok_statuses
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=2))
+        self.session.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=2))
+        self.retry_after: Optional[float] = None
+
+    def send(self, message: str) -> bool:
+        self.retry_after = None
+        response = self.session.post(self.url, json=self.build_payload(message), timeout=HTTP_TIMEOUT)
+        if response.status_code in self.ok_statuses:
+            return True
+        if response.status_code == 429:
+            try:
+                self.retry_after = float(response.headers.get('Retry-After', ''))
+            except ValueError:
+                self.retry_after = None
+        if response.status_code in RETRYABLE_STATUS:
+            raise requests.HTTPError(f"HTTP {response.status_code}", response=response)
+        logger.warning(f"⚠️ {self.name}通知失敗（再送なし）: {response.status_code}")
+        return False
+
+    def close(self):
+        self.session.close()
+
+class FunctionChannel(NotificationChannel):
+    """関数呼び出しチャンネル（システム通知等）"""
+
+    def __init__(self, name: str, func: Callable[[str], Any]):
+        super().__init__(name)
+        self.func = func
+
+    def send(self, message: str) -> bool:
+        self.func(message)
+        return True
+
+def slack_channel(url: str) -> WebhookChannel:
+    """Slack Incoming Webhook"""
+    return WebhookChannel('Slack', url, lambda message: {
+        "text": message,
+        "username": "Error Monitor Bot",
+        "icon_emoji": ":warning:"
+    }, ok_statuses=(200,), max_length=39000)
+
+def discord_channel(url: str) -> WebhookChannel:
+    """Discord Webhook（content は2000文字まで）"""
+    return WebhookChannel('Discord', url, lambda message: {
+        "content": message,
+        "username": "Error Monitor"
+    }, ok_statuses=(200, 204), max_length=2000)
+
+def format_digest(messages: List[str]) -> str:
+    """複数アラートを1通にまとめる"""
+    if len(messages) == 1:
+        return messages[0]
+    return f"📦 アラート {len(messages)}件（まとめて通知）" + DIGEST_SEPARATOR + DIGEST_SEPARATOR.join(messages)
+
+def split_digest(messages: List[str], max_length: Optional[int]) -> List[Tuple[str, int]]:
+    """アラート群を文字数上限に収まる複数のダイジェストに分割 [(送信本文, 含まれるアラート数)]
+
+    単独で上限を超えるアラートのみ切り詰める（他のアラートは切り捨てない）
+    """
+    if max_length is None:
+        return [(format_digest(messages), len(messages))]
+
+    parts: List[Tuple[str, int]] = []
+    current: List[str] = []
+    for message in messages:
+        message = _truncate(message, max_length)
+        if current and len(format_digest(current + [message])) > max_length:
+            parts.append((format_digest(current), len(current)))
+            current = []
+        current.append(message)
+    if current:
+        parts.append((format_digest(current), len(current)))
+    return parts
+
+def _truncate(message: str, max_length: Optional[int]) -> str:
+    """チャンネルの文字数上限に合わせて切り詰め"""
+    if max_length is None or len(message) <= max_length:
+        return message
+    suffix = "\n…（省略）"
+    return message[:max_length - len(suffix)] + suffix
+
+class _ChannelWorker:
+    """チャンネル1つ分の送信ワーカー（ダイジェスト集約・再送）"""
+
+    def __init__(self, channel: NotificationChannel, notifier: "AlertNotifier"):
+        self.channel = channel
+        self.notifier = notifier
+        self.pending: deque = deque()
+        self.condition = threading.Condition()
+        self.busy = False
+        self.closed = False
+        self.bucket = notifier.rate_limits.get(channel.name)
+        self.stats = {
+            'queued': 0, 'sent': 0, 'failed': 0, 'retries': 0, 'digests': 0, 'rate_limited': 0, 'last_error': None
+        }
+        self.thread = threading.Thread(target=self._run, name=f"notifier-{channel.name}", daemon=True)
+        self.thread.start()
+
+    def enqueue(self, message: str):
+        with self.condition:
+            self.pending.append(message)
+            self.stats['queued'] += 1
+            self.condition.notify()
+
+    def _run(self):
+        while True:
+            with self.condition:
+                while not self.pending and not self.closed:
+                    self.condition.wait()
+                if not self.pending and self.closed:
+                    return
+                self.busy = True
+
+            # 最初のアラートから digest_window 秒は後続を待ってまとめる（終了時は待たない）
+            deadline = time.monotonic() + self.notifier.digest_window
+            with self.condition:
+                while not self.closed and time.monotonic() < deadline:
+                    self.condition.wait(deadline - time.monotonic())
+
+                # 送信枠がなければトークン補充まで待つ（その間のアラートも同じダイジェストにまとめる）
+                if self.bucket is not None and self.bucket.wait_time() > 0:
+                    self.stats['rate_limited'] += 1
+                    while not self.closed and self.bucket.wait_time() > 0:
+                        self.condition.wait(min(MAX_BACKOFF_SECONDS, self.bucket.wait_time()))
+                if self.bucket is not None:
+                    self.bucket.consume()
+
+                batch = list(self.pending)
+                self.pending.clear()
+
+            try:
+                self._deliver(batch)
+            finally:
+                with self.condition:
+                    self.busy = False
+                    self.condition.notify_all()
+
+    def _deliver(self, batch: List[str]):
+        """送信（文字数上限を超えるダイジェストは分割し、各メッセージを個別に再送制御）"""
+        for message, count in split_digest(batch, self.channel.max_length):
+            if count > 1:
+                self.stats['digests'] += 1
+            self._send_with_retry(message, count)
+
+    def _send_with_retry(self, message: str, count: int):
+        """1メッセージの送信（失敗時は指数バックオフ + ジッターで再送）。count はメッセージに含まれるアラート数"""
+        for attempt in range(self.notifier.max_retries + 1):
+            try:
+                if self.channel.send(message):
+                    self.stats['sent'] += count
+                    logger.info(f"✅ {self.channel.name}通知送信成功（{count}件）")
+                else:
+                    self.stats['failed'] += count
+                return
+            except Exception as e:
+                self.stats['last_error'] = str(e)
+                if attempt == self.notifier.max_retries:
+                    break
+                retry_after = getattr(self.channel, 'retry_after', None)
+                if retry_after:
+                    delay = min(MAX_BACKOFF_SECONDS, retry_after)
+                else:
+                    delay = min(MAX_BACKOFF_SECONDS, self.notifier.backoff_base * (2 ** attempt)) * random.uniform(0.8, 1.2)
+                self.stats['retries'] += 1
+                logger.warning(f"⚠️ {self.channel.name}通知失敗、{delay:.1f}秒後に再送: {e}")
+                time.sleep(delay)
+
+        self.stats['failed'] += count
+        logger.error(f"{self.channel.name}通知エラー（再送上限）: {self.stats['last_error']}")
+
+    def wait_idle(self, deadline: float) -> bool:
+        with self.condition:
+            while self.pending or self.busy:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self.condition.wait(remaining)
+            return True
+
+    def close(self):
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+
+class AlertNotifier:
+    """複数チャンネルへのアラート並行送信"""
+
+    def __init__(self, channels: List[NotificationChannel], digest_window: float = DEFAULT_DIGEST_WINDOW,
+                 max_retries: int = DEFAULT_MAX_RETRIES, backoff_base: float = DEFAULT_BACKOFF_BASE,
+                 rate_limits: Optional[Dict[str, Tuple[float, float]]] = None):
+        """rate_limits: チャンネル名 → (バースト上限, 毎分の送信数)。'*' は全チャンネル共通の既定値"""
+        self.digest_window = digest_window
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        rate_limits = rate_limits or {}
+        self.rate_limits = {
+            channel.name: TokenBucket(*rate_limits[channel.name if channel.name in rate_limits else '*'])
+            for channel in channels if channel.name in rate_limits or '*' in rate_limits
+        }
+        self._workers = {channel.name: _ChannelWorker(channel, self) for channel in channels}
+
+    @property
+    def channels(self) -> List[str]:
+        return list(self._workers)
+
+    def notify(self, message: str, channels: Optional[List[str]] = None):
+        """全チャンネル（または指定チャンネル）に送信予約して即座に戻る"""
+        for name, worker in self._workers.items():
+            if channels is None or name in channels:
+                worker.enqueue(message)
+
+    def flush(self, timeout: float = 30.0) -> bool:
+        """送信待ちがなくなるまで待機（ダイジェスト待ちも含む）"""
+        deadline = time.monotonic() + timeout
+        return all(worker.wait_idle(deadline) for worker in self._workers.values())
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """チャンネル別送信統計（/health 用）"""
+        return {
+            name: dict(worker.stats, pending=len(worker.pending))
+            for name, worker in self._workers.items()
+        }
+
+    def shutdown(self, timeout: float = 30.0):
+        """待機中のアラートをダイジェスト待ちせずに送信して終了"""
+        for worker in self._workers.values():
+            worker.close()
+        deadline = time.monotonic() + timeout
+        for worker in self._workers.values():
+            worker.thread.join(max(0.0, deadline - time.monotonic()))
+            worker.channel.close()
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+地域・症状アーカイブ索引ビルダー
+_posts の Front Matter 索引（front_matter_index.py）から地域・症状・カテゴリ別に記事を分類して
+areas/*/index.md・symptoms/*/index.md・_data/archive_index.json を生成する
+
+アーカイブレイアウトは site.posts | where（全記事走査 × ページ数）ではなく
+site.data.archive_index の事前計算済みリストを参照する
+
+使用方法: python archive_index_builder.py [--dry-run]
+"""
+
+import sys
+import json
+import argparse
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+from area_database import OSAKA_WARDS
+from front_matter_index import (
+    FrontMatterIndex, post_url, find_project_root, load_site_config, write_atomic, DEFAULT_PERMALINK
+)
+
+UNGROUPED_LABEL = "その他"
+
+class ArchiveIndexBuilder:
+    """地域・症状アーカイブ索引ビルダー"""
+
+    def __init__(self, project_root: Optional[Path] = None):
+        self.project_root = project_root or find_project_root()
+        self.posts_dir = self.project_root / "_posts"
+        self.site_config = load_site_config(self.project_root)
+        self.permalink_pattern = self.site_config.get('permalink') or DEFAULT_PERMALINK
+        self.front_matter_index = FrontMatterIndex(self.posts_dir, self.project_root / ".cache" / "front_matter_index.json")
+
+    def load_posts(self) -> List[Dict[str, Any]]:
+        """Front Matter 索引からアーカイブ用レコードを取得（新しい順、変更された記事のみ再解析）"""
+        return [self._build_record(entry) for entry in self.front_matter_index.posts()]
+
+    def _build_record(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """アーカイブレイアウトが参照する項目のみのレコード"""
+        return {
+            'path': entry['path'],
+            'url': post_url(entry, self.permalink_pattern),
+            'title': entry['title'],
+            'date': entry['date'],
+            'categories': entry['categories'],
+            'tags': entry['tags'],
+            'area': entry['area'],
+            'condition': entry['condition'],
+            'description': entry['description'],
+            'excerpt': entry['excerpt'],
+        }
+
+    def build_index(self, posts: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """地域・症状・カテゴリ別の記事リスト（各リストは新しい順、重複なし）"""
+        areas: Dict[str, List[Dict[str, Any]]] = {area: [] for area in OSAKA_WARDS}
+        conditions: Dict[str, List[Dict[str, Any]]] = {
+            condition: [] for condition in self.site_config.get('conditions', [])
+        }
+        categories: Dict[str, List[Dict[str, Any]]] = {}
+
+        for post in posts:
+            if post['area']:
+                areas.setdefault(post['area'], []).append(post)
+            if post['condition']:
+                conditions.setdefault(post['condition'], []).append(post)
+            for category in post['categories']:
+                categories.setdefault(category, []).append(post)
+
+        return {
+            'areas': areas,
+            'conditions': conditions,
+            'categories': dict(sorted(categories.items())),
+        }
+
+    def render_area_page(self, area: str, area_posts: List[Dict[str, Any]]) -> str:
+        """地域アーカイブページ（areas/<区>/index.md）"""
+        sections = self._render_grouped_links(area_posts, 'condition')
+        return f'''---
+layout: area-archive-debug
+title: "{area}の訪問マッサージ・在宅医療マッサージ"
+description: "大阪市{area}での医療保険適用の訪問マッサージサービス。国家資格を持つマッサージ師が地域密着でサポート。{len(area_posts)}記事掲載中。"
+area: "{area}"
+permalink: /areas/{area}/
+---
+
+# {area}の訪問マッサージサービス
+
+大阪市{area}にお住まいの方へ、医療保険適用の訪問マッサージサービスをご提供しています。
+
+## {area}の特徴
+
+{area}は大阪市内でも利便性の高い地域です。交通アクセスが良好で、医療機関も充実しています。
+
+## {area}での訪問マッサージ対応症状
+
+現在{len(area_posts)}件の専門記事をご用意しています：
+
+{sections}
+## お問い合わせ
+
+{area}での訪問マッサージをご検討の方は、お気軽にご相談ください。
+
+**📞 [{{{{ site.data.business.phone }}}}](tel:{{{{ site.data.business.phone }}}})**  
+**🌐 [詳細・お申込みはこちら]({{{{ site.data.business.main_site_url }}}}/)**
+
+---
+
+**医療保険適用で安心**  
+国家資格を持つマッサージ師が{area}までお伺いします。
+'''
+
+    def render_symptom_page(self, condition: str, condition_posts: List[Dict[str, Any]]) -> str:
+        """症状アーカイブページ（symptoms/<症状>/index.md）"""
+        sections = self._render_grouped_links(condition_posts, 'area')
+        return f'''---
+layout: symptom-archive-debug
+title: "{condition}の訪問マッサージ｜大阪市対応"
+description: "{condition}でお悩みの方へ。大阪市での医療保険適用の訪問マッサージサービス。国家資格を持つマッサージ師が専門ケアを提供。{len(condition_posts)}記事掲載。"
+symptom: "{condition}"
+permalink: /symptoms/{condition}/
+---
+
+# {condition}の訪問マッサージサービス
+
+{condition}でお悩みの方へ、大阪市での医療保険適用の訪問マッサージサービスをご提供しています。
+
+## {condition}について
+
+{condition}は適切なケアにより症状の緩和が期待できる症状です。当院では国家資格を持つマッサージ師が専門的なケアをご提供します。
+
+## 対応地域別記事
+
+現在{len(condition_posts)}件の専門記事をご用意しています：
+
+{sections}
+## {condition}の訪問マッサージ
+
+医療保険適用により、{condition}でお悩みの方に専門的なケアをご提供しています。
+
+**主な対応内容:**
+- 症状に応じた専門的な施術
+- 日常生活指導
+- 機能訓練
+- ご家族へのアドバイス
+
+## お問い合わせ
+
+{condition}でお悩みの方は、お気軽にご相談ください。
+
+**📞 [{{{{ site.data.business.phone }}}}](tel:{{{{ site.data.business.phone }}}})**  
+**🌐 [詳細・お申込みはこちら]({{{{ site.data.business.main_site_url }}}}/)**
+
+---
+
+**医療保険適用で安心**  
+{condition}の専門ケアを大阪市内全域でご提供します。
+'''
+
+    def _render_grouped_links(self, posts: List[Dict[str, Any]], group_key: str) -> str:
+        """記事リンクを見出し別にまとめたMarkdown（地域は公式順、症状は _config.yml の順）"""
+        if group_key == 'area':
+            order = list(OSAKA_WARDS)
+        else:
+            order = list(self.site_config.get('conditions', []))
+
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+        for post in posts:
+            groups.setdefault(post[group_key] or UNGROUPED_LABEL, []).append(post)
+
+        def group_rank(name: str) -> Tuple[int, str]:
+            return (order.index(name), name) if name in order else (len(order), name)
+
+        sections = []
+        for name in sorted(groups, key=group_rank):
+            links = "\n".join(f"- [{post['title']}]({post['url']})" for post in groups[name])
+            sections.append(f"\n### {name}\n\n{links}\n")
+        return "".join(sections) + ("\n" if sections else "")
+
+    def build(self, dry_run: bool = False) -> Dict[str, Any]:
+        """索引・アーカイブページ生成（内容が変わったファイルのみ書き込み）"""
+        print("🗂️  アーカイブ索引生成開始")
+        posts = self.load_posts()
+        index = self.build_index(posts)
+
+        outputs: Dict[Path, str] = {}
+        for area, area_posts in index['areas'].items():
+            outputs[self.project_root / "areas" / area / "index.md"] = self.render_area_page(area, area_posts)
+        for condition, condition_posts in index['conditions'].items():
+            outputs[self.project_root / "symptoms" / condition / "index.md"] = self.render_symptom_page(condition, condition_posts)
+        outputs[self.project_root / "_data" / "archive_index.json"] = json.dumps(
+            index, ensure_ascii=False, indent=2
+        ) + "\n"
+
+        written, unchanged = [], 0
+        for output_path, content in outputs.items():
+            if output_path.exists() and output_path.read_text(encoding='utf-8') == content:
+                unchanged += 1
+                continue
+            written.append(str(output_path.relative_to(self.project_root)))
+            if not dry_run:
+                write_atomic(output_path, content)
+
+        action = "更新予定" if dry_run else "更新"
+        print(f"📊 記事 {len(posts)}件 / 地域 {len(index['areas'])} / 症状 {len(index['conditions'])} / カテゴリ {len(index['categories'])}")
+        print(f"✅ {action}: {len(written)}ファイル / 変更なし: {unchanged}ファイル")
+        for path in written:
+            print(f"  📝 {path}")
+
+        return {
+            'success': True,
+            'posts': len(posts),
+            'written': written,
+            'unchanged': unchanged,
+            'dry_run': dry_run
+        }
+
+def main():
+    """メイン実行関数"""
+    parser = argparse.ArgumentParser(description='地域・症状アーカイブ索引ビルダー')
+    parser.add_argument('--dry-run', action='store_true', help='書き込まずに更新対象のみ表示')
+    args = parser.parse_args()
+
+    result = ArchiveIndexBuilder().build(dry_run=args.dry_run)
+    if not result['success']:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
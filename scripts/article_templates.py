@@ -0,0 +1,456 @@
+#!/usr/bin/env python3
+"""
+記事テンプレートエンジン
+テンプレート文字列を1度だけ「静的チャンク + スロット」の描画プランへコンパイルし、
+描画は単一の join で行う
+
+seo_blog_system.py（4テンプレート + 共通セクション）と
+generate_article.py（簡易版4カテゴリ）の両方から共有して使用
+"""
+
+import hashlib
+from string import Formatter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+class CompiledTemplate:
+    """コンパイル済みテンプレート（str.format 互換の {slot} / {slot:spec} 記法）"""
+
+    def __init__(self, source: str, name: str = ""):
+        self.name = name
+        self.source = source
+        self.version = hashlib.sha1(source.encode('utf-8')).hexdigest()[:12]  # テンプレート本文が変われば変わる
+        self._chunks, self._slots = self._compile(source)
+        self.slot_names = tuple(dict.fromkeys(slot_name for _, slot_name, _ in self._slots))
+        self._render = self._build_renderer(self._chunks, self._slots)
+        self._item_affixes = self._build_item_affixes(self._chunks, self._slots)
+
+    @staticmethod
+    def _compile(source: str) -> Tuple[List[str], List[Tuple[int, str, str]]]:
+        """描画プラン生成: 静的チャンク列と (位置, スロット名, 書式) の一覧"""
+        chunks: List[str] = []
+        slots: List[Tuple[int, str, str]] = []
+
+        for literal, field_name, format_spec, conversion in Formatter().parse(source):
+            if literal:
+                # 連続する静的チャンクは1つに結合
+                if chunks and (not slots or slots[-1][0] != len(chunks) - 1):
+                    chunks[-1] += literal
+                else:
+                    chunks.append(literal)
+            if field_name is not None:
+                if not field_name or conversion:
+                    raise ValueError(f"未対応のスロット記法です: {{{field_name}}} ({source[:30]}...)")
+                slots.append((len(chunks), field_name, format_spec or ""))
+                chunks.append("")
+
+        return chunks, slots
+
+    @staticmethod
+    def _build_renderer(chunks: List[str], slots: List[Tuple[int, str, str]]) -> Callable[[Dict[str, Any]], str]:
+        """描画プランを「タプル1つを join する関数」へ変換"""
+        slot_at = {position: (slot_name, format_spec) for position, slot_name, format_spec in slots}
+        parts = []
+        for position, chunk in enumerate(chunks):
+            if position in slot_at:
+                slot_name, format_spec = slot_at[position]
+                if format_spec:
+                    parts.append(f"_format(values[{slot_name!r}], {format_spec!r})")
+                else:
+                    parts.append(f"_str(values[{slot_name!r}])")
+            else:
+                parts.append(repr(chunk))
+
+        namespace = {'_str': str, '_format': format}
+        exec(f"def render(values):\n    return ''.join(({', '.join(parts)},))", namespace)
+        return namespace['render']
+
+    @staticmethod
+    def _build_item_affixes(chunks: List[str], slots: List[Tuple[int, str, str]]) -> Optional[Tuple[str, str]]:
+        """単一スロット（書式なし）テンプレートの前後チャンク（箇条書きの高速描画用）"""
+        if len(slots) != 1 or slots[0][2]:
+            return None
+        position = slots[0][0]
+        return "".join(chunks[:position]), "".join(chunks[position + 1:])
+
+    def render(self, **values: Any) -> str:
+        """スロットに値を埋め込んで描画"""
+        return self._render(values)
+
+    def render_each(self, items: Iterable[Any], slot_name: str = "item") -> str:
+        """リスト要素ごとに描画して連結（箇条書き用）"""
+        if self._item_affixes is not None:
+            prefix, suffix = self._item_affixes
+            items = [str(item) for item in items]
+            if not items:
+                return ""
+            return prefix + (suffix + prefix).join(items) + suffix
+        return "".join([self._render({slot_name: item}) for item in items])
+
+# ---------------------------------------------------------------------------
+# 共通パーツ
+# ---------------------------------------------------------------------------
+
+BULLET = CompiledTemplate("- {item}\n", "bullet")
+QUOTED_BULLET = CompiledTemplate("- 「{item}」\n", "quoted_bullet")
+LANDMARK_BULLET = CompiledTemplate("- {item}周辺\n", "landmark_bullet")
+
+# ---------------------------------------------------------------------------
+# SEOBlogSystem 用テンプレート
+# ---------------------------------------------------------------------------
+
+ARTICLE_HEADER = CompiledTemplate(
+    "# {title}\n\n"
+    "## {area}にお住まいの{condition}でお困りの方へ\n\n"
+    "**{COMPANY_NAME}**は{LICENSE}です。\n\n"
+    "> 💡 **{area}で医療保険適用の訪問マッサージをお探しの方へ**  \n"
+    "> [医療保険適用実施中]({MAIN_SITE_URL}) | 📞 {CLINIC_PHONE}\n\n",
+    "article_header"
+)
+
+CASE_STUDY = CompiledTemplate(
+    "## {condition}について\n\n"
+    "{description}\n\n"
+    "### {condition}の主な症状\n"
+    "{symptoms}"
+    "\n### 日常生活でのお困りごと\n"
+    "{daily_concerns}"
+    "\n### ケース事例：Aさん（70代・{area}在住）の改善体験\n\n"
+    "**初回訪問時の状態**\n"
+    "- {condition}による症状で日常生活に支障\n"
+    "- 外出が困難になり閉じこもりがち\n"
+    "- 家族の介護負担が増加\n\n"
+    "**施術内容とアプローチ**\n"
+    "- 症状に応じた専門的な手技療法\n"
+    "- 機能改善のための運動療法\n"
+    "- 日常生活動作の指導・アドバイス\n"
+    "- 週2回・30分の定期訪問\n\n"
+    "**3ヶ月後の改善状況**\n"
+    "- 症状の緩和により日常動作が改善\n"
+    "- 外出への意欲が回復\n"
+    "- 家族の介護負担軽減\n"
+    "- QOL（生活の質）の向上\n\n"
+    "**ご家族の声**\n"
+    "「医療保険が適用されるので経済的負担が少なく、継続しやすいのが助かります。本人の表情も明るくなり、家族としても安心できます」\n\n",
+    "case_study"
+)
+
+SYMPTOM_GUIDE = CompiledTemplate(
+    "## {condition}の主な症状について\n\n"
+    "{description}\n\n"
+    "### 具体的な症状\n"
+    "{symptoms}"
+    "\n### 日常生活でのお困りごと\n"
+    "{daily_concerns}"
+    "\n## {area}での訪問マッサージのメリット\n\n"
+    "{landmarks_section}"
+    "### 訪問マッサージが選ばれる理由\n"
+    "1. **通院の負担がない**: 移動が困難な方でも自宅で専門的な施術を受けられます\n"
+    "2. **医療保険適用可能**: 医師の同意書により医療保険が適用され、経済的負担を軽減\n"
+    "3. **個別対応**: 一人ひとりの症状に合わせたオーダーメイドの施術プラン\n"
+    "4. **家族への指導**: ご家族へのケア方法指導により、日常生活をサポート\n\n"
+    "## 訪問マッサージの流れ\n\n"
+    "### 1. 初回カウンセリング（無料）\n"
+    "- 症状の詳しい確認\n"
+    "- 施術計画のご説明\n"
+    "- 医療保険適用の手続きサポート\n\n"
+    "### 2. 医師の同意書取得\n"
+    "- かかりつけ医への同意書作成依頼をサポート\n"
+    "- 必要書類の準備をお手伝い\n\n"
+    "### 3. 定期的な訪問施術\n"
+    "- 週1-3回の定期訪問（症状により調整）\n"
+    "- 1回30分程度の施術\n"
+    "- 症状の変化に応じた施術内容の調整\n\n"
+    "### 4. 経過観察と報告\n"
+    "- 月1回の経過報告書作成\n"
+    "- 主治医との連携\n"
+    "- ご家族への状況説明\n\n"
+    "## よくある誤解と真実\n\n"
+    "### ❌ 誤解：訪問マッサージは高額\n"
+    "✅ **真実**: 医療保険適用により、1回あたり数百円程度の自己負担\n\n"
+    "### ❌ 誤解：効果が期待できない\n"
+    "✅ **真実**: 国家資格を持つ専門家による医学的根拠に基づいた施術\n\n"
+    "### ❌ 誤解：手続きが複雑\n"
+    "✅ **真実**: 当院が手続きを全面サポート、ご家族の負担を最小限に\n\n",
+    "symptom_guide"
+)
+
+# 既存記事との互換のため、末尾行の {area} は置換せずそのまま出力する
+SYMPTOM_GUIDE_LANDMARKS = CompiledTemplate(
+    "### {area}の主要エリア\n"
+    "{landmarks}"
+    "\n上記エリアを含む{{area}}全域に対応しております。\n\n",
+    "symptom_guide_landmarks"
+)
+
+# Q&A項目（質問, 回答）: {condition} / {area} をスロットとして含む
+_QA_ITEMS = (
+    (
+        "{condition}の訪問マッサージは保険適用されますか？",
+        "はい、医師の同意書があれば医療保険が適用されます。{condition}も医療保険の対象として認められており、{area}エリアでも同様に保険適用のマッサージが受けられます。"
+    ),
+    (
+        "どのくらいの頻度で施術を受けるべきですか？",
+        "症状の程度により異なりますが、一般的に週1-3回の施術が効果的です。症状の状態や機能の程度を評価し、個別に頻度を調整いたします。"
+    ),
+    (
+        "{area}まで本当に来てもらえますか？",
+        "はい、{area}は当院の主要対応エリアです。移動が困難な方も多いため、交通費負担なしで専門スタッフがお伺いします。"
+    ),
+    (
+        "1回の施術時間はどのくらいですか？",
+        "1回あたり30分程度の施術を行います。お身体の状態や症状に応じて、必要に応じて時間を調整いたします。初回は症状の詳しい聞き取りも含めて少し長めになる場合があります。"
+    ),
+    (
+        "施術前に何か準備するものはありますか？",
+        "特別な準備は必要ありません。動きやすい服装でお過ごしいただければ大丈夫です。医師からの同意書は当院でサポートいたしますので、まずはお気軽にご相談ください。"
+    ),
+    (
+        "どのくらいで効果を実感できますか？",
+        "個人差がありますが、多くの方が3-4回の施術で何らかの変化を実感されています。症状の程度や期間により異なりますが、継続的な施術により徐々に改善が期待できます。"
+    ),
+    (
+        "家族が同席する必要はありますか？",
+        "必須ではありませんが、ご家族の同席は歓迎いたします。施術内容の説明や日常生活でのアドバイスをお伝えする際に、ご家族にも聞いていただくと効果的です。"
+    ),
+    (
+        "他の治療や薬との併用はできますか？",
+        "はい、基本的に他の治療との併用に問題はありません。現在受けている治療内容をお聞かせいただき、主治医とも連携しながら最適な施術プランをご提案いたします。"
+    ),
+)
+
+QA = CompiledTemplate(
+    "## {condition}に関するよくある質問\n\n"
+    + "".join(f"### Q{number}. {question}\nA. {answer}\n\n" for number, (question, answer) in enumerate(_QA_ITEMS, 1)),
+    "qa"
+)
+
+PREVENTION = CompiledTemplate(
+    "## {condition}の予防・セルフケア方法\n\n"
+    "{area}在住の方向けの実践的なケア方法をご紹介します。\n\n"
+    "### 日常でできるセルフケア\n"
+    "- 適度な運動習慣の維持\n"
+    "- 正しい姿勢の意識\n"
+    "- 栄養バランスの取れた食事\n"
+    "- 十分な休息と睡眠\n"
+    "- ストレス管理\n\n",
+    "prevention"
+)
+
+AREA_INFO = CompiledTemplate(
+    "## {area}の地域特性と訪問マッサージの必要性\n\n"
+    "### {area}の基本データ\n"
+    "- **人口**: 約{population:,}人\n"
+    "- **世帯数**: 約{households:,}世帯\n"
+    "- **面積**: {area_size}km²\n"
+    "- **高齢者人口**: 約{elderly:,}人\n\n"
+    "### 地域の特徴\n"
+    "{features}"
+    "\n### 医療・介護施設\n"
+    "{medical_facilities}"
+    "\n### {area}での在宅ケアの重要性\n"
+    "- 高齢化による在宅ケア需要の増加\n"
+    "- 地域包括ケアシステムの構築\n"
+    "- {area}特有の地域課題への対応\n\n",
+    "area_info"
+)
+
+PRICING = CompiledTemplate(
+    "### 医療保険適用で安心の料金体系\n"
+    "- 1回30分の施術：450円（1割負担）\n"
+    "- 月1回コース：1800円（税込）\n"
+    "- 月2回コース：3600円（税込）\n"
+    "- 月3回コース：5400円（税込）\n\n",
+    "pricing"
+)
+
+CTA = CompiledTemplate(
+    "**今すぐ医療保険適用でお申し込みください**\n"
+    "📞 **[{CLINIC_PHONE}](tel:{CLINIC_PHONE})**\n"
+    "⏰ {BUSINESS_HOURS}\n\n"
+    "---\n"
+    "**運営**: {COMPANY_NAME} ({LICENSE})\n",
+    "cta"
+)
+
+# ---------------------------------------------------------------------------
+# generate_article.py（簡易版）用テンプレート: カテゴリ → (タイトル, 本文)
+# ---------------------------------------------------------------------------
+
+SIMPLE_ARTICLE_TEMPLATES: Dict[str, Tuple[CompiledTemplate, CompiledTemplate]] = {
+    'symptom_guide': (
+        CompiledTemplate("{condition}でお悩みの方へ｜{area}の訪問マッサージで症状緩和"),
+        CompiledTemplate("""# {title}
+
+## {area}にお住まいの{condition}でお困りの方へ
+
+{area}で{condition}の症状にお悩みの方へ、{COMPANY_NAME}の訪問医療マッサージがお役に立てるかもしれません。
+
+### {condition}の症状について
+
+{condition}は、日常生活に大きな影響を与える症状です。{area}の多くの方が、この症状でお困りです。
+
+- 日常生活での動作が困難になる
+- 痛みや不快感が継続する
+- 身体機能の低下が見られる
+
+### 訪問マッサージによるサポート
+
+{COMPANY_NAME}では、{area}全域で以下のサービスを提供しています：
+
+1. **個別対応のマッサージ施術**
+   - お一人おひとりの症状に合わせた施術
+   - 身体機能の維持・改善をサポート
+
+2. **ご自宅での施術**
+   - 通院の負担なし
+   - リラックスできる環境での施術
+
+3. **保険適用可能**
+   - 医療保険適用で経済的負担を軽減
+   - 医師の同意書があれば保険適用可能
+
+### {area}での訪問エリア
+
+{area}全域に訪問可能です。ご自宅や施設まで、経験豊富な施術師がお伺いします。
+
+### お問い合わせ
+
+**電話番号**: {CLINIC_PHONE}  
+**営業時間**: {BUSINESS_HOURS}
+
+{area}で{condition}の症状にお悩みの方は、お気軽にご相談ください。
+
+---
+
+*最終更新日: {today}*
+""", "simple_symptom_guide")
+    ),
+    'qa': (
+        CompiledTemplate("{condition}のよくある質問｜{area}の訪問マッサージ"),
+        CompiledTemplate("""# {title}
+
+## {area}の方から寄せられる{condition}に関するご質問
+
+### Q1. {condition}でも訪問マッサージを受けられますか？
+
+はい、{condition}の方も訪問マッサージを受けていただけます。{area}にお住まいの多くの方にご利用いただいています。
+
+### Q2. 保険は適用されますか？
+
+医師の同意書があれば、医療保険の適用が可能です。{area}の医療機関と連携してサポートいたします。
+
+### Q3. どのような施術を行いますか？
+
+{condition}の症状に応じて、以下の施術を組み合わせます：
+- マッサージによる血行促進
+- 関節可動域の維持・改善
+- 筋力維持のサポート
+
+### Q4. {area}のどこまで訪問可能ですか？
+
+{area}全域に訪問可能です。ご自宅はもちろん、施設への訪問も対応しています。
+
+### Q5. 料金はどのくらいかかりますか？
+
+保険適用の場合、1回あたりの自己負担は数百円程度です。詳細はお問い合わせください。
+
+### お問い合わせ
+
+**{COMPANY_NAME}**  
+電話: {CLINIC_PHONE}  
+営業時間: {BUSINESS_HOURS}
+
+---
+
+*最終更新日: {today}*
+""", "simple_qa")
+    ),
+    'case_study': (
+        CompiledTemplate("{condition}の改善事例｜{area}の訪問マッサージ"),
+        CompiledTemplate("""# {title}
+
+## {area}での{condition}改善サポート事例
+
+### 事例のご紹介
+
+{area}にお住まいの方で、{condition}の症状でお困りの方への訪問マッサージサポート事例をご紹介します。
+
+### ケース1: 70代の方の例
+
+**状況**: {condition}により日常生活に支障
+**サポート内容**: 週2回の訪問マッサージ
+**経過**: 3ヶ月で身体機能の維持・改善を実感
+
+### ケース2: 80代の方の例
+
+**状況**: {condition}による身体の不調
+**サポート内容**: 週3回の訪問マッサージ
+**経過**: 継続的なケアで生活の質が向上
+
+### {area}での訪問マッサージの特徴
+
+- ご自宅での施術で通院負担なし
+- 個別対応で最適なケア
+- 保険適用で経済的負担を軽減
+
+### ご相談・お問い合わせ
+
+{area}で{condition}にお悩みの方は、ぜひご相談ください。
+
+**電話**: {CLINIC_PHONE}  
+**営業時間**: {BUSINESS_HOURS}
+
+---
+
+*最終更新日: {today}*
+""", "simple_case_study")
+    ),
+    'prevention': (
+        CompiledTemplate("{condition}の予防とケア｜{area}の訪問マッサージ"),
+        CompiledTemplate("""# {title}
+
+## {area}で{condition}の予防・ケアをサポート
+
+### {condition}の予防について
+
+{condition}は適切なケアで進行を遅らせることが可能です。{area}の皆様の健康維持をサポートします。
+
+### 予防のポイント
+
+1. **定期的な身体のケア**
+   - マッサージによる血行促進
+   - 関節可動域の維持
+
+2. **早期対応の重要性**
+   - 症状が軽いうちからのケア
+   - 継続的なサポート
+
+3. **生活習慣の改善**
+   - 適度な運動のサポート
+   - 身体機能の維持
+
+### {area}での訪問マッサージサービス
+
+{COMPANY_NAME}では、{area}全域で予防ケアをサポートしています。
+
+- 定期的な訪問でケア
+- 保険適用可能
+- 経験豊富な施術師が対応
+
+### お問い合わせ
+
+**電話**: {CLINIC_PHONE}  
+**営業時間**: {BUSINESS_HOURS}
+
+{area}で{condition}の予防・ケアをお考えの方は、お気軽にご相談ください。
+
+---
+
+*最終更新日: {today}*
+""", "simple_prevention")
+    ),
+}
+
+def get_simple_article_template(category: str) -> Tuple[CompiledTemplate, CompiledTemplate]:
+    """簡易版カテゴリのテンプレート取得（未知カテゴリは prevention 扱い）"""
+    return SIMPLE_ARTICLE_TEMPLATES.get(category, SIMPLE_ARTICLE_TEMPLATES['prevention'])
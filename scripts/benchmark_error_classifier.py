@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+ビルドログ エラー分類ベンチマーク
+合成ビルドログ（既定 10MB、固定シード）で共有分類器（error_classifier.py）と
+従来のパターン別ループ（SimpleErrorAnalyzer / ErrorAnalyzer）の処理時間を比較し、検出結果の一致も検証する
+
+- legacy_presence: 従来実装（有無のみ・位置なし）
+- legacy_spans: 従来方式で位置・行番号まで求める場合（パターンごとにログ全体を走査）
+- classifier: 1回走査で全シグネチャの位置・行番号を取得
+
+使用方法: python benchmark_error_classifier.py [--size-mb 10] [--rounds 5] [--seed 42]
+"""
+
+import re
+import sys
+import time
+import random
+import argparse
+import statistics
+from typing import Any, Callable, Dict, List, Set
+
+from error_classifier import ErrorClassifier, SIMPLE_ERROR_PATTERNS, RUBY_34_GEM_FIXES, JEKYLL_ISSUES, BUNDLER_PATTERNS
+
+# 通常のビルド出力行（大半はエラーを含まない）
+NOISE_LINES = [
+    "  Generating... ",
+    "       Jekyll Feed: Generating feed for posts",
+    "                    done in 12.345 seconds.",
+    "Installing jekyll-sitemap 1.4.0",
+    "Fetching gem metadata from https://rubygems.org/.........",
+    "Using bundler 2.5.9",
+    "  Conversion error: Jekyll::Converters::Markdown encountered an error while converting",
+    "11:42:01 AM: Started saving build plugins",
+    "11:42:03 AM: Section completed: building",
+    "Loading Ruby version 3.4.1",
+    "      Remote Theme: Using theme pages-themes/minimal",
+    "Deprecation: You appear to have pagination turned on, but you haven't included the `jekyll-paginate` gem.",
+]
+
+# エラー行（大文字小文字違い・部分一致を含む）
+ERROR_LINES = [
+    "/opt/buildhome/.rbenv/versions/3.4.1/lib/ruby/3.4.0/bundled_gems.rb:82:in `require': cannot load such file -- csv (LoadError)",
+    "cannot load such file -- ostruct (LoadError)",
+    "Cannot Load Such File -- fiddle",
+    "bundler: failed to load command: jekyll (/opt/buildhome/.rbenv/versions/3.4.1/bin/jekyll)",
+    "Bundler::GemNotFound: Could not find gem 'jekyll-seo-tag' in locally installed gems.",
+    "  Liquid Exception: Liquid syntax error (line 12): Unknown tag 'endfor'",
+    "Error: YAML Exception reading _posts/2025-08-14-test.md: (<unknown>): did not find expected key",
+    "Build warning: Layout 'post' does not exist.",
+    "Error: Layout does not exist: post-custom",
+    "Error: Build script returned non-zero exit code: 2",
+    "Failing build: Failed to build site",
+    "Command failed with exit code 1: jekyll build",
+]
+
+class LegacyErrorAnalyzer:
+    """比較用: 分類器導入前の SimpleErrorAnalyzer / ErrorAnalyzer の解析処理（当時の実装をそのまま保持）"""
+
+    def __init__(self):
+        self.common_error_patterns = SIMPLE_ERROR_PATTERNS
+        self.common_fixes = RUBY_34_GEM_FIXES
+
+    def analyze_error(self, error_message: str) -> List[str]:
+        """SimpleErrorAnalyzer.analyze_error（検出パターンのみ返す）"""
+        detected = []
+        error_lower = error_message.lower()
+        for category, patterns in self.common_error_patterns.items():
+            for pattern in patterns:
+                if pattern.lower() in error_lower:
+                    detected.append(f"{category}:{pattern}")
+        return detected
+
+    def analyze_ruby_gem_error(self, error_log: str) -> List[str]:
+        """ErrorAnalyzer.analyze_ruby_gem_error"""
+        return [
+            f"missing_gem:cannot load such file -- {gem_name}" for gem_name in self.common_fixes
+            if f"cannot load such file -- {gem_name}" in error_log
+        ]
+
+    def analyze_jekyll_error(self, error_log: str) -> List[str]:
+        """ErrorAnalyzer.analyze_jekyll_error"""
+        return [f"jekyll_issue:{pattern}" for pattern in JEKYLL_ISSUES if pattern in error_log]
+
+    def analyze_bundler_error(self, error_log: str) -> List[str]:
+        """EnhancedNetlifyMonitor.analyze_ruby_errors_from_log の Bundler パターン"""
+        return [f"bundler:{pattern}" for pattern in BUNDLER_PATTERNS if pattern in error_log]
+
+    def presence(self, log_text: str) -> Set[str]:
+        """従来の解析をすべて実行した検出シグネチャ"""
+        return set(
+            self.analyze_error(log_text) + self.analyze_ruby_gem_error(log_text)
+            + self.analyze_jekyll_error(log_text) + self.analyze_bundler_error(log_text)
+        )
+
+    def spans(self, log_text: str) -> List[Dict[str, Any]]:
+        """従来方式で位置・行番号まで求める場合（パターンごとに全体走査 + 行番号計算）"""
+        lowered = log_text.lower()
+        targets = [(f"{c}:{p}", re.escape(p.lower()), lowered) for c, ps in self.common_error_patterns.items() for p in ps]
+        targets += [(f"missing_gem:cannot load such file -- {g}", re.escape(f"cannot load such file -- {g}"), log_text)
+                    for g in self.common_fixes]
+        targets += [(f"jekyll_issue:{p}", re.escape(p), log_text) for p in JEKYLL_ISSUES]
+        targets += [(f"bundler:{p}", re.escape(p), log_text) for p in BUNDLER_PATTERNS]
+
+        matches = []
+        for signature_id, pattern, text in targets:
+            line_number, cursor = 1, 0
+            for match in re.finditer(pattern, text):
+                line_number += text.count('\n', cursor, match.start())
+                cursor = match.start()
+                matches.append({'id': signature_id, 'start': match.start(), 'line': line_number})
+        return matches
+
+def build_synthetic_log(size_mb: float, seed: int) -> str:
+    """合成ビルドログ生成（約 1/2000 行がエラー行）"""
+    rng = random.Random(seed)
+    target = int(size_mb * 1024 * 1024)
+    lines, size = [], 0
+    while size < target:
+        line = rng.choice(ERROR_LINES) if rng.random() < 0.0005 else rng.choice(NOISE_LINES)
+        lines.append(line)
+        size += len(line) + 1
+    return "\n".join(lines) + "\n"
+
+def _time(func: Callable[[str], Any], log_text: str, rounds: int) -> List[float]:
+    """rounds 回計測（ms）"""
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        func(log_text)
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+def run_benchmark(size_mb: float, rounds: int, seed: int) -> bool:
+    """ベンチマーク実行（検出結果・位置の不一致があれば False）"""
+    log_text = build_synthetic_log(size_mb, seed)
+    legacy = LegacyErrorAnalyzer()
+
+    started = time.perf_counter()
+    classifier = ErrorClassifier()
+    compile_ms = (time.perf_counter() - started) * 1000
+
+    # 検出結果一致確認（合成ログ + 各エラー行単体）
+    mismatches = []
+    for label, text in [('synthetic', log_text)] + [(line, line) for line in ERROR_LINES]:
+        result = classifier.classify(text)
+        if set(result['signatures']) != legacy.presence(text):
+            mismatches.append(label)
+        elif sorted((m['id'], m['start'], m['line']) for m in result['matches']) != \
+                sorted((m['id'], m['start'], m['line']) for m in legacy.spans(text)):
+            mismatches.append(f"{label} (位置)")
+
+    results = {
+        'legacy_presence': _time(legacy.presence, log_text, rounds),
+        'legacy_spans': _time(legacy.spans, log_text, rounds),
+        'classifier': _time(classifier.classify, log_text, rounds),
+    }
+
+    result = classifier.classify(log_text)
+    print(f"📏 エラー分類ベンチマーク: {len(log_text) / 1024 / 1024:.1f}MB ({log_text.count(chr(10))}行) × {rounds}回")
+    print(f"   シグネチャ {len(classifier.signatures)}件 / コンパイル {compile_ms:.2f}ms / 一致 {len(result['matches'])}件")
+    print(f"{'方式':<18}{'中央値(ms)':>12}{'最小(ms)':>12}{'MB/s':>10}")
+    for name, samples in results.items():
+        median = statistics.median(samples)
+        print(f"{name:<18}{median:>12.1f}{min(samples):>12.1f}{size_mb / (median / 1000):>10.1f}")
+
+    if mismatches:
+        print(f"❌ 検出結果不一致: {len(mismatches)}件 (例: {mismatches[0]!r})")
+        return False
+
+    print(f"✅ 検出結果一致: 合成ログおよびエラー行{len(ERROR_LINES)}件で従来方式と同一（位置・行番号を含む）")
+    return True
+
+def main():
+    """メイン実行関数"""
+    parser = argparse.ArgumentParser(description='ビルドログ エラー分類ベンチマーク')
+    parser.add_argument('--size-mb', type=float, default=10, help='合成ログサイズ(MB)')
+    parser.add_argument('--rounds', type=int, default=5, help='計測回数')
+    parser.add_argument('--seed', type=int, default=42, help='乱数シード')
+    args = parser.parse_args()
+
+    if not run_benchmark(args.size_mb, args.rounds, args.seed):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
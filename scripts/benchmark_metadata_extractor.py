@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+記事メタデータ抽出ベンチマーク
+1回走査のキーワードオートマトン（metadata_extractor.py）と従来の if/in 連鎖方式の
+1記事あたり抽出時間を _posts 全記事で比較し、抽出結果の一致も検証する
+（速度比は 従来方式の時間 / 1回走査の時間。1.00x 未満は1回走査の方が遅い）
+
+使用方法: python benchmark_metadata_extractor.py [--rounds 20] [--posts-dir ../_posts]
+"""
+
+import re
+import sys
+import time
+import argparse
+import statistics
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from metadata_extractor import ArticleMetadataExtractor
+
+class LegacyMetadataAnalyzer:
+    """比較用: オートマトン導入前の SafeJekyllConverter の抽出処理（当時の実装をそのまま保持）"""
+
+    def _analyze_article(self, content: str) -> Dict[str, Any]:
+        """記事内容分析"""
+        metadata = {}
+
+        # タイトル抽出
+        title_match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
+        metadata['title'] = title_match.group(1).strip() if title_match else "タイトル未検出"
+
+        # カテゴリ検出
+        metadata['category'] = self._detect_category(content)
+
+        # 地域・症状抽出
+        metadata['area'] = self._extract_area(content)
+        metadata['condition'] = self._extract_condition(content)
+
+        return metadata
+
+    def _detect_category(self, content: str) -> str:
+        """カテゴリ自動検出"""
+        if "症状解説" in content or "でお悩みの方へ" in content:
+            return "symptom_guide"
+        elif "セルフケア" in content or "予防" in content:
+            return "prevention"
+        elif "よくある質問" in content or "FAQ" in content:
+            return "qa"
+        elif "ケア事例" in content or "事例" in content:
+            return "case_study"
+        elif "競合分析" in content or "選び方" in content:
+            return "competitive_analysis"
+        elif "体験談" in content or "あなたへ" in content:
+            return "experience_story"
+        else:
+            return "symptom_guide"
+
+    def _extract_area(self, content: str) -> Optional[str]:
+        """地域名抽出"""
+        osaka_areas = [
+            "住吉区", "北区", "天王寺区", "浪速区", "中央区", "都島区", "此花区",
+            "旭区", "城東区", "生野区", "鶴見区", "住之江区", "大正区", "東成区",
+            "西成区", "港区", "西区", "福島区", "淀川区", "東淀川区", "西淀川区",
+            "阿倍野区", "東住吉区", "平野区"
+        ]
+
+        for area in osaka_areas:
+            if area in content:
+                return area
+        return None
+
+    def _extract_condition(self, content: str) -> Optional[str]:
+        """症状名抽出"""
+        conditions = [
+            "パーキンソン病", "脳血管障害", "関節拘縮", "筋萎縮", "骨粗鬆症",
+            "椎間板ヘルニア", "脊柱管狭窄症", "坐骨神経痛", "変形性関節症",
+            "リウマチ", "五十肩", "頸椎症", "腰痛症", "脊髄損傷", "廃用症候群",
+            "その他"
+        ]
+
+        for condition in conditions:
+            if condition in content:
+                return condition
+        return None
+
+# 重なり・内包一致の検証用（_posts に出現しにくい組み合わせ）
+EDGE_CASES = [
+    "# 見出し\nセルフケア事例の紹介",
+    "骨粗鬆症状解説と東住吉区の対応",
+    "西淀川区・東淀川区にお住まいの方",
+    "#\n\n改行を挟んだ見出し\n頸椎症状解説",
+    "キーワードなし",
+    "",
+]
+
+def _time_extract(extract: Callable[[str], Dict[str, Any]], contents: List[str], rounds: int) -> List[float]:
+    """全記事の抽出を rounds 回計測し、1記事あたりの時間(μs)を返す"""
+    samples = []
+    for _ in range(rounds):
+        for content in contents:
+            started = time.perf_counter()
+            extract(content)
+            samples.append((time.perf_counter() - started) * 1_000_000)
+    return samples
+
+def _summarize(samples: List[float]) -> Dict[str, float]:
+    """計測結果の要約"""
+    ordered = sorted(samples)
+    return {
+        'mean': statistics.fmean(ordered),
+        'p50': ordered[len(ordered) // 2],
+        'p99': ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))],
+    }
+
+def run_benchmark(posts_dir: Path, rounds: int) -> bool:
+    """ベンチマーク実行（抽出結果の不一致があれば False）"""
+    post_paths = sorted(posts_dir.glob("*.md"))
+    if not post_paths:
+        print(f"❌ 記事が見つかりません: {posts_dir}")
+        return False
+
+    contents = [path.read_text(encoding='utf-8') for path in post_paths]
+    legacy = LegacyMetadataAnalyzer()
+    extractor = ArticleMetadataExtractor()
+
+    # 抽出結果一致確認
+    mismatches = [
+        label for label, content in zip([p.name for p in post_paths] + EDGE_CASES, contents + EDGE_CASES)
+        if extractor.extract(content) != legacy._analyze_article(content)
+    ]
+
+    # ウォームアップ後に計測
+    _time_extract(legacy._analyze_article, contents, 1)
+    _time_extract(extractor.extract, contents, 1)
+    results = {
+        'legacy_if_chain': _summarize(_time_extract(legacy._analyze_article, contents, rounds)),
+        'single_pass': _summarize(_time_extract(extractor.extract, contents, rounds)),
+    }
+
+    total_kb = sum(len(content.encode('utf-8')) for content in contents) / 1024
+    print(f"📏 メタデータ抽出ベンチマーク: {len(contents)}記事 ({total_kb:.0f}KB) × {rounds}回")
+    print(f"{'方式':<20}{'平均(μs)':>12}{'p50(μs)':>12}{'p99(μs)':>12}")
+    for name, summary in results.items():
+        print(f"{name:<20}{summary['mean']:>12.1f}{summary['p50']:>12.1f}{summary['p99']:>12.1f}")
+
+    # 1.00x 未満は1回走査の方が遅い
+    for metric in ('mean', 'p99'):
+        speedup = results['legacy_if_chain'][metric] / results['single_pass'][metric]
+        print(f"{'⚡' if speedup >= 1 else '🐢'} 速度比({metric}): {speedup:.2f}x")
+
+    if mismatches:
+        print(f"❌ 抽出結果不一致: {len(mismatches)}件 (例: {mismatches[0]!r})")
+        return False
+
+    print(f"✅ 抽出結果一致: 全記事および境界ケース{len(EDGE_CASES)}件で従来方式と同一")
+    return True
+
+def main():
+    """メイン実行関数"""
+    parser = argparse.ArgumentParser(description='記事メタデータ抽出ベンチマーク')
+    parser.add_argument('--rounds', type=int, default=20, help='計測回数')
+    parser.add_argument('--posts-dir', default=str(Path(__file__).resolve().parent.parent / "_posts"),
+                        help='対象記事ディレクトリ')
+    args = parser.parse_args()
+
+    if not run_benchmark(Path(args.posts_dir), args.rounds):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
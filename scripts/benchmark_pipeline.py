@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+記事生成・変換パイプライン ベンチマーク
+以下を計測し、スループット（件/秒）・p50/p99 レイテンシ・ピークRSS をベースラインと比較する
+
+- generate_article:<テンプレート>  SEOBlogSystem.generate_article（標準出力は破棄）
+- expand_condition_details         MedicalDataExpander.expand_condition_details（症状ごと）
+- analyze_article                  SafeJekyllConverter._analyze_article（既存 _posts 全件）
+- matrix                           SEOBlogSystem.generate_matrix（生成ストアを使わず一時ディレクトリに全組み合わせを保存）
+
+ピークRSS を計測対象ごとに分けるため、各計測は別プロセス（spawn）で実行する。
+ベースライン（benchmark_baseline.json）より threshold 以上悪化した指標があれば終了コード 1
+
+使用方法: python benchmark_pipeline.py [--rounds 10] [--only matrix,analyze_article]
+                                       [--threshold 0.3] [--update-baseline] [--json report.json]
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import resource
+import tempfile
+import contextlib
+import multiprocessing
+from pathlib import Path
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Any, Optional
+
+from benchmark_templates import _summarize
+from seo_blog_system import SEOBlogSystem, MATRIX_CONDITIONS, MATRIX_AREAS, MATRIX_TEMPLATES
+
+BASELINE_PATH = Path(__file__).parent / "benchmark_baseline.json"
+DEFAULT_THRESHOLD = 0.3
+DEFAULT_ROUNDS = 10
+EXPAND_REPEAT = 50  # 1回あたりが数μsのため、1ラウンドで各症状をこの回数ずつ計測
+
+# 比較する指標: (大きいほど良いか, 閾値の倍率, マシン速度で正規化するか)。p99 は揺れが大きいため閾値を2倍で判定
+METRICS = {
+    'throughput': (True, 1.0, True),
+    'p50_ms': (False, 1.0, True),
+    'p99_ms': (False, 2.0, True),
+    'peak_rss_mb': (False, 1.0, False),
+}
+
+def _get_project_root() -> Path:
+    project_root = os.environ.get('PROJECT_ROOT')
+    if project_root:
+        return Path(project_root)
+    return Path(__file__).parent.parent
+
+def _peak_rss_mb() -> float:
+    """このプロセスのピークRSS（Linux は KB、macOS は bytes 単位で返る）"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+def _calibrate(repeat: int = 5) -> float:
+    """マシン速度の基準値(ms): 固定の文字列整形・辞書操作ループの最短時間
+    （CPUクロックや共有ホストの負荷による揺れを、比較時にこの値で正規化して打ち消す）"""
+    def loop():
+        table = {}
+        for i in range(20000):
+            table[f"{i}:{i % 24}区"] = "- " + str(i) + "\n"
+        return "".join(table.values())
+    return min(_timed(loop) for _ in range(repeat))
+
+def _timed(func: Callable[[], Any]) -> float:
+    """1回の呼び出し時間(ms)"""
+    started = time.perf_counter()
+    func()
+    return (time.perf_counter() - started) * 1000
+
+# ---- 計測対象（子プロセスで実行） ----
+
+def _section_cache_extra(system: SEOBlogSystem) -> Dict[str, Any]:
+    """共通セクションキャッシュのヒット・ミス件数（全ラウンド累計）"""
+    stats = system.section_cache.stats()
+    return {'section_cache_hits': stats['hits'], 'section_cache_misses': stats['misses'],
+            'section_cache_hit_rate': stats['hit_rate']}
+
+def _bench_generate_article(template_type: str, rounds: int) -> Dict[str, Any]:
+    system = SEOBlogSystem()
+    combos = [(condition, area) for condition in MATRIX_CONDITIONS for area in MATRIX_AREAS]
+    round_samples = []
+    with open(os.devnull, 'w', encoding='utf-8') as devnull, contextlib.redirect_stdout(devnull):
+        system.generate_article(*combos[0], template_type)  # ウォームアップ
+        for _ in range(rounds):
+            round_samples.append([
+                _timed(lambda: system.generate_article(condition, area, template_type)) for condition, area in combos
+            ])
+    return {'items_per_round': len(combos), 'rounds': round_samples, 'extra': _section_cache_extra(system)}
+
+def _bench_expand_condition_details(rounds: int) -> Dict[str, Any]:
+    from medical_data_expander import MedicalDataExpander
+    expander = MedicalDataExpander()
+    round_samples = []
+    per_condition: Dict[str, List[float]] = {condition: [] for condition in MATRIX_CONDITIONS}
+    for _ in range(rounds):
+        samples = []
+        for condition in MATRIX_CONDITIONS:
+            for _ in range(EXPAND_REPEAT):
+                elapsed = _timed(lambda: expander.expand_condition_details(condition))
+                per_condition[condition].append(elapsed)
+                samples.append(elapsed)
+        round_samples.append(samples)
+    slowest = max(per_condition, key=lambda condition: _summarize(per_condition[condition])['p50'])
+    return {
+        'items_per_round': len(MATRIX_CONDITIONS) * EXPAND_REPEAT,
+        'rounds': round_samples,
+        'extra': {'slowest_condition': slowest,
+                  'slowest_p50_ms': round(_summarize(per_condition[slowest])['p50'], 4)}
+    }
+
+def _bench_analyze_article(rounds: int) -> Dict[str, Any]:
+    from safe_jekyll_converter import SafeJekyllConverter
+    converter = SafeJekyllConverter()
+    posts_dir = _get_project_root() / "_posts"
+    contents = [path.read_text(encoding='utf-8') for path in sorted(posts_dir.glob("*.md"))]
+    if not contents:
+        raise RuntimeError(f"記事がありません: {posts_dir}")
+    converter._analyze_article(contents[0])  # ウォームアップ
+    round_samples = [
+        [_timed(lambda: converter._analyze_article(content)) for content in contents] for _ in range(rounds)
+    ]
+    return {'items_per_round': len(contents), 'rounds': round_samples,
+            'extra': {'posts': len(contents), 'bytes': sum(len(c.encode('utf-8')) for c in contents)}}
+
+def _default_matrix_dir() -> Path:
+    """マトリクス出力先の親ディレクトリ（ディスク速度の揺れを計測に含めないよう tmpfs を優先）"""
+    shm = Path('/dev/shm')
+    if shm.is_dir() and os.access(shm, os.W_OK):
+        return shm
+    return _get_project_root() / ".cache"
+
+def _bench_matrix(rounds: int, parent_dir: str) -> Dict[str, Any]:
+    """マトリクス全件生成（1ラウンド = 1サンプル。スループットは記事数/秒）"""
+    system = SEOBlogSystem()
+    Path(parent_dir).mkdir(parents=True, exist_ok=True)
+    round_samples = []
+    for _ in range(rounds):
+        with tempfile.TemporaryDirectory(prefix="bench_matrix_", dir=parent_dir) as output_dir, \
+                contextlib.redirect_stdout(io.StringIO()):
+            round_samples.append([_timed(lambda: system.generate_matrix(output_dir=output_dir, use_store=False))])
+    return {'items_per_round': len(MATRIX_CONDITIONS) * len(MATRIX_AREAS) * len(MATRIX_TEMPLATES),
+            'rounds': round_samples, 'extra': _section_cache_extra(system)}
+
+def _workloads(rounds: int, matrix_dir: Optional[str] = None) -> Dict[str, tuple]:
+    """計測名 → (計測関数, 引数)（子プロセスへ渡すためモジュールレベル関数のみ）"""
+    workloads = {
+        f"generate_article:{template_type}": (_bench_generate_article, (template_type, rounds))
+        for template_type in MATRIX_TEMPLATES
+    }
+    workloads['expand_condition_details'] = (_bench_expand_condition_details, (rounds,))
+    workloads['analyze_article'] = (_bench_analyze_article, (rounds,))
+    workloads['matrix'] = (_bench_matrix, (rounds, matrix_dir or str(_default_matrix_dir())))
+    return workloads
+
+def _run_workload(func: Callable[..., Dict[str, Any]], args: tuple) -> Dict[str, Any]:
+    """子プロセス側: 計測して要約（サンプル全体は親に返さない）
+
+    共有ホストでは他プロセスの負荷で一時的に遅くなるため、timeit と同じく最速ラウンドを代表値にする。
+    スループットは最速ラウンド、p50/p99 は最速ラウンド内の分布
+    （1ラウンド1サンプルの matrix は全ラウンドの分布）"""
+    calibration = _calibrate()
+    started = time.perf_counter()
+    measured = func(*args)
+    wall = time.perf_counter() - started
+    calibration = min(calibration, _calibrate())
+
+    best = min(measured['rounds'], key=sum)
+    summary = _summarize(best if len(best) > 1 else [sample for samples in measured['rounds'] for sample in samples])
+    return {
+        'items': measured['items_per_round'] * len(measured['rounds']),
+        'throughput': round(measured['items_per_round'] / (sum(best) / 1000), 2),
+        'p50_ms': round(summary['p50'], 4),
+        'p99_ms': round(summary['p99'], 4),
+        'peak_rss_mb': round(_peak_rss_mb(), 1),
+        'wall_seconds': round(wall, 2),
+        'calibration_ms': round(calibration, 3),
+        'extra': measured.get('extra', {})
+    }
+
+# ---- 実行・比較 ----
+
+def run_benchmarks(names: List[str], rounds: int, matrix_dir: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """各計測を新しい spawn プロセスで順に実行（ピークRSSを計測ごとに分離）"""
+    workloads = _workloads(rounds, matrix_dir)
+    context = multiprocessing.get_context('spawn')
+    results = {}
+    for name in names:
+        func, args = workloads[name]
+        print(f"⏱️  {name} ...", flush=True)
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            results[name] = executor.submit(_run_workload, func, args).result()
+    return results
+
+def _speed_ratio(result: Dict[str, Any], base: Dict[str, Any]) -> float:
+    """今回の基準ループ時間 / ベースライン時の基準ループ時間（1より大きければ今回のマシンが遅い）"""
+    if result.get('calibration_ms') and base.get('calibration_ms'):
+        return result['calibration_ms'] / base['calibration_ms']
+    return 1.0
+
+def compare_with_baseline(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Any],
+                          threshold: float) -> List[Dict[str, Any]]:
+    """ベースラインから threshold（比率）以上悪化した指標の一覧
+    時間系の指標は基準ループの速度比（speed）で補正してから比較する"""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get('results', {}).get(name)
+        if not base:
+            continue
+        speed = _speed_ratio(result, base)
+        for metric, (higher_is_better, tolerance, normalize) in METRICS.items():
+            current, reference = result.get(metric), base.get(metric)
+            if not current or not reference:
+                continue
+            if normalize:
+                current = current * speed if higher_is_better else current / speed
+            change = (reference / current - 1) if higher_is_better else (current / reference - 1)
+            if change > threshold * tolerance:
+                regressions.append({'name': name, 'metric': metric, 'baseline': reference,
+                                    'current': round(current, 4), 'change': change})
+    return regressions
+
+def load_baseline(path: Path) -> Optional[Dict[str, Any]]:
+    if not path.exists():
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def save_baseline(path: Path, results: Dict[str, Dict[str, Any]], rounds: int):
+    """ベースライン保存（既存の他計測は残し、今回計測した分だけ更新）"""
+    baseline = load_baseline(path) or {'results': {}}
+    baseline.update({
+        'updated_at': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(terse=True),
+        'rounds': rounds,
+    })
+    baseline['results'].update({
+        name: {metric: result[metric] for metric in ('items', 'calibration_ms', *METRICS)} for name, result in results.items()
+    })
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(baseline, f, ensure_ascii=False, indent=2, sort_keys=True)
+        f.write("\n")
+    os.replace(tmp_path, path)
+
+def print_report(results: Dict[str, Dict[str, Any]], baseline: Optional[Dict[str, Any]]):
+    print(f"\n{'計測':<28}{'件/秒':>12}{'p50(ms)':>11}{'p99(ms)':>11}{'RSS(MB)':>10}{'基準比':>9}")
+    for name, result in results.items():
+        base = (baseline or {}).get('results', {}).get(name)
+        # 基準比: マシン速度で補正したスループットのベースライン比
+        ratio = (f"{result['throughput'] * _speed_ratio(result, base) / base['throughput']:.2f}x"
+                 if base and base.get('throughput') else "-")
+        print(f"{name:<28}{result['throughput']:>12.1f}{result['p50_ms']:>11.3f}{result['p99_ms']:>11.3f}"
+              f"{result['peak_rss_mb']:>10.1f}{ratio:>9}")
+        if result['extra']:
+            print(f"{'':<4}↳ " + ", ".join(f"{key}={value}" for key, value in result['extra'].items()))
+
+def main():
+    """メイン実行関数"""
+    parser = argparse.ArgumentParser(description='記事生成・変換パイプライン ベンチマーク')
+    parser.add_argument('--rounds', type=int, default=DEFAULT_ROUNDS, help='計測回数')
+    parser.add_argument('--only', help='対象計測（カンマ区切り。例: matrix,analyze_article）')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='回帰とみなす悪化率（0.3 = 30%%）')
+    parser.add_argument('--baseline', default=str(BASELINE_PATH), help='ベースラインファイル')
+    parser.add_argument('--confirm', type=int, default=2, help='回帰の疑いがある計測の再計測回数')
+    parser.add_argument('--update-baseline', action='store_true', help='今回の結果でベースラインを更新')
+    parser.add_argument('--matrix-dir', help='マトリクス出力先の親ディレクトリ（既定: /dev/shm、なければ .cache/）')
+    parser.add_argument('--json', help='結果をJSONで保存するパス')
+    args = parser.parse_args()
+
+    names = list(_workloads(args.rounds))
+    if args.only:
+        selected = [name.strip() for name in args.only.split(',') if name.strip()]
+        unknown = [name for name in selected if name not in names and not any(n.startswith(name + ':') for n in names)]
+        if unknown:
+            parser.error(f"不明な計測: {', '.join(unknown)}（{', '.join(names)}）")
+        names = [name for name in names if name in selected or name.split(':')[0] in selected]
+
+    baseline_path = Path(args.baseline)
+    baseline = load_baseline(baseline_path)
+    print(f"📏 パイプライン ベンチマーク: {len(names)}計測 × {args.rounds}回")
+    if baseline and baseline.get('rounds') != args.rounds:
+        print(f"⚠️  ベースラインの計測回数（{baseline.get('rounds')}）と異なります")
+
+    results = run_benchmarks(names, args.rounds, args.matrix_dir)
+    print_report(results, baseline)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+    if args.update_baseline:
+        save_baseline(baseline_path, results, args.rounds)
+        print(f"\n💾 ベースライン更新: {baseline_path}")
+        return
+
+    if baseline is None:
+        print(f"\n⚠️  ベースラインがありません（--update-baseline で作成）: {baseline_path}")
+        return
+
+    regressions = compare_with_baseline(results, baseline, args.threshold)
+    for attempt in range(args.confirm):
+        if not regressions:
+            break
+        # 一時的な負荷による誤検知を除くため、回帰した計測だけ再計測して良い方の結果で再判定
+        suspects = sorted({regression['name'] for regression in regressions})
+        print(f"\n🔁 回帰の疑い {len(suspects)}計測を再計測（{attempt + 1}/{args.confirm}）")
+        for name, result in run_benchmarks(suspects, args.rounds, args.matrix_dir).items():
+            base = baseline['results'][name]
+            if result['throughput'] * _speed_ratio(result, base) > results[name]['throughput'] * _speed_ratio(results[name], base):
+                results[name] = result
+        regressions = compare_with_baseline(results, baseline, args.threshold)
+
+    if regressions:
+        print(f"\n❌ 性能回帰: {len(regressions)}件（閾値 {args.threshold:.0%}）")
+        for regression in regressions:
+            print(f"  {regression['name']} {regression['metric']}: "
+                  f"{regression['baseline']} → {regression['current']} ({regression['change']:+.0%})")
+        sys.exit(1)
+
+    print(f"\n✅ 回帰なし（閾値 {args.threshold:.0%}）")
+
+if __name__ == "__main__":
+    main()
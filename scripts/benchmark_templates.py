@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+記事テンプレート描画ベンチマーク
+コンパイル済みテンプレート（article_templates.py）と従来の content += 連結方式の
+1記事あたり描画時間を比較し、出力の一致も検証する
+
+使用方法: python benchmark_templates.py [--rounds 5] [--areas 北区,西区]
+"""
+
+import sys
+import time
+import argparse
+import statistics
+from typing import Dict, List
+
+from seo_blog_system import (
+    SEOBlogSystem, MATRIX_CONDITIONS, MATRIX_AREAS, MATRIX_TEMPLATES, _split_list
+)
+
+class LegacyConcatSEOBlogSystem(SEOBlogSystem):
+    """比較用: テンプレートエンジン導入前の content += 連結方式（当時の実装をそのまま保持）"""
+    
+    def _generate_content(self, condition, area, template_type, title):
+        """高品質コンテンツ生成"""
+        
+        # 基本構造
+        content = f"# {title}\n\n"
+        content += f"## {area}にお住まいの{condition}でお困りの方へ\n\n"
+        content += f"**{self.env_vars['COMPANY_NAME']}**は{self.env_vars['LICENSE']}です。\n\n"
+        content += f"> 💡 **{area}で医療保険適用の訪問マッサージをお探しの方へ**  \n"
+        content += f"> [医療保険適用実施中]({self.env_vars['MAIN_SITE_URL']}) | 📞 {self.env_vars['CLINIC_PHONE']}\n\n"
+        
+        # テンプレート別コンテンツ
+        if template_type == 'case_study':
+            content += self._generate_case_study_content(condition, area)
+        elif template_type == 'symptom_guide':
+            content += self._generate_symptom_guide_content(condition, area)
+        elif template_type == 'qa':
+            content += self._generate_qa_content(condition, area)
+        elif template_type == 'prevention':
+            content += self._generate_prevention_content(condition, area)
+        
+        # 共通セクション
+        content += self._generate_area_info(area)
+        content += self._generate_pricing_info()
+        content += self._generate_cta()
+        
+        return content
+    
+    def _generate_case_study_content(self, condition, area):
+        """ケース事例コンテンツ生成"""
+        content = f"## {condition}について\n\n"
+        
+        # 症状説明を追加
+        condition_info = self._get_condition_info(condition)
+        content += f"{condition_info['description']}\n\n"
+        
+        content += f"### {condition}の主な症状\n"
+        for symptom in condition_info['symptoms']:
+            content += f"- {symptom}\n"
+        
+        content += "\n### 日常生活でのお困りごと\n"
+        for concern in condition_info['daily_concerns']:
+            content += f"- 「{concern}」\n"
+        
+        content += f"\n### ケース事例：Aさん（70代・{area}在住）の改善体験\n\n"
+        content += "**初回訪問時の状態**\n"
+        content += f"- {condition}による症状で日常生活に支障\n"
+        content += "- 外出が困難になり閉じこもりがち\n"
+        content += "- 家族の介護負担が増加\n\n"
+        
+        content += "**施術内容とアプローチ**\n"
+        content += "- 症状に応じた専門的な手技療法\n"
+        content += "- 機能改善のための運動療法\n"
+        content += "- 日常生活動作の指導・アドバイス\n"
+        content += "- 週2回・30分の定期訪問\n\n"
+        
+        content += "**3ヶ月後の改善状況**\n"
+        content += "- 症状の緩和により日常動作が改善\n"
+        content += "- 外出への意欲が回復\n"
+        content += "- 家族の介護負担軽減\n"
+        content += "- QOL（生活の質）の向上\n\n"
+        
+        content += "**ご家族の声**\n"
+        content += "「医療保険が適用されるので経済的負担が少なく、継続しやすいのが助かります。本人の表情も明るくなり、家族としても安心できます」\n\n"
+        
+        return content
+    
+    def _generate_symptom_guide_content(self, condition, area):
+        """症状解説コンテンツ生成（拡充版）"""
+        condition_info = self._get_condition_info(condition)
+        area_data = self._get_area_data(area)
+        
+        content = f"## {condition}の主な症状について\n\n"
+        content += f"{condition_info['description']}\n\n"
+        
+        content += "### 具体的な症状\n"
+        for symptom in condition_info['symptoms']:
+            content += f"- {symptom}\n"
+        
+        content += "\n### 日常生活でのお困りごと\n"
+        for concern in condition_info['daily_concerns']:
+            content += f"- 「{concern}」\n"
+        
+        # 地域特化セクション追加
+        content += f"\n## {area}での訪問マッサージのメリット\n\n"
+        
+        landmarks = area_data.get('landmarks', [])
+        if landmarks:
+            content += f"### {area}の主要エリア\n"
+            for landmark in landmarks[:3]:  # 最大3つまで
+                content += f"- {landmark}周辺\n"
+            content += "\n上記エリアを含む{area}全域に対応しております。\n\n"
+        
+        content += "### 訪問マッサージが選ばれる理由\n"
+        content += "1. **通院の負担がない**: 移動が困難な方でも自宅で専門的な施術を受けられます\n"
+        content += "2. **医療保険適用可能**: 医師の同意書により医療保険が適用され、経済的負担を軽減\n"
+        content += "3. **個別対応**: 一人ひとりの症状に合わせたオーダーメイドの施術プラン\n"
+        content += "4. **家族への指導**: ご家族へのケア方法指導により、日常生活をサポート\n\n"
+        
+        # 施術プロセス詳細
+        content += "## 訪問マッサージの流れ\n\n"
+        content += "### 1. 初回カウンセリング（無料）\n"
+        content += "- 症状の詳しい確認\n"
+        content += "- 施術計画のご説明\n"
+        content += "- 医療保険適用の手続きサポート\n\n"
+        
+        content += "### 2. 医師の同意書取得\n"
+        content += "- かかりつけ医への同意書作成依頼をサポート\n"
+        content += "- 必要書類の準備をお手伝い\n\n"
+        
+        content += "### 3. 定期的な訪問施術\n"
+        content += "- 週1-3回の定期訪問（症状により調整）\n"
+        content += "- 1回30分程度の施術\n"
+        content += "- 症状の変化に応じた施術内容の調整\n\n"
+        
+        content += "### 4. 経過観察と報告\n"
+        content += "- 月1回の経過報告書作成\n"
+        content += "- 主治医との連携\n"
+        content += "- ご家族への状況説明\n\n"
+        
+        # よくある誤解の解消
+        content += "## よくある誤解と真実\n\n"
+        content += "### ❌ 誤解：訪問マッサージは高額\n"
+        content += "✅ **真実**: 医療保険適用により、1回あたり数百円程度の自己負担\n\n"
+        
+        content += "### ❌ 誤解：効果が期待できない\n"
+        content += "✅ **真実**: 国家資格を持つ専門家による医学的根拠に基づいた施術\n\n"
+        
+        content += "### ❌ 誤解：手続きが複雑\n"
+        content += "✅ **真実**: 当院が手続きを全面サポート、ご家族の負担を最小限に\n\n"
+        
+        return content
+    
+    def _generate_qa_content(self, condition, area):
+        """Q&Aコンテンツ生成"""
+        content = f"## {condition}に関するよくある質問\n\n"
+        
+        qa_items = [
+            {
+                'q': f"{condition}の訪問マッサージは保険適用されますか？",
+                'a': f"はい、医師の同意書があれば医療保険が適用されます。{condition}も医療保険の対象として認められており、{area}エリアでも同様に保険適用のマッサージが受けられます。"
+            },
+            {
+                'q': "どのくらいの頻度で施術を受けるべきですか？",
+                'a': "症状の程度により異なりますが、一般的に週1-3回の施術が効果的です。症状の状態や機能の程度を評価し、個別に頻度を調整いたします。"
+            },
+            {
+                'q': f"{area}まで本当に来てもらえますか？",
+                'a': f"はい、{area}は当院の主要対応エリアです。移動が困難な方も多いため、交通費負担なしで専門スタッフがお伺いします。"
+            },
+            {
+                'q': "1回の施術時間はどのくらいですか？",
+                'a': "1回あたり30分程度の施術を行います。お身体の状態や症状に応じて、必要に応じて時間を調整いたします。初回は症状の詳しい聞き取りも含めて少し長めになる場合があります。"
+            },
+            {
+                'q': "施術前に何か準備するものはありますか？",
+                'a': "特別な準備は必要ありません。動きやすい服装でお過ごしいただければ大丈夫です。医師からの同意書は当院でサポートいたしますので、まずはお気軽にご相談ください。"
+            },
+            {
+                'q': "どのくらいで効果を実感できますか？",
+                'a': "個人差がありますが、多くの方が3-4回の施術で何らかの変化を実感されています。症状の程度や期間により異なりますが、継続的な施術により徐々に改善が期待できます。"
+            },
+            {
+                'q': "家族が同席する必要はありますか？",
+                'a': "必須ではありませんが、ご家族の同席は歓迎いたします。施術内容の説明や日常生活でのアドバイスをお伝えする際に、ご家族にも聞いていただくと効果的です。"
+            },
+            {
+                'q': "他の治療や薬との併用はできますか？",
+                'a': "はい、基本的に他の治療との併用に問題はありません。現在受けている治療内容をお聞かせいただき、主治医とも連携しながら最適な施術プランをご提案いたします。"
+            }
+        ]
+        
+        for i, qa in enumerate(qa_items, 1):
+            content += f"### Q{i}. {qa['q']}\n"
+            content += f"A. {qa['a']}\n\n"
+        
+        return content
+    
+    def _generate_prevention_content(self, condition, area):
+        """予防・セルフケアコンテンツ生成"""
+        content = f"## {condition}の予防・セルフケア方法\n\n"
+        content += f"{area}在住の方向けの実践的なケア方法をご紹介します。\n\n"
+        
+        content += "### 日常でできるセルフケア\n"
+        content += "- 適度な運動習慣の維持\n"
+        content += "- 正しい姿勢の意識\n"
+        content += "- 栄養バランスの取れた食事\n"
+        content += "- 十分な休息と睡眠\n"
+        content += "- ストレス管理\n\n"
+        
+        return content
+    
+    def _generate_area_info(self, area):
+        """地域情報生成"""
+        area_data = self._get_area_data(area)
+        
+        content = f"## {area}の地域特性と訪問マッサージの必要性\n\n"
+        content += f"### {area}の基本データ\n"
+        content += f"- **人口**: 約{area_data['population']:,}人\n"
+        content += f"- **世帯数**: 約{area_data['households']:,}世帯\n"
+        content += f"- **面積**: {area_data['area']}km²\n"
+        content += f"- **高齢者人口**: 約{area_data['elderly']:,}人\n\n"
+        
+        content += "### 地域の特徴\n"
+        for feature in area_data['features']:
+            content += f"- {feature}\n"
+        
+        content += "\n### 医療・介護施設\n"
+        for facility in area_data['medical_facilities']:
+            content += f"- {facility}\n"
+        
+        content += f"\n### {area}での在宅ケアの重要性\n"
+        content += "- 高齢化による在宅ケア需要の増加\n"
+        content += "- 地域包括ケアシステムの構築\n"
+        content += f"- {area}特有の地域課題への対応\n\n"
+        
+        return content
+    
+    def _generate_pricing_info(self):
+        """料金体系生成"""
+        content = "### 医療保険適用で安心の料金体系\n"
+        content += "- 1回30分の施術：450円（1割負担）\n"
+        content += "- 月1回コース：1800円（税込）\n"
+        content += "- 月2回コース：3600円（税込）\n"
+        content += "- 月3回コース：5400円（税込）\n\n"
+        return content
+    
+    def _generate_cta(self):
+        """CTA生成"""
+        content = "**今すぐ医療保険適用でお申し込みください**\n"
+        content += f"📞 **[{self.env_vars['CLINIC_PHONE']}](tel:{self.env_vars['CLINIC_PHONE']})**\n"
+        content += f"⏰ {self.env_vars['BUSINESS_HOURS']}\n\n"
+        content += "---\n"
+        content += f"**運営**: {self.env_vars['COMPANY_NAME']} ({self.env_vars['LICENSE']})\n"
+        return content
+
+
+def _time_render(system: SEOBlogSystem, combos: List[tuple], rounds: int) -> List[float]:
+    """全組み合わせの描画を rounds 回計測し、1記事あたりの時間(μs)を返す"""
+    samples = []
+    for _ in range(rounds):
+        for condition, area, template_type in combos:
+            started = time.perf_counter()
+            system._generate_content(condition, area, template_type, "ベンチマーク")
+            samples.append((time.perf_counter() - started) * 1_000_000)
+    return samples
+
+def _summarize(samples: List[float]) -> Dict[str, float]:
+    """計測結果の要約"""
+    ordered = sorted(samples)
+    return {
+        'mean': statistics.fmean(ordered),
+        'p50': ordered[len(ordered) // 2],
+        'p99': ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))],
+    }
+
+def run_benchmark(conditions: List[str], areas: List[str], templates: List[str], rounds: int) -> bool:
+    """ベンチマーク実行（出力不一致があれば False）"""
+    compiled = SEOBlogSystem()
+    legacy = LegacyConcatSEOBlogSystem()
+    combos = list(SEOBlogSystem.iter_matrix(conditions, areas, templates))
+    
+    # 出力一致確認
+    mismatches = [
+        combo for combo in combos
+        if compiled._generate_content(*combo, "ベンチマーク") != legacy._generate_content(*combo, "ベンチマーク")
+    ]
+    
+    # ウォームアップ後に計測
+    _time_render(compiled, combos[:50], 1)
+    _time_render(legacy, combos[:50], 1)
+    results = {
+        'legacy_concat': _summarize(_time_render(legacy, combos, rounds)),
+        'compiled_template': _summarize(_time_render(compiled, combos, rounds)),
+    }
+    
+    print(f"📏 記事描画ベンチマーク: {len(combos)}記事 × {rounds}回")
+    print(f"{'方式':<20}{'平均(μs)':>12}{'p50(μs)':>12}{'p99(μs)':>12}")
+    for name, summary in results.items():
+        print(f"{name:<20}{summary['mean']:>12.1f}{summary['p50']:>12.1f}{summary['p99']:>12.1f}")
+    
+    speedup = results['legacy_concat']['mean'] / results['compiled_template']['mean']
+    print(f"\n⚡ 速度比: {speedup:.2f}x")
+    
+    if mismatches:
+        print(f"❌ 出力不一致: {len(mismatches)}件 (例: {mismatches[0]})")
+        return False
+    
+    print("✅ 出力一致: 全記事で従来方式とバイト単位で同一")
+    return True
+
+def main():
+    """メイン実行関数"""
+    parser = argparse.ArgumentParser(description='記事テンプレート描画ベンチマーク')
+    parser.add_argument('--rounds', type=int, default=5, help='計測回数')
+    parser.add_argument('--conditions', help='対象症状（カンマ区切り）')
+    parser.add_argument('--areas', help='対象地域（カンマ区切り）')
+    parser.add_argument('--templates', help='対象テンプレート（カンマ区切り）')
+    args = parser.parse_args()
+    
+    ok = run_benchmark(
+        _split_list(args.conditions) or MATRIX_CONDITIONS,
+        _split_list(args.areas) or MATRIX_AREAS,
+        _split_list(args.templates) or MATRIX_TEMPLATES,
+        args.rounds
+    )
+    
+    if not ok:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
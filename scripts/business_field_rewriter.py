@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+事業者情報一括書き換えツール
+記事本文に埋め込まれた事業者情報（電話番号・公式サイトURL・資格表記・営業時間）の出現位置を
+_posts 全件で索引化し、該当するバイト範囲のみを新しい値に置き換える（記事の再生成・手作業不要）
+
+- 旧値は既定で現在の環境変数（未設定時は SEOBlogSystem と同じ既定値）。--old で明示指定も可
+- 全フィールドを1回の走査で照合し、置換は1パスで行う（新しい値が別フィールドの旧値を含んでも連鎖しない）
+- ファイルごとにスレッドプールで並列処理し、一時ファイル経由の os.replace で原子的に置換
+- --dry-run では書き込まずにフィールド別件数と変更行の差分サマリーを表示
+- _data/business.yml・index.html 等のサイトファイルは書き換えず、旧値の残る行を一覧表示する
+
+使用方法: python business_field_rewriter.py --set CLINIC_PHONE=06-1234-5678 [--set LICENSE=...]
+                                             [--old CLINIC_PHONE=080-4769-0101] [--dry-run] [--workers 8]
+"""
+
+import os
+import re
+import sys
+import time
+import shutil
+import argparse
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple
+
+# 書き換え対象フィールドと既定値（seo_blog_system.py の環境変数既定値と同じ）
+FIELD_DEFAULTS = {
+    'CLINIC_PHONE': '080-4769-0101',
+    'MAIN_SITE_URL': 'https://peraichi.com/landing_pages/view/himawari-massage',
+    'LICENSE': '厚生労働省認定・医療保険適用の訪問医療マッサージ専門院',
+    'BUSINESS_HOURS': '8:00-21:00（毎日）',
+}
+DIFF_SAMPLE_LINES = 2  # dry-run で1ファイルあたりに表示する変更行数
+# 書き換え対象外だが同じ値を持つサイトファイル（出現箇所を報告のみ。テンプレートは書式が異なるため手動更新）
+SITE_FILE_PATTERNS = ("_config.yml", "_data/*.yml", "_includes/*.html", "_layouts/*.html", "*.html")
+
+def _field_pattern(old_value: str) -> bytes:
+    """旧値の照合パターン（英数字で始まる・終わる値は前後が英数字の場合に一致させない）
+
+    例: 080-4769-0101 が 080-4769-01012 の一部として、URL が ...-massage-osaka の一部として一致しないようにする
+    """
+    pattern = re.escape(old_value.encode('utf-8'))
+    if re.match(r'[A-Za-z0-9_]', old_value):
+        pattern = rb'(?<![A-Za-z0-9_])' + pattern
+    if re.search(r'[A-Za-z0-9_]$', old_value):
+        pattern = pattern + rb'(?![A-Za-z0-9_-])'
+    return pattern
+
+class BusinessFieldRewriter:
+    """_posts の事業者情報一括書き換え"""
+
+    def __init__(self, replacements: Dict[str, str], old_values: Optional[Dict[str, str]] = None,
+                 project_root: Optional[Path] = None, posts_dir: Optional[Path] = None,
+                 workers: Optional[int] = None):
+        self.project_root = project_root or self._get_project_root()
+        self.posts_dir = Path(posts_dir) if posts_dir else self.project_root / "_posts"
+        self.workers = max(1, workers or min(32, (os.cpu_count() or 1) * 4))
+
+        old_values = old_values or {}
+        self.fields: Dict[str, Tuple[str, str]] = {}
+        for field, new_value in replacements.items():
+            if field not in FIELD_DEFAULTS:
+                raise ValueError(f"書き換え対象外のフィールドです: {field}（対象: {', '.join(FIELD_DEFAULTS)}）")
+            old_value = old_values.get(field) or os.environ.get(field) or FIELD_DEFAULTS[field]
+            if not new_value:
+                raise ValueError(f"{field} の新しい値が空です")
+            if new_value != old_value:
+                self.fields[field] = (old_value, new_value)
+
+        # 長い旧値を優先（ある旧値が別の旧値を含む場合に長い方で置換）
+        ordered = sorted(self.fields.items(), key=lambda item: len(item[1][0]), reverse=True)
+        self._fields_by_group = [field for field, _ in ordered]
+        self._pattern = re.compile(
+            b'|'.join(b'(' + _field_pattern(old_value) + b')' for _, (old_value, _) in ordered)
+        ) if ordered else None
+        self._new_bytes = {field: new_value.encode('utf-8') for field, (_, new_value) in self.fields.items()}
+
+    def _get_project_root(self) -> Path:
+        """プロジェクトルート自動検出"""
+        current = Path(__file__).parent
+        while current.parent != current:
+            if (current / "_config.yml").exists():
+                return current
+            current = current.parent
+        return Path(__file__).parent.parent
+
+    def index_occurrences(self, data: bytes) -> List[Tuple[int, int, str]]:
+        """出現位置の索引 [(開始バイト, 終了バイト, フィールド)]"""
+        return [
+            (match.start(), match.end(), self._fields_by_group[match.lastindex - 1])
+            for match in self._pattern.finditer(data)
+        ]
+
+    def patch(self, data: bytes, occurrences: List[Tuple[int, int, str]]) -> bytes:
+        """索引のバイト範囲のみ新しい値に置換（範囲外のバイトはそのまま）"""
+        parts, position = [], 0
+        for start, end, field in occurrences:
+            parts.append(data[position:start])
+            parts.append(self._new_bytes[field])
+            position = end
+        parts.append(data[position:])
+        return b''.join(parts)
+
+    def _process_file(self, path: Path, dry_run: bool) -> Optional[Dict[str, Any]]:
+        """1ファイル分の索引化・置換（該当なしは None）"""
+        data = path.read_bytes()
+        occurrences = self.index_occurrences(data)
+        if not occurrences:
+            return None
+
+        patched = self.patch(data, occurrences)
+        if not dry_run:
+            tmp_path = path.with_name(path.name + '.tmp')
+            with open(tmp_path, 'wb') as f:
+                f.write(patched)
+            shutil.copymode(path, tmp_path)
+            os.replace(tmp_path, path)
+
+        counts: Dict[str, int] = {}
+        for _, _, field in occurrences:
+            counts[field] = counts.get(field, 0) + 1
+        return {
+            'path': str(path),
+            'counts': counts,
+            'diff': self._diff_sample(data, occurrences) if dry_run else []
+        }
+
+    def _diff_sample(self, data: bytes, occurrences: List[Tuple[int, int, str]]) -> List[Tuple[str, str]]:
+        """変更行の差分サンプル [(変更前の行, 変更後の行)]"""
+        samples, seen_lines = [], set()
+        for start, _, _ in occurrences:
+            line_start = data.rfind(b'\n', 0, start) + 1
+            if line_start in seen_lines:
+                continue
+            seen_lines.add(line_start)
+            line_end = data.find(b'\n', start)
+            line_end = len(data) if line_end == -1 else line_end
+            line = data[line_start:line_end]
+            line_occurrences = [
+                (s - line_start, e - line_start, field) for s, e, field in occurrences if line_start <= s < line_end
+            ]
+            samples.append((line.decode('utf-8'), self.patch(line, line_occurrences).decode('utf-8')))
+            if len(samples) >= DIFF_SAMPLE_LINES:
+                break
+        return samples
+
+    def find_site_occurrences(self) -> List[Tuple[str, int, str]]:
+        """サイトファイル内の旧値の出現箇所 [(プロジェクトルートからの相対パス, 行番号, フィールド)]"""
+        paths = sorted({path for pattern in SITE_FILE_PATTERNS for path in self.project_root.glob(pattern)})
+        found: List[Tuple[str, int, str]] = []
+        for path in paths:
+            try:
+                data = path.read_bytes()
+            except OSError:
+                continue
+            for start, _, field in self.index_occurrences(data):
+                occurrence = (str(path.relative_to(self.project_root)), data.count(b'\n', 0, start) + 1, field)
+                if occurrence not in found:
+                    found.append(occurrence)
+        return found
+
+    def rewrite(self, dry_run: bool = False) -> Dict[str, Any]:
+        """_posts 全件の書き換え（dry_run=True の場合は書き込まずに差分サマリーのみ）"""
+        if not self.fields:
+            print("✅ 変更する値がありません（新旧の値が同一）")
+            return {'success': True, 'files_scanned': 0, 'files_changed': 0, 'occurrences': {}, 'dry_run': dry_run}
+        if not self.posts_dir.exists():
+            return {'success': False, 'error': f"記事ディレクトリが見つかりません: {self.posts_dir}"}
+
+        print(f"🔁 事業者情報一括書き換え{'（dry-run）' if dry_run else ''}: {self.posts_dir}")
+        for field, (old_value, new_value) in self.fields.items():
+            print(f"  {field}: {old_value} → {new_value}")
+
+        started = time.perf_counter()
+        paths = sorted(self.posts_dir.glob("*.md"))
+        changed, failed = [], []
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = {path: executor.submit(self._process_file, path, dry_run) for path in paths}
+            for path, future in futures.items():
+                try:
+                    result = future.result()
+                except (OSError, UnicodeDecodeError) as e:
+                    failed.append({'path': str(path), 'error': str(e)})
+                    print(f"  ❌ {path.name}: {e}")
+                    continue
+                if result:
+                    changed.append(result)
+        elapsed = time.perf_counter() - started
+
+        occurrences = {field: sum(item['counts'].get(field, 0) for item in changed) for field in self.fields}
+        if dry_run:
+            self._print_diff_summary(changed)
+
+        print(f"\n📊 {'変更予定' if dry_run else '書き換え完了'}: {len(changed)}/{len(paths)}ファイル "
+              f"({elapsed:.3f}秒, 失敗 {len(failed)})")
+        for field, count in occurrences.items():
+            print(f"  {field}: {count}箇所 / {sum(1 for item in changed if field in item['counts'])}ファイル")
+        site_occurrences = self.find_site_occurrences()
+        if site_occurrences:
+            print("⚠️  以下のサイトファイルにも旧値が残っています（書き換え対象外のため手動で更新してください）")
+            for path, line, field in site_occurrences:
+                print(f"  {path}:{line} ({field})")
+        if not dry_run:
+            stale = [field for field, (_, new_value) in self.fields.items() if (os.environ.get(field) or FIELD_DEFAULTS[field]) != new_value]
+            if stale:
+                print(f"⚠️  今後の生成記事にも反映するには .env の {', '.join(stale)} も更新してください")
+
+        return {
+            'success': not failed,
+            'files_scanned': len(paths),
+            'files_changed': len(changed),
+            'occurrences': occurrences,
+            'files': changed,
+            'failed': failed,
+            'site_occurrences': site_occurrences,
+            'elapsed_seconds': elapsed,
+            'dry_run': dry_run
+        }
+
+    def _print_diff_summary(self, changed: List[Dict[str, Any]]):
+        """dry-run の差分サマリー（ファイルごとの件数と変更行サンプル）"""
+        for item in changed:
+            counts = ", ".join(f"{field}×{count}" for field, count in item['counts'].items())
+            print(f"\n📄 {Path(item['path']).name} ({counts})")
+            for before, after in item['diff']:
+                print(f"  - {before.strip()}")
+                print(f"  + {after.strip()}")
+
+def _parse_assignments(values: Optional[List[str]], option: str) -> Dict[str, str]:
+    """FIELD=値 形式の引数を辞書化"""
+    assignments = {}
+    for value in values or []:
+        field, separator, field_value = value.partition('=')
+        if not separator:
+            raise ValueError(f"{option} は FIELD=値 の形式で指定してください: {value}")
+        assignments[field.strip()] = field_value
+    return assignments
+
+def main():
+    """メイン実行関数"""
+    parser = argparse.ArgumentParser(description='事業者情報一括書き換えツール')
+    parser.add_argument('--set', action='append', metavar='FIELD=新しい値', required=True,
+                        help=f"書き換え内容（対象: {', '.join(FIELD_DEFAULTS)}）")
+    parser.add_argument('--old', action='append', metavar='FIELD=旧値', help='旧値（省略時は現在の環境変数）')
+    parser.add_argument('--posts-dir', help='記事ディレクトリ（省略時は <プロジェクトルート>/_posts）')
+    parser.add_argument('--workers', type=int, default=None, help='並列スレッド数')
+    parser.add_argument('--dry-run', action='store_true', help='書き込まずに差分サマリーのみ表示')
+    args = parser.parse_args()
+
+    try:
+        rewriter = BusinessFieldRewriter(
+            _parse_assignments(args.set, '--set'),
+            old_values=_parse_assignments(args.old, '--old'),
+            posts_dir=Path(args.posts_dir) if args.posts_dir else None,
+            workers=args.workers
+        )
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    result = rewriter.rewrite(dry_run=args.dry_run)
+    if not result['success']:
+        if result.get('error'):
+            print(f"❌ {result['error']}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Jekyll変換マニフェスト
+ソース記事（blog_articles）ごとのコンテンツハッシュと _posts 出力の対応を保持し、
+差分変換（未変更スキップ・変更再変換・孤立出力の検出）に使用する
+（既定の保存先: <プロジェクトルート>/.cache/jekyll_conversion_manifest.json）
+"""
+
+import os
+import json
+import hashlib
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Any, Optional
+
+MANIFEST_VERSION = 1
+
+def content_hash(content: str) -> str:
+    """記事内容のSHA-256"""
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+class ConversionManifest:
+    """ソース記事 → (コンテンツハッシュ, _posts 出力) の対応表"""
+
+    def __init__(self, manifest_path: Path):
+        self.manifest_path = Path(manifest_path)
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.orphaned_outputs: List[Dict[str, Any]] = []
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        """マニフェスト読み込み（存在しない・壊れている場合は空から開始）"""
+        if not self.manifest_path.exists():
+            return
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == MANIFEST_VERSION:
+                self.entries = data.get('entries', {})
+        except (OSError, ValueError) as e:
+            print(f"⚠️  変換マニフェストを読み込めません（全件変換します）: {e}")
+
+    def save(self):
+        """マニフェスト保存（一時ファイル経由で原子的に置換）"""
+        if not self._dirty:
+            return
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.manifest_path.with_suffix(self.manifest_path.suffix + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': MANIFEST_VERSION,
+                'updated_at': datetime.now().isoformat(),
+                'entries': self.entries
+            }, f, indent=2, ensure_ascii=False, sort_keys=True)
+        os.replace(tmp_path, self.manifest_path)
+        self._dirty = False
+
+    def get(self, source_key: str) -> Optional[Dict[str, Any]]:
+        """ソース記事のエントリ取得"""
+        return self.entries.get(source_key)
+
+    def invalidate_missing_output(self, source_key: str) -> bool:
+        """出力ファイルが存在しないエントリを破棄（次回は再変換）。破棄した場合 True"""
+        entry = self.entries.get(source_key)
+        if entry is None or Path(entry['jekyll_path']).exists():
+            return False
+        del self.entries[source_key]
+        self._dirty = True
+        return True
+
+    def is_stat_unchanged(self, source_key: str, stat: os.stat_result) -> bool:
+        """mtime・サイズが前回と同一か（内容を読まずに判定できる高速パス）"""
+        entry = self.entries.get(source_key)
+        return bool(entry) and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size
+
+    def find_by_hash(self, digest: str) -> Optional[Dict[str, Any]]:
+        """同一内容のエントリ検索（ソースの移動・改名検出用）"""
+        for entry in self.entries.values():
+            if entry['sha256'] == digest:
+                return entry
+        return None
+
+    def touch(self, source_key: str, stat: os.stat_result):
+        """内容は同一でmtimeのみ変わった場合の更新"""
+        entry = self.entries[source_key]
+        entry['mtime_ns'] = stat.st_mtime_ns
+        entry['size'] = stat.st_size
+        self._dirty = True
+
+    def record(self, source_key: str, stat: os.stat_result, digest: str, jekyll_path: str):
+        """変換結果の記録（出力先が変わった場合は旧出力を孤立として記録）"""
+        previous = self.entries.get(source_key)
+        if previous and previous['jekyll_path'] != jekyll_path:
+            self.orphaned_outputs.append({
+                'source': source_key,
+                'jekyll_path': previous['jekyll_path'],
+                'reason': 'replaced'
+            })
+
+        self.entries[source_key] = {
+            'sha256': digest,
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'jekyll_path': jekyll_path,
+            'converted_at': datetime.now().isoformat()
+        }
+        self._dirty = True
+
+    def collect_orphans(self, seen_sources: set) -> List[Dict[str, Any]]:
+        """ソースが消えたエントリを孤立出力として抽出し、マニフェストから除去"""
+        for source_key in sorted(set(self.entries) - seen_sources):
+            entry = self.entries.pop(source_key)
+            self.orphaned_outputs.append({
+                'source': source_key,
+                'jekyll_path': entry['jekyll_path'],
+                'reason': 'source_removed'
+            })
+            self._dirty = True
+
+        # 移動・改名で別ソースに引き継がれた出力は孤立扱いしない
+        live_outputs = {entry['jekyll_path'] for entry in self.entries.values()}
+        return [
+            orphan for orphan in self.orphaned_outputs
+            if orphan['jekyll_path'] not in live_outputs and Path(orphan['jekyll_path']).exists()
+        ]
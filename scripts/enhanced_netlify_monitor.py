@@ -7,20 +7,30 @@ Author: Claude Code
 Date: 2025-08-10
 """
 
+import os
+import codecs
 import requests
 import json
 import time
 import logging
 
+from error_classifier import get_default_classifier
+
+LOG_CHUNK_SIZE = 64 * 1024
+LOG_TAIL_CHARS = 16 * 1024  # ストリーミング時に保持するログ末尾（抜粋表示用）
+RUBY_ERROR_CATEGORIES = ('ruby_gems', 'missing_gem', 'bundler')
+
 class EnhancedNetlifyMonitor:
     """詳細ビルドログ解析機能付きNetlify監視"""
     
-    def __init__(self):
-        self.site_id = "178502f5-7910-4db3-bfd1-ae57d99e9345"
-        self.base_url = "https://api.netlify.com/api/v1"
+    def __init__(self, base_url=None, site_id=None):
+        self.site_id = site_id or "178502f5-7910-4db3-bfd1-ae57d99e9345"
+        # NETLIFY_API_URL: ローカルのスタブサーバー等に向ける場合に指定
+        self.base_url = (base_url or os.getenv('NETLIFY_API_URL') or "https://api.netlify.com/api/v1").rstrip('/')
+        self.classifier = get_default_classifier()
         
-    def get_deploy_details(self, deploy_id):
-        """デプロイの詳細情報とビルドログを取得"""
+    def get_deploy_details(self, deploy_id, stream=False):
+        """デプロイの詳細情報とビルドログを取得（stream=True ではログを逐次解析し、全文は保持しない）"""
         
         try:
             # デプロイ詳細取得
@@ -33,6 +43,17 @@ class EnhancedNetlifyMonitor:
                 
             deploy_data = deploy_response.json()
             
+            if stream:
+                log_result = self.stream_build_log(deploy_id)
+                return {
+                    'deploy_data': deploy_data,
+                    'build_log': log_result['tail'] if log_result['success'] else "ログ取得不可",
+                    'log_analysis': log_result,
+                    'error_message': deploy_data.get('error_message', ''),
+                    'state': deploy_data.get('state', ''),
+                    'deploy_time': deploy_data.get('deploy_time', 0)
+                }
+            
             # ビルドログ取得 (可能な場合)
             build_log_url = f"{self.base_url}/sites/{self.site_id}/deploys/{deploy_id}/log"
             log_response = requests.get(build_log_url, timeout=15)
@@ -56,6 +77,77 @@ class EnhancedNetlifyMonitor:
             print(f"❌ デプロイ詳細取得エラー: {e}")
             return None
     
+    def stream_build_log(self, deploy_id, stop_on_fatal=True, chunk_size=LOG_CHUNK_SIZE):
+        """ビルドログをチャンク単位で受信しながら分類（致命的エラー検出時は受信を打ち切る）"""
+        build_log_url = f"{self.base_url}/sites/{self.site_id}/deploys/{deploy_id}/log"
+        session = self.classifier.session(stop_on_fatal=stop_on_fatal)
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        bytes_read = chars_received = 0
+        tail = ""
+        started = time.perf_counter()
+        
+        try:
+            with requests.get(build_log_url, timeout=15, stream=True) as log_response:
+                if log_response.status_code != 200:
+                    print(f"⚠️ ビルドログ取得失敗 (認証が必要な可能性): {log_response.status_code}")
+                    return {'success': False, 'status_code': log_response.status_code}
+                
+                for chunk in log_response.iter_content(chunk_size=chunk_size):
+                    bytes_read += len(chunk)
+                    text = decoder.decode(chunk)
+                    if session.feed(text):
+                        # 抜粋は打ち切り行まで。残りは受信しない（with 終了時に接続を閉じる）
+                        tail = (tail + text[:session.chars_scanned - chars_received])[-LOG_TAIL_CHARS:]
+                        break
+                    chars_received += len(text)
+                    tail = (tail + text)[-LOG_TAIL_CHARS:]
+                else:
+                    text = decoder.decode(b'', final=True)
+                    tail = (tail + text)[-LOG_TAIL_CHARS:]
+                    session.feed(text)
+        except requests.RequestException as e:
+            print(f"❌ ビルドログ受信エラー: {e}")
+            return {'success': False, 'error': str(e)}
+        
+        classification = session.close()
+        return {
+            'success': True,
+            'status_code': 200,
+            'matches': classification['matches'],
+            'signatures': classification['signatures'],
+            'fatal': classification['fatal'],
+            'stopped_early': classification['stopped_early'],
+            'lines_scanned': classification['lines_scanned'],
+            'bytes_read': bytes_read,
+            'elapsed_ms': round((time.perf_counter() - started) * 1000, 1),
+            'ruby_errors': self.ruby_errors_from_matches(classification['matches']),
+            'tail': tail
+        }
+    
+    def ruby_errors_from_matches(self, matches):
+        """分類結果から Ruby gemエラーの説明を生成（1行につき1件）"""
+        found_errors = []
+        seen_lines = set()
+        
+        for match in matches:
+            if match['category'] not in RUBY_ERROR_CATEGORIES or match['line'] in seen_lines:
+                continue
+            seen_lines.add(match['line'])
+            found_errors.append(self._describe_ruby_error(match['line_text']))
+        
+        return found_errors
+    
+    def _describe_ruby_error(self, line):
+        """Ruby エラー行の説明（gem名を抽出できる場合は gem名）"""
+        if 'cannot load such file --' in line:
+            remainder = line.split('cannot load such file --')[1].strip().split()
+            if remainder:
+                gem_name = remainder[0].strip('\'\"()')
+                return f"Missing gem: {gem_name}"
+        elif 'Could not find' in line and 'gem' in line:
+            return f"Gem not found: {line}"
+        return f"Ruby error: {line}"
+    
     def analyze_ruby_errors_from_log(self, build_log):
         """ビルドログからRuby gemエラーを詳細解析"""
         
@@ -76,19 +168,12 @@ class EnhancedNetlifyMonitor:
         for line in lines:
             for pattern in ruby_gem_patterns:
                 if pattern in line:
-                    # gem名を抽出
-                    if 'cannot load such file --' in line:
-                        gem_name = line.split('cannot load such file --')[1].strip().split()[0].strip('\'\"()')
-                        found_errors.append(f"Missing gem: {gem_name}")
-                    elif 'Could not find' in line and 'gem' in line:
-                        found_errors.append(f"Gem not found: {line}")
-                    else:
-                        found_errors.append(f"Ruby error: {line}")
+                    found_errors.append(self._describe_ruby_error(line))
                         
         return found_errors
     
-    def test_latest_failed_deploy(self):
-        """最新の失敗デプロイを解析"""
+    def test_latest_failed_deploy(self, stream=False):
+        """最新の失敗デプロイを解析（stream=True ではビルドログを逐次解析）"""
         
         print("🔍 最新の失敗デプロイ解析中...")
         
@@ -118,7 +203,7 @@ class EnhancedNetlifyMonitor:
             print(f"   作成日時: {failed_deploy.get('created_at', 'N/A')}")
             
             # 詳細解析
-            details = self.get_deploy_details(failed_deploy['id'])
+            details = self.get_deploy_details(failed_deploy['id'], stream=stream)
             
             if details:
                 print(f"\n📋 デプロイ詳細:")
@@ -127,7 +212,14 @@ class EnhancedNetlifyMonitor:
                 print(f"   ビルド時間: {details['deploy_time']}秒")
                 
                 # ビルドログからRubyエラー解析
-                ruby_errors = self.analyze_ruby_errors_from_log(details['build_log'])
+                log_analysis = details.get('log_analysis')
+                if log_analysis and log_analysis['success']:
+                    ruby_errors = log_analysis['ruby_errors']
+                    print(f"   ログ受信: {log_analysis['bytes_read'] / 1024:.0f}KB / {log_analysis['lines_scanned']}行"
+                          f" ({log_analysis['elapsed_ms']}ms)"
+                          f"{' - 致命的エラー検出で受信打ち切り' if log_analysis['stopped_early'] else ''}")
+                else:
+                    ruby_errors = self.analyze_ruby_errors_from_log(details['build_log'])
                 
                 if ruby_errors:
                     print(f"\n🔥 検出されたRubyエラー ({len(ruby_errors)}件):")
@@ -148,8 +240,15 @@ class EnhancedNetlifyMonitor:
             print(f"❌ 解析エラー: {e}")
 
 def main():
-    monitor = EnhancedNetlifyMonitor()
-    monitor.test_latest_failed_deploy()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='強化版Netlify監視（ビルドログ詳細解析）')
+    parser.add_argument('--stream', action='store_true', help='ビルドログを逐次受信・解析し、致命的エラー検出で打ち切る')
+    parser.add_argument('--base-url', help='Netlify API のベースURL（スタブサーバー等）')
+    args = parser.parse_args()
+    
+    monitor = EnhancedNetlifyMonitor(base_url=args.base_url)
+    monitor.test_latest_failed_deploy(stream=args.stream)
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
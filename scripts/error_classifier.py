@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+ビルドログ エラー分類器
+SimpleErrorAnalyzer（simple_error_monitor.py）と ErrorAnalyzer（error_monitor_server.py）の
+全エラーパターンを起動時に1つのキーワードオートマトンへコンパイルし、ログを1回だけ走査して
+一致したシグネチャ・位置（文字オフセット）・行番号を返す
+
+- 大文字小文字を区別しないパターン: 小文字化したログ上で照合
+- 区別するパターン（gem 不足・Jekyll エラー）: 一致位置で元のログと照合し直す
+- ストリーミング: ClassificationSession に行単位でログを投入し、致命的シグネチャ検出で打ち切り可能
+
+使用方法: python error_classifier.py <ログファイル> [--stop-on-fatal] [--json]
+"""
+
+import sys
+import json
+import argparse
+from typing import Dict, List, Any, Optional, Iterable
+
+from keyword_automaton import KeywordAutomaton
+
+# SimpleErrorAnalyzer のパターン（大文字小文字を区別しない・カテゴリ内は上から順に報告）
+SIMPLE_ERROR_PATTERNS: Dict[str, List[str]] = {
+    'ruby_gems': [
+        'cannot load such file --',
+        'LoadError',
+        'Bundler::GemNotFound',
+        'Could not find gem'
+    ],
+    'jekyll': [
+        'Liquid syntax error',
+        'YAML front matter',
+        'Layout does not exist',
+        'jekyll build failed'
+    ],
+    'netlify': [
+        'dependency_installation script returned non-zero exit code',
+        'Build script returned non-zero exit code',
+        'Command failed with exit code'
+    ]
+}
+
+# エラーの深刻度
+CATEGORY_SEVERITY: Dict[str, str] = {
+    'ruby_gems': 'HIGH',     # ビルド完全停止
+    'jekyll': 'MEDIUM',      # 一部記事影響
+    'netlify': 'HIGH',       # デプロイ失敗
+    'missing_gem': 'HIGH',
+    'jekyll_issue': 'MEDIUM',
+    'bundler': 'HIGH'
+}
+
+# Ruby 3.4 で標準添付から外れた gem（ErrorAnalyzer の自動修正対象）
+RUBY_34_GEM_FIXES: Dict[str, str] = {
+    'csv': 'gem "csv" # Ruby 3.4対応',
+    'logger': 'gem "logger" # Ruby 3.4対応',
+    'base64': 'gem "base64" # Ruby 3.4対応',
+    'ostruct': 'gem "ostruct" # Ruby 3.4対応',
+    'mutex_m': 'gem "mutex_m" # Ruby 3.4対応',
+    'fiddle': 'gem "fiddle" # Ruby 3.4対応',
+    'drb': 'gem "drb" # Ruby 3.4対応'
+}
+
+# ErrorAnalyzer の Jekyll エラー（大文字小文字を区別）
+JEKYLL_ISSUES: Dict[str, str] = {
+    'Liquid syntax error': "Liquid構文エラー: テンプレート構文を確認",
+    'YAML front matter': "Front Matter構文エラー: YAML形式を確認",
+    "Layout 'post' does not exist": "レイアウトファイル不足: _layouts/post.html確認"
+}
+
+# EnhancedNetlifyMonitor の Bundler エラー（大文字小文字を区別・後続行に gem 名が出るため致命的扱いしない）
+BUNDLER_PATTERNS: List[str] = [
+    'bundler: failed to load command:'
+]
+
+# 検出時点でビルド失敗が確定するシグネチャ（ストリーミング時の打ち切り判定）
+FATAL_SIGNATURES = {
+    'ruby_gems:cannot load such file --',
+    'ruby_gems:Bundler::GemNotFound',
+    'ruby_gems:Could not find gem',
+    'netlify:dependency_installation script returned non-zero exit code',
+    'netlify:Build script returned non-zero exit code',
+    'netlify:Command failed with exit code'
+}
+
+def build_default_signatures() -> List[Dict[str, Any]]:
+    """既定シグネチャ一覧（SimpleErrorAnalyzer → gem 不足 → Jekyll → Bundler の順）"""
+    signatures = []
+    for category, patterns in SIMPLE_ERROR_PATTERNS.items():
+        for pattern in patterns:
+            signatures.append({'category': category, 'pattern': pattern, 'ignore_case': True})
+    for gem_name, fix_line in RUBY_34_GEM_FIXES.items():
+        signatures.append({
+            'category': 'missing_gem', 'pattern': f"cannot load such file -- {gem_name}",
+            'ignore_case': False, 'gem': gem_name, 'fix': fix_line
+        })
+    for pattern, message in JEKYLL_ISSUES.items():
+        signatures.append({'category': 'jekyll_issue', 'pattern': pattern, 'ignore_case': False, 'message': message})
+    for pattern in BUNDLER_PATTERNS:
+        signatures.append({'category': 'bundler', 'pattern': pattern, 'ignore_case': False})
+
+    for signature in signatures:
+        signature['id'] = f"{signature['category']}:{signature['pattern']}"
+        signature['severity'] = CATEGORY_SEVERITY.get(signature['category'], 'MEDIUM')
+        signature['fatal'] = signature['id'] in FATAL_SIGNATURES or signature['category'] == 'missing_gem'
+    return signatures
+
+_ASCII_LOWER_TABLE = {code: code + 32 for code in range(ord('A'), ord('Z') + 1)}
+
+def _ascii_lower(text: str) -> str:
+    """ASCII のみ小文字化（文字数が変わらないため元のログと位置が一致する）"""
+    return text.translate(_ASCII_LOWER_TABLE)
+
+class ErrorClassifier:
+    """複数エラーパターンの一括分類器（起動時に1度だけコンパイル）"""
+
+    def __init__(self, signatures: Optional[Iterable[Dict[str, Any]]] = None):
+        self.signatures = list(signatures if signatures is not None else build_default_signatures())
+        self.by_id = {signature['id']: signature for signature in self.signatures}
+
+        # 小文字化したパターン → シグネチャ（同じ文字列を複数のシグネチャが共有しうる）
+        self._by_keyword: Dict[str, List[Dict[str, Any]]] = {}
+        for signature in self.signatures:
+            self._by_keyword.setdefault(signature['pattern'].lower(), []).append(signature)
+        self.automaton = KeywordAutomaton(self._by_keyword)
+
+    def classify(self, log_text: str, stop_on_fatal: bool = False,
+                 max_matches: Optional[int] = None) -> Dict[str, Any]:
+        """ログ全体を1回走査して分類"""
+        session = self.session(stop_on_fatal=stop_on_fatal, max_matches=max_matches)
+        session.scan(log_text)
+        return session.result()
+
+    def session(self, stop_on_fatal: bool = False, max_matches: Optional[int] = None) -> "ClassificationSession":
+        """ストリーミング分類セッション"""
+        return ClassificationSession(self, stop_on_fatal=stop_on_fatal, max_matches=max_matches)
+
+class ClassificationSession:
+    """行単位で投入されるログの逐次分類（位置・行番号はストリーム先頭からの通算）"""
+
+    def __init__(self, classifier: ErrorClassifier, stop_on_fatal: bool = False, max_matches: Optional[int] = None):
+        self.classifier = classifier
+        self.stop_on_fatal = stop_on_fatal
+        self.max_matches = max_matches
+        self.matches: List[Dict[str, Any]] = []
+        self.fatal: Optional[Dict[str, Any]] = None
+        self.stopped = False
+        self.chars_scanned = 0
+        self.lines_scanned = 0
+        self._pending = ""
+
+    def feed(self, chunk: str) -> bool:
+        """ログ断片の投入（行の途中までは次回に持ち越し）。以降の投入が不要になったら True"""
+        if self.stopped:
+            return True
+        text = self._pending + chunk
+        cut = text.rfind('\n') + 1
+        self._pending = text[cut:]
+        if cut:
+            self.scan(text[:cut])
+        return self.stopped
+
+    def close(self) -> Dict[str, Any]:
+        """残りの行（末尾改行なし）を処理して結果を返す"""
+        if self._pending and not self.stopped:
+            pending, self._pending = self._pending, ""
+            self.scan(pending)
+        return self.result()
+
+    def scan(self, text: str):
+        """完結した行のまとまりを走査"""
+        if self.stopped or not text:
+            return
+
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # 小文字化で文字数が変わる文字（例: İ）を含む場合は位置を保つため ASCII のみ小文字化
+            lowered = _ascii_lower(text)
+
+        base_offset, base_line = self.chars_scanned, self.lines_scanned
+        line_number, line_cursor = base_line + 1, 0
+        stop_at = None  # 打ち切り位置（致命的エラー行・上限到達行の行末。同じ行の他の一致は報告する）
+        for keyword, start, end in self.classifier.automaton.iter_matches(lowered):
+            if stop_at is not None and start >= stop_at:
+                break
+            line_number += text.count('\n', line_cursor, start)
+            line_cursor = start
+            for signature in self.classifier._by_keyword[keyword]:
+                if not signature['ignore_case'] and not text.startswith(signature['pattern'], start):
+                    continue
+                line_start = text.rfind('\n', 0, start) + 1
+                line_end = text.find('\n', end)
+                line_end = len(text) if line_end == -1 else line_end
+                match = {
+                    'id': signature['id'],
+                    'category': signature['category'],
+                    'pattern': signature['pattern'],
+                    'severity': signature['severity'],
+                    'fatal': signature['fatal'],
+                    'start': base_offset + start,
+                    'end': base_offset + end,
+                    'line': line_number,
+                    'line_text': text[line_start:line_end].rstrip('\r')
+                }
+                self.matches.append(match)
+                if signature['fatal'] and self.fatal is None:
+                    self.fatal = match
+                    if self.stop_on_fatal:
+                        stop_at = line_end
+                if self.max_matches is not None and len(self.matches) >= self.max_matches:
+                    stop_at = line_end
+                    break
+
+        if stop_at is not None:
+            # 打ち切り時は打ち切り行までを走査済みとする
+            self.stopped = True
+            self.chars_scanned = base_offset + min(stop_at + 1, len(text))
+            self.lines_scanned = line_number
+        else:
+            self.chars_scanned = base_offset + len(text)
+            self.lines_scanned = base_line + text.count('\n') + (0 if text.endswith('\n') else 1)
+
+    def result(self) -> Dict[str, Any]:
+        """分類結果（signatures はシグネチャ定義順の一意な一致ID）"""
+        matched_ids = {match['id'] for match in self.matches}
+        return {
+            'matches': self.matches,
+            'signatures': [signature['id'] for signature in self.classifier.signatures if signature['id'] in matched_ids],
+            'fatal': self.fatal,
+            'stopped_early': self.stopped,
+            'chars_scanned': self.chars_scanned,
+            'lines_scanned': self.lines_scanned
+        }
+
+_default_classifier: Optional[ErrorClassifier] = None
+
+def get_default_classifier() -> ErrorClassifier:
+    """既定シグネチャの分類器（初回呼び出し時に1度だけ構築）"""
+    global _default_classifier
+    if _default_classifier is None:
+        _default_classifier = ErrorClassifier()
+    return _default_classifier
+
+def classify_log(log_text: str, stop_on_fatal: bool = False) -> Dict[str, Any]:
+    """既定分類器でのログ分類"""
+    return get_default_classifier().classify(log_text, stop_on_fatal=stop_on_fatal)
+
+def main():
+    """メイン実行関数"""
+    parser = argparse.ArgumentParser(description='ビルドログ エラー分類')
+    parser.add_argument('log_file', help='ビルドログファイル（- で標準入力）')
+    parser.add_argument('--stop-on-fatal', action='store_true', help='致命的エラー検出で走査を打ち切る')
+    parser.add_argument('--json', action='store_true', help='結果をJSONで出力')
+    args = parser.parse_args()
+
+    session = get_default_classifier().session(stop_on_fatal=args.stop_on_fatal)
+    stream = sys.stdin if args.log_file == '-' else open(args.log_file, 'r', encoding='utf-8', errors='replace')
+    with stream:
+        for line in stream:
+            if session.feed(line):
+                break
+    result = session.close()
+
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    else:
+        print(f"🔍 {result['lines_scanned']}行走査 / 一致 {len(result['matches'])}件"
+              f"{'（致命的エラーで打ち切り）' if result['stopped_early'] else ''}")
+        for match in result['matches']:
+            print(f"  [{match['severity']}] {match['line']}行目: {match['id']}")
+            print(f"      {match['line_text'].strip()[:160]}")
+
+    sys.exit(1 if result['fatal'] else 0)
+
+if __name__ == "__main__":
+    main()
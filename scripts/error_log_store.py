@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+追記専用 JSONL エラーログストア
+詳細エラーログを1件1行の JSONL として追記し（全件読み込み・書き直しをしない）、
+サイズ上限でローテーションする。読み出しは新しい順にファイル末尾からブロック単位で逆読みし、
+履歴全体をメモリに載せずに末尾取得・絞り込み・ページングを行う
+
+- ファイル: detailed_errors.jsonl（最新）→ detailed_errors.jsonl.1 → ... → .N（古い順に削除）
+- fsync 方針: always（1件ごと）/ interval（前回から一定秒数経過時）/ never（OSに任せる）
+- 旧形式 detailed_errors.json（JSON配列）は初回起動時に取り込み、.migrated に改名
+
+使用方法: python error_log_store.py [--log-dir DIR] [-n 20] [--platform Netlify] [--severity HIGH]
+                                  [--since 2025-08-10] [--until 2025-08-11] [--cursor SEQ]
+"""
+
+import os
+import json
+import time
+import argparse
+import threading
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Iterator, Union
+
+DEFAULT_LOG_DIR = Path('/Users/skem/Himawari/SEO_AUTO_BLOG_PROJECT/logs')
+DEFAULT_MAX_BYTES = 5 * 1024 * 1024
+DEFAULT_BACKUP_COUNT = 5
+FSYNC_POLICIES = ('always', 'interval', 'never')
+DEFAULT_FSYNC_INTERVAL = 1.0
+READ_BLOCK_SIZE = 64 * 1024
+SEVERITY_RANK = {'LOW': 0, 'MEDIUM': 1, 'HIGH': 2}
+
+def _iter_lines_reverse(path: Path, block_size: int = READ_BLOCK_SIZE) -> Iterator[bytes]:
+    """ファイル末尾から1行ずつ逆順に読み出し（ブロック単位で読み、全体は読み込まない）"""
+    with open(path, 'rb') as f:
+        position = f.seek(0, os.SEEK_END)
+        remainder = b''
+        while position > 0:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            block = f.read(read_size) + remainder
+            lines = block.split(b'\n')
+            remainder = lines.pop(0)  # ブロック先頭の行は前のブロックと繋がっている可能性がある
+            for line in reversed(lines):
+                if line.strip():
+                    yield line
+        if remainder.strip():
+            yield remainder
+
+def _read_first_line(path: Path) -> Optional[bytes]:
+    """先頭の空でない1行"""
+    with open(path, 'rb') as f:
+        for line in f:
+            if line.strip():
+                return line
+    return None
+
+def _to_timestamp(value: Union[str, datetime, None]) -> Optional[str]:
+    """絞り込み用の時刻を ISO 形式文字列に（記録済み timestamp と同じ形式で比較）"""
+    if value is None or isinstance(value, str):
+        return value
+    return value.isoformat()
+
+def highest_severity(detected_issues: List[Dict[str, Any]]) -> Optional[str]:
+    """検出事項の中で最も高い深刻度"""
+    severities = [issue.get('severity') for issue in detected_issues if issue.get('severity') in SEVERITY_RANK]
+    return max(severities, key=SEVERITY_RANK.get) if severities else None
+
+class ErrorLogStore:
+    """追記専用 JSONL エラーログ（サイズローテーション・fsync 方針・逆順リーダー付き）"""
+
+    def __init__(self, log_dir: Path = DEFAULT_LOG_DIR, name: str = 'detailed_errors',
+                 max_bytes: int = DEFAULT_MAX_BYTES, backup_count: int = DEFAULT_BACKUP_COUNT,
+                 fsync: str = 'interval', fsync_interval: float = DEFAULT_FSYNC_INTERVAL,
+                 migrate_legacy: bool = True):
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"fsync は {', '.join(FSYNC_POLICIES)} のいずれか: {fsync}")
+        self.log_dir = Path(log_dir)
+        self.path = self.log_dir / f"{name}.jsonl"
+        self.legacy_path = self.log_dir / f"{name}.json"
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.fsync = fsync
+        self.fsync_interval = fsync_interval
+        self._lock = threading.Lock()
+        self._file = None
+        self._last_fsync = 0.0
+
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        self._seq = self._load_last_seq()
+        if migrate_legacy and self.legacy_path.exists():
+            self.migrate_legacy_json()
+
+    def _files_newest_first(self) -> List[Path]:
+        """現行ファイル・ローテーション済みファイル（新しい順）"""
+        candidates = [self.path] + [self.path.with_name(f"{self.path.name}.{n}") for n in range(1, self.backup_count + 1)]
+        return [path for path in candidates if path.exists()]
+
+    def _load_last_seq(self) -> int:
+        """最後に記録した通し番号（ページングのカーソルに使用）"""
+        for path in self._files_newest_first():
+            for line in _iter_lines_reverse(path):
+                try:
+                    return int(json.loads(line)['seq'])
+                except (ValueError, KeyError, TypeError):
+                    continue  # 書き込み途中で切れた行等は読み飛ばす
+        return 0
+
+    # ---- 書き込み ----
+
+    def append(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """1件追記（通し番号・最高深刻度を付与。1行を1回の write で書き込む）"""
+        with self._lock:
+            self._seq += 1
+            record = dict(entry, seq=self._seq)
+            record.setdefault('severity', highest_severity(record.get('detected_issues') or []))
+            line = (json.dumps(record, ensure_ascii=False) + "\n").encode('utf-8')
+
+            if self._file is None:
+                self._file = open(self.path, 'ab')
+            if self._file.tell() and self._file.tell() + len(line) > self.max_bytes:
+                self._rotate()
+
+            self._file.write(line)
+            self._file.flush()
+            self._sync()
+            return record
+
+    def _sync(self):
+        """fsync 方針に従ってディスクへ同期（呼び出し側でロック取得済み）"""
+        if self.fsync == 'never':
+            return
+        now = time.monotonic()
+        if self.fsync == 'always' or now - self._last_fsync >= self.fsync_interval:
+            os.fsync(self._file.fileno())
+            self._last_fsync = now
+
+    def _rotate(self):
+        """ローテーション: .N を削除し .1〜.N-1 を1つずつ繰り下げ（呼び出し側でロック取得済み）"""
+        os.fsync(self._file.fileno())
+        self._file.close()
+        for n in range(self.backup_count - 1, 0, -1):
+            source = self.path.with_name(f"{self.path.name}.{n}")
+            if source.exists():
+                os.replace(source, self.path.with_name(f"{self.path.name}.{n + 1}"))
+        if self.backup_count > 0:
+            os.replace(self.path, self.path.with_name(f"{self.path.name}.1"))
+        else:
+            self.path.unlink()
+        self._file = open(self.path, 'ab')
+
+    def close(self):
+        """ファイルを同期して閉じる"""
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+                os.fsync(self._file.fileno())
+                self._file.close()
+                self._file = None
+
+    def migrate_legacy_json(self) -> int:
+        """旧形式（JSON配列）の取り込み（古い順に追記し、元ファイルは .migrated に改名）"""
+        try:
+            with open(self.legacy_path, 'r', encoding='utf-8') as f:
+                legacy_entries = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️  旧形式エラーログを読み込めません（移行をスキップ）: {e}")
+            return 0
+
+        if not isinstance(legacy_entries, list):
+            legacy_entries = []
+        for entry in legacy_entries:
+            if isinstance(entry, dict):
+                self.append(dict(entry, migrated=True))
+        self.close()
+        os.replace(self.legacy_path, self.legacy_path.with_name(self.legacy_path.name + '.migrated'))
+        print(f"📦 旧形式エラーログ移行: {len(legacy_entries)}件 → {self.path.name}")
+        return len(legacy_entries)
+
+    # ---- 読み出し ----
+
+    def iter_entries(self, before_seq: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """新しい順に全件列挙（before_seq 指定時はそれより古いもののみ）"""
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+            files = self._files_newest_first()
+
+        for path in files:
+            if before_seq is not None:
+                # ファイル内は昇順のため、先頭がカーソル以降ならファイルごと読み飛ばす
+                first = _read_first_line(path) if path.exists() else None
+                try:
+                    if first is None or int(json.loads(first)['seq']) >= before_seq:
+                        continue
+                except (ValueError, KeyError, TypeError):
+                    pass
+            try:
+                lines = _iter_lines_reverse(path)
+                for line in lines:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    if before_seq is not None and entry.get('seq', 0) >= before_seq:
+                        continue
+                    yield entry
+            except FileNotFoundError:
+                continue  # 読み出し中にローテーションで削除された
+
+    def query(self, platform: Optional[str] = None, severity: Optional[str] = None,
+              since: Union[str, datetime, None] = None, until: Union[str, datetime, None] = None,
+              limit: int = 50, cursor: Optional[int] = None) -> Dict[str, Any]:
+        """絞り込み・ページング（新しい順。next_cursor を次回の cursor に渡すと続きを取得）"""
+        since, until = _to_timestamp(since), _to_timestamp(until)
+        minimum_rank = SEVERITY_RANK.get(severity.upper()) if severity else None
+        entries: List[Dict[str, Any]] = []
+        next_cursor = None
+
+        for entry in self.iter_entries(before_seq=cursor):
+            timestamp = entry.get('timestamp') or ''
+            if since and timestamp < since:
+                break  # 新しい順のため以降はすべて範囲外
+            if until and timestamp >= until:
+                continue
+            if platform and (entry.get('platform') or '').lower() != platform.lower():
+                continue
+            if minimum_rank is not None and SEVERITY_RANK.get(entry.get('severity'), -1) < minimum_rank:
+                continue
+            if len(entries) == limit:
+                next_cursor = entries[-1]['seq']
+                break
+            entries.append(entry)
+
+        return {'entries': entries, 'next_cursor': next_cursor}
+
+    def tail(self, n: int = 20, **filters) -> List[Dict[str, Any]]:
+        """最新 n 件（古い順で返す。filters は query と同じ）"""
+        return list(reversed(self.query(limit=n, **filters)['entries']))
+
+    def stats(self) -> Dict[str, Any]:
+        """ファイル数・合計サイズ・最終通し番号"""
+        files = self._files_newest_first()
+        return {
+            'files': len(files),
+            'bytes': sum(path.stat().st_size for path in files),
+            'last_seq': self._seq,
+            'fsync': self.fsync
+        }
+
+def main():
+    """メイン実行関数"""
+    parser = argparse.ArgumentParser(description='JSONL エラーログ閲覧')
+    parser.add_argument('--log-dir', default=str(DEFAULT_LOG_DIR), help='ログディレクトリ')
+    parser.add_argument('-n', '--limit', type=int, default=20, help='表示件数')
+    parser.add_argument('--platform', help='プラットフォームで絞り込み（例: Netlify）')
+    parser.add_argument('--severity', choices=list(SEVERITY_RANK), help='指定以上の深刻度で絞り込み')
+    parser.add_argument('--since', help='この日時以降（ISO形式）')
+    parser.add_argument('--until', help='この日時より前（ISO形式）')
+    parser.add_argument('--cursor', type=int, help='前回表示の next_cursor')
+    parser.add_argument('--json', action='store_true', help='結果をJSONで出力')
+    args = parser.parse_args()
+
+    store = ErrorLogStore(Path(args.log_dir))
+    result = store.query(platform=args.platform, severity=args.severity, since=args.since,
+                         until=args.until, limit=args.limit, cursor=args.cursor)
+
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+        return
+
+    print(f"📚 エラーログ: {len(result['entries'])}件 ({store.path})")
+    for entry in reversed(result['entries']):
+        issues = ", ".join(issue.get('pattern', '') for issue in entry.get('detected_issues') or [])
+        print(f"  #{entry['seq']} {entry.get('timestamp', '')} [{entry.get('severity') or '-'}] "
+              f"{entry.get('platform')} / {entry.get('site_name')}: {issues or (entry.get('error_message') or '')[:80]}")
+    if result['next_cursor']:
+        print(f"➡️  続き: --cursor {result['next_cursor']}")
+
+if __name__ == "__main__":
+    main()
@@ -15,9 +15,13 @@ import hashlib
 import os
 import subprocess
 import logging
+import threading
 from datetime import datetime
 from pathlib import Path
 
+from webhook_job_queue import WebhookJobQueue
+from error_classifier import RUBY_34_GEM_FIXES, JEKYLL_ISSUES, get_default_classifier
+
 # ログ設定
 logging.basicConfig(
     level=logging.INFO,
@@ -36,45 +40,47 @@ GITHUB_WEBHOOK_SECRET = os.getenv('GITHUB_WEBHOOK_SECRET', 'your-github-secret')
 NETLIFY_WEBHOOK_SECRET = os.getenv('NETLIFY_WEBHOOK_SECRET', 'your-netlify-secret')
 PROJECT_PATH = '/Users/skem/Himawari/SEO_AUTO_BLOG_PROJECT/correct_repo'
 CLAUDE_API_ENDPOINT = 'http://localhost:8080/claude-code'  # ローカルClaude Code API
+WEBHOOK_WORKERS = int(os.getenv('WEBHOOK_WORKERS', '4'))
+
+# Webhook は即座に 202 を返し、ログ取得・自動修正はワーカーで非同期処理
+job_queue = WebhookJobQueue(workers=WEBHOOK_WORKERS)
+
+# Gemfile 編集〜git push は同時に1ジョブのみ（ワーカー間で直列化）
+GIT_LOCK = threading.Lock()
 
 class ErrorAnalyzer:
     """エラー解析・修正提案システム"""
     
     def __init__(self):
-        self.common_fixes = {
-            'csv': 'gem "csv" # Ruby 3.4対応',
-            'logger': 'gem "logger" # Ruby 3.4対応', 
-            'base64': 'gem "base64" # Ruby 3.4対応',
-            'ostruct': 'gem "ostruct" # Ruby 3.4対応',
-            'mutex_m': 'gem "mutex_m" # Ruby 3.4対応',
-            'fiddle': 'gem "fiddle" # Ruby 3.4対応',
-            'drb': 'gem "drb" # Ruby 3.4対応'
-        }
+        self.common_fixes = RUBY_34_GEM_FIXES
+        self.classifier = get_default_classifier()
+        self._last_log = None
+        self._last_signatures = set()
+    
+    def _classify(self, error_log):
+        """ログ分類（gem・Jekyll 両方の解析で同じログを1回だけ走査）"""
+        if error_log is not self._last_log:
+            self._last_signatures = set(self.classifier.classify(error_log)['signatures'])
+            self._last_log = error_log
+        return self._last_signatures
     
     def analyze_ruby_gem_error(self, error_log):
         """Ruby gemエラーの自動解析"""
-        missing_gems = []
-        
-        for gem_name, fix_line in self.common_fixes.items():
-            if f"cannot load such file -- {gem_name}" in error_log:
-                missing_gems.append((gem_name, fix_line))
+        detected = self._classify(error_log)
         
-        return missing_gems
+        return [
+            (gem_name, fix_line) for gem_name, fix_line in self.common_fixes.items()
+            if f"missing_gem:cannot load such file -- {gem_name}" in detected
+        ]
     
     def analyze_jekyll_error(self, error_log):
         """Jekyllビルドエラーの解析"""
-        issues = []
-        
-        if "Liquid syntax error" in error_log:
-            issues.append("Liquid構文エラー: テンプレート構文を確認")
+        detected = self._classify(error_log)
         
-        if "YAML front matter" in error_log:
-            issues.append("Front Matter構文エラー: YAML形式を確認")
-        
-        if "Layout 'post' does not exist" in error_log:
-            issues.append("レイアウトファイル不足: _layouts/post.html確認")
-        
-        return issues
+        return [
+            message for pattern, message in JEKYLL_ISSUES.items()
+            if f"jekyll_issue:{pattern}" in detected
+        ]
 
 def verify_github_signature(payload_body, signature_header):
     """GitHub Webhook署名検証"""
@@ -93,7 +99,11 @@ def verify_github_signature(payload_body, signature_header):
 @app.route('/health')
 def health_check():
     """ヘルスチェック"""
-    return jsonify({"status": "healthy", "timestamp": datetime.now().isoformat()})
+    return jsonify({
+        "status": "healthy",
+        "timestamp": datetime.now().isoformat(),
+        "job_queue": job_queue.stats()
+    })
 
 @app.route('/github-webhook', methods=['POST'])
 def github_webhook():
@@ -112,10 +122,13 @@ def github_webhook():
         
         logger.info(f"GitHub Event: {event_type}")
         
-        # Workflow run失敗の監視
+        # Workflow run失敗の監視（run_id 単位で重複排除してバックグラウンド処理）
         if event_type == 'workflow_run' and payload['action'] == 'completed':
             if payload['workflow_run']['conclusion'] == 'failure':
-                handle_github_build_failure(payload)
+                job = job_queue.submit(
+                    f"github:{payload['workflow_run']['id']}", handle_github_build_failure, payload
+                )
+                return jsonify({"status": "accepted", **job}), 202
         
         # Push時のビルド失敗監視
         elif event_type == 'push':
@@ -136,9 +149,13 @@ def netlify_webhook():
         
         logger.info(f"Netlify Event: {payload.get('state', 'unknown')}")
         
-        # ビルド失敗時の処理
+        # ビルド失敗時の処理（deploy id 単位で重複排除してバックグラウンド処理）
         if payload.get('state') == 'error':
-            handle_netlify_build_failure(payload)
+            deploy_id = payload.get('id')
+            job = job_queue.submit(
+                f"netlify:{deploy_id}" if deploy_id else None, handle_netlify_build_failure, payload
+            )
+            return jsonify({"status": "accepted", **job}), 202
         
         # ビルド成功時の処理
         elif payload.get('state') == 'ready':
@@ -226,6 +243,11 @@ def analyze_and_fix_netlify_error(error_message, payload):
         send_notification(f"Netlify Build Error自動修正: {missing_gems}")
 
 def auto_fix_ruby_gems(missing_gems, repository):
+    """Ruby gemの自動修正実行（Gemfile 読み書き〜push をロック内で実行）"""
+    with GIT_LOCK:
+        _auto_fix_ruby_gems_locked(missing_gems, repository)
+
+def _auto_fix_ruby_gems_locked(missing_gems, repository):
     """Ruby gemの自動修正実行"""
     try:
         gemfile_path = Path(PROJECT_PATH) / 'Gemfile'
@@ -273,10 +295,9 @@ def auto_fix_ruby_gems(missing_gems, repository):
 def commit_and_push_fix(missing_gems):
     """修正をコミット・プッシュ"""
     try:
-        os.chdir(PROJECT_PATH)
-        
+        # os.chdir はプロセス全体に影響するため、各コマンドに cwd を指定
         # Git add
-        subprocess.run(['git', 'add', 'Gemfile'], check=True)
+        subprocess.run(['git', 'add', 'Gemfile'], check=True, cwd=PROJECT_PATH)
         
         # Commit message生成
         gem_names = [gem[0] for gem in missing_gems]
@@ -291,10 +312,10 @@ Generated by Error Monitor System
 Co-Authored-By: Claude <noreply@anthropic.com>"""
         
         # Git commit
-        subprocess.run(['git', 'commit', '-m', commit_msg], check=True)
+        subprocess.run(['git', 'commit', '-m', commit_msg], check=True, cwd=PROJECT_PATH)
         
         # Git push
-        subprocess.run(['git', 'push', 'origin', 'main'], check=True)
+        subprocess.run(['git', 'push', 'origin', 'main'], check=True, cwd=PROJECT_PATH)
         
         logger.info("🚀 自動修正コミット・プッシュ完了")
         
@@ -311,6 +332,7 @@ def send_notification(message):
 if __name__ == '__main__':
     logger.info("🚀 Error Monitor Server起動")
     logger.info(f"監視対象: {PROJECT_PATH}")
+    logger.info(f"Webhookワーカー数: {WEBHOOK_WORKERS}")
     
     # 開発環境での起動（ポート8080でAirPlay競合回避）
     app.run(host='0.0.0.0', port=8080, debug=True)
\ No newline at end of file
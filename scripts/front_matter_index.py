@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+_posts Front Matter 索引
+各記事の YAML ヘッダーのみを解析し（終端の --- で読み込みを打ち切り、本文はハッシュ計算のみ）、
+(パス, mtime, サイズ) をキーとするディスクキャッシュに保存する
+2回目以降は変更された記事だけを再解析する
+
+使用方法: python front_matter_index.py [--posts-dir ../_posts] [--cache PATH]
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import hashlib
+import argparse
+from pathlib import Path
+from urllib.parse import quote
+from datetime import datetime, date, timezone
+from typing import Dict, List, Any, Optional
+
+import yaml
+
+CACHE_VERSION = 1
+POST_FILENAME_PATTERN = re.compile(r'^(\d{4})-(\d{2})-(\d{2})-(.+)\.(?:md|markdown|html)$')
+DATE_FORMATS = ("%Y-%m-%d %H:%M:%S %z", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M %z", "%Y-%m-%d %H:%M", "%Y-%m-%d")
+POST_DATE_FORMAT = "%Y-%m-%d %H:%M:%S %z"
+DEFAULT_PERMALINK = "/:year/:month/:day/:title.html"
+BODY_CHUNK_SIZE = 64 * 1024
+
+def parse_post_date(value: Any, filename_date: Optional[date] = None) -> Optional[datetime]:
+    """Front Matter の date を UTC の datetime に変換（Netlify ビルド環境と同じく UTC 基準）"""
+    if isinstance(value, datetime):
+        parsed = value
+    elif isinstance(value, date):
+        parsed = datetime(value.year, value.month, value.day)
+    elif isinstance(value, str):
+        parsed = None
+        for date_format in DATE_FORMATS:
+            try:
+                parsed = datetime.strptime(value.strip(), date_format)
+                break
+            except ValueError:
+                continue
+        if parsed is None:
+            return parse_post_date(None, filename_date)
+    elif filename_date:
+        parsed = datetime(filename_date.year, filename_date.month, filename_date.day)
+    else:
+        return None
+
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+def normalize_categories(front_matter: Dict[str, Any]) -> List[str]:
+    """Jekyll と同じ規則でカテゴリを正規化（categories の文字列は空白区切り、category も追加）"""
+    categories: List[str] = []
+    for key in ('category', 'categories'):
+        value = front_matter.get(key)
+        if isinstance(value, str):
+            categories.extend(value.split())
+        elif isinstance(value, list):
+            categories.extend(str(item) for item in value if item is not None)
+
+    return list(dict.fromkeys(categories))
+
+def normalize_tags(value: Any) -> List[str]:
+    """タグの正規化（文字列は空白区切り）"""
+    if isinstance(value, str):
+        return value.split()
+    if isinstance(value, list):
+        return [str(item) for item in value if item is not None]
+    return []
+
+def first_paragraph(body: str) -> str:
+    """本文の最初の段落（見出し・引用記号・強調を除去）をJekyll の excerpt 相当として取得"""
+    for block in re.split(r'\n\s*\n', body.strip()):
+        text = block.strip()
+        if not text or text.startswith('#') or text.startswith('---'):
+            continue
+        text = re.sub(r'^>\s?', '', text, flags=re.MULTILINE)
+        text = re.sub(r'\[([^\]]*)\]\([^)]*\)', r'\1', text)
+        return text.replace('**', '').strip()
+    return ""
+
+def post_url(entry: Dict[str, Any], permalink_pattern: str = DEFAULT_PERMALINK) -> str:
+    """記事URL生成（Front Matter の permalink を優先、なければサイトのパーマリンク設定に従う）"""
+    if entry.get('permalink'):
+        return entry['permalink']
+
+    post_date = datetime.strptime(entry['date'], POST_DATE_FORMAT)
+    placeholders = {
+        ':year': post_date.strftime('%Y'),
+        ':month': post_date.strftime('%m'),
+        ':day': post_date.strftime('%d'),
+        ':title': quote(entry['slug'], safe="-._~!$&'()*+,;=:@"),
+    }
+    url = permalink_pattern
+    for placeholder, value in placeholders.items():
+        url = url.replace(placeholder, value)
+    return url
+
+def parse_post_header(post_path: Path) -> Dict[str, Any]:
+    """記事1件の索引エントリ生成（YAML ヘッダーのみ解析し、本文はストリーミングでハッシュ計算）"""
+    match = POST_FILENAME_PATTERN.match(post_path.name)
+    year, month, day, filename_slug = match.groups()
+
+    header_lines: List[str] = []
+    body_hash = hashlib.sha256()
+    excerpt_source = ""
+
+    with open(post_path, 'r', encoding='utf-8') as f:
+        first_line = f.readline()
+        if first_line.rstrip() == '---':
+            for line in f:
+                if line.rstrip() == '---':
+                    break
+                header_lines.append(line)
+            else:
+                # 終端がない場合は Jekyll と同様に Front Matter なしとして扱う
+                f.seek(0)
+                header_lines = []
+        else:
+            f.seek(0)
+
+        for chunk in iter(lambda: f.read(BODY_CHUNK_SIZE), ''):
+            if not excerpt_source:
+                excerpt_source = chunk
+            body_hash.update(chunk.encode('utf-8'))
+
+    front_matter = yaml.safe_load(''.join(header_lines)) if header_lines else {}
+    if not isinstance(front_matter, dict):
+        front_matter = {}
+
+    post_date = parse_post_date(front_matter.get('date'), date(int(year), int(month), int(day)))
+    return {
+        'title': str(front_matter.get('title') or filename_slug),
+        'date': post_date.strftime(POST_DATE_FORMAT),
+        'categories': normalize_categories(front_matter),
+        'tags': normalize_tags(front_matter.get('tags')),
+        'area': front_matter.get('area'),
+        'condition': front_matter.get('condition'),
+        'description': front_matter.get('description'),
+        'excerpt': front_matter.get('excerpt') or first_paragraph(excerpt_source),
+        'permalink': str(front_matter['permalink']) if front_matter.get('permalink') else None,
+        'slug': str(front_matter.get('slug') or filename_slug),
+        'published': front_matter.get('published') is not False,
+        'body_sha256': body_hash.hexdigest()
+    }
+
+def find_project_root() -> Path:
+    """プロジェクトルート自動検出（_config.yml のあるディレクトリ）"""
+    current = Path(__file__).parent
+    while current.parent != current:
+        if (current / "_config.yml").exists():
+            return current
+        current = current.parent
+    return Path(__file__).parent.parent
+
+def load_site_config(project_root: Path) -> Dict[str, Any]:
+    """_config.yml 読み込み"""
+    config_path = Path(project_root) / "_config.yml"
+    if not config_path.exists():
+        return {}
+    with open(config_path, 'r', encoding='utf-8') as f:
+        return yaml.safe_load(f) or {}
+
+def write_atomic(output_path: Path, content: str):
+    """一時ファイル経由で原子的に書き込み"""
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_name(output_path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    os.replace(tmp_path, output_path)
+
+class FrontMatterIndex:
+    """_posts の Front Matter 索引（(パス, mtime, サイズ) キーのディスクキャッシュ付き）"""
+
+    def __init__(self, posts_dir: Path, cache_path: Optional[Path] = None):
+        self.posts_dir = Path(posts_dir)
+        self.cache_path = Path(cache_path) if cache_path else self.posts_dir.parent / ".cache" / "front_matter_index.json"
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._refreshed = False
+        self._dirty = False
+        self._load_cache()
+
+    def _load_cache(self):
+        """キャッシュ読み込み（存在しない・バージョン不一致・破損時は空から開始）"""
+        if not self.cache_path.exists():
+            return
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == CACHE_VERSION and data.get('posts_dir') == str(self.posts_dir.resolve()):
+                self.entries = data.get('entries', {})
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Front Matter キャッシュを読み込めません（全件解析します）: {e}")
+
+    def save(self):
+        """キャッシュ保存（変更がある場合のみ、一時ファイル経由で原子的に置換）"""
+        if not self._dirty:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_name(self.cache_path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': CACHE_VERSION,
+                'posts_dir': str(self.posts_dir.resolve()),
+                'entries': self.entries
+            }, f, ensure_ascii=False, sort_keys=True)
+        os.replace(tmp_path, self.cache_path)
+        self._dirty = False
+
+    def refresh(self) -> Dict[str, int]:
+        """変更・追加された記事のみ再解析し、削除された記事を索引から除去"""
+        stats = {'total': 0, 'parsed': 0, 'cached': 0, 'removed': 0, 'errors': 0}
+        seen = set()
+
+        with os.scandir(self.posts_dir) as it:
+            for dir_entry in it:
+                if not dir_entry.is_file() or not POST_FILENAME_PATTERN.match(dir_entry.name):
+                    continue
+                seen.add(dir_entry.name)
+                stats['total'] += 1
+
+                stat = dir_entry.stat()
+                cached = self.entries.get(dir_entry.name)
+                if cached and cached['mtime_ns'] == stat.st_mtime_ns and cached['size'] == stat.st_size:
+                    stats['cached'] += 1
+                    continue
+
+                try:
+                    entry = parse_post_header(Path(dir_entry.path))
+                except (OSError, UnicodeDecodeError, yaml.YAMLError) as e:
+                    # 解析失敗も記録し、ファイルが更新されるまで再解析しない
+                    print(f"⚠️  Front Matter を解析できません: {dir_entry.name}: {e}")
+                    entry = {'error': str(e)}
+                    stats['errors'] += 1
+
+                entry['mtime_ns'] = stat.st_mtime_ns
+                entry['size'] = stat.st_size
+                self.entries[dir_entry.name] = entry
+                self._dirty = True
+                stats['parsed'] += 1
+
+        for filename in set(self.entries) - seen:
+            del self.entries[filename]
+            self._dirty = True
+            stats['removed'] += 1
+
+        self._refreshed = True
+        self.save()
+        return stats
+
+    def posts(self, include_unpublished: bool = False) -> List[Dict[str, Any]]:
+        """有効な記事エントリ一覧（site.posts と同じく日付の新しい順、同日時はファイル名の逆順）"""
+        if not self._refreshed:
+            self.refresh()
+
+        posts = [
+            dict(entry, path=f"_posts/{filename}", filename=filename)
+            for filename, entry in self.entries.items()
+            if 'error' not in entry and (include_unpublished or entry['published'])
+        ]
+        posts.sort(key=lambda post: (post['date'], post['filename']), reverse=True)
+        return posts
+
+    def get(self, filename: str) -> Optional[Dict[str, Any]]:
+        """ファイル名で記事エントリ取得"""
+        if not self._refreshed:
+            self.refresh()
+        entry = self.entries.get(filename)
+        if not entry or 'error' in entry:
+            return None
+        return dict(entry, path=f"_posts/{filename}", filename=filename)
+
+    def latest(self) -> Optional[Dict[str, Any]]:
+        """最新記事（Front Matter の日付基準）"""
+        posts = self.posts()
+        return posts[0] if posts else None
+
+def main():
+    """メイン実行関数"""
+    parser = argparse.ArgumentParser(description='_posts Front Matter 索引')
+    parser.add_argument('--posts-dir', default=str(Path(__file__).resolve().parent.parent / "_posts"),
+                        help='対象記事ディレクトリ')
+    parser.add_argument('--cache', help='キャッシュファイルパス')
+    args = parser.parse_args()
+
+    index = FrontMatterIndex(Path(args.posts_dir), Path(args.cache) if args.cache else None)
+    started = time.perf_counter()
+    stats = index.refresh()
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    print(f"🗂️  Front Matter 索引: {stats['total']}記事 ({elapsed_ms:.1f}ms)")
+    print(f"   再解析: {stats['parsed']} / キャッシュ: {stats['cached']} / 削除: {stats['removed']} / エラー: {stats['errors']}")
+    latest = index.latest()
+    if latest:
+        print(f"   最新記事: {latest['filename']} ({latest['date']})")
+
+    if stats['errors']:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
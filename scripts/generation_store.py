@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+記事生成ストア（入力ハッシュによるコンテンツアドレス方式）
+記事の全入力（症状データ・地域レコード・環境変数・テンプレートコード版・現在年）のハッシュをキーに
+生成済み記事を保存し、入力が変わっていない記事は再生成せずに保存済みの出力を再利用する
+
+- 入力が1つでも変われば別キーとなり再生成（古いエントリは PRUNE_AFTER_DAYS 日使われなければ削除）
+- 再利用時は指定された出力先に保存済み内容を書き出す（同一内容のファイルが既にあれば書き込まない）
+- 保存先: <プロジェクトルート>/.cache/generation_store/（index.json + objects/<キー>.md）
+"""
+
+import os
+import json
+import hashlib
+from pathlib import Path
+from datetime import datetime, timedelta
+from typing import Any, Dict, Mapping, Optional
+
+STORE_VERSION = 2
+PRUNE_AFTER_DAYS = 30
+MAX_RECORDED_PATHS = 30  # エントリごとに記録する出力先の上限（日付別ディレクトリ分）
+
+def fingerprint(value: Any) -> str:
+    """入力データのハッシュ（読み取り専用マッピング・タプルも通常の dict・list と同じ値になる）"""
+    def _plain(obj: Any) -> Any:
+        if isinstance(obj, Mapping):
+            return dict(obj)
+        if isinstance(obj, (set, frozenset)):
+            return sorted(obj)
+        return list(obj)
+
+    serialized = json.dumps(value, ensure_ascii=False, sort_keys=True, default=_plain)
+    return hashlib.sha256(serialized.encode('utf-8')).hexdigest()
+
+def input_key(*parts: str) -> str:
+    """入力ハッシュ群から記事キーを合成"""
+    return hashlib.sha256("\x1f".join(parts).encode('utf-8')).hexdigest()
+
+class GenerationStore:
+    """入力キー → 生成済み記事（タイトル・内容・出力先一覧）のストア"""
+
+    def __init__(self, store_dir: Path):
+        self.store_dir = Path(store_dir)
+        self.index_path = self.store_dir / "index.json"
+        self.objects_dir = self.store_dir / "objects"
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._today = datetime.now().strftime('%Y-%m-%d')
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        """索引読み込み（存在しない・壊れている場合は空から開始 = 全件再生成）"""
+        if not self.index_path.exists():
+            return
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == STORE_VERSION:
+                self.entries = data.get('entries', {})
+        except (OSError, ValueError) as e:
+            print(f"⚠️  生成ストアを読み込めません（全件再生成します）: {e}")
+
+    def _object_path(self, key: str) -> str:
+        return os.path.join(self.objects_dir, f"{key}.md")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """保存済みエントリ（なければ None = 再生成）"""
+        return self.entries.get(key)
+
+    def emit(self, key: str, output_dir: Path, filename: str) -> Optional[Path]:
+        """保存済み記事を output_dir に出力（同一内容のファイルが既にあれば書き込まない）
+        
+        内容ファイルが失われている・壊れている場合は None（呼び出し側で再生成する）
+        """
+        entry = self.entries[key]
+        output_path = Path(output_dir) / filename
+        if self._file_sha256(output_path) != entry['sha256']:
+            try:
+                with open(self._object_path(key), 'rb') as f:
+                    data = f.read()
+            except OSError:
+                return None
+            if hashlib.sha256(data).hexdigest() != entry['sha256']:
+                return None
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            self._write_atomic(output_path, data)
+
+        self._record_path(entry, output_path)
+        self._mark_used(entry)
+        return output_path
+
+    @staticmethod
+    def _file_sha256(path: Path) -> Optional[str]:
+        """既存ファイルの SHA-256（存在しなければ None）"""
+        try:
+            with open(path, 'rb') as f:
+                return hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            return None
+
+    def _record_path(self, entry: Dict[str, Any], output_path: Path):
+        """出力先の記録（新しい順に MAX_RECORDED_PATHS 件まで）"""
+        path = str(output_path)
+        paths = entry['paths']
+        if paths and paths[0] == path:
+            return
+        entry['paths'] = ([path] + [recorded for recorded in paths if recorded != path])[:MAX_RECORDED_PATHS]
+        self._dirty = True
+
+    def _mark_used(self, entry: Dict[str, Any]):
+        """最終使用日の更新（PRUNE_AFTER_DAYS 判定用）"""
+        if entry.get('used_at') != self._today:
+            entry['used_at'] = self._today
+            self._dirty = True
+
+    def put(self, key: str, content: str, title: str, output_path: Path):
+        """生成結果の保存"""
+        data = content.encode('utf-8')
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self._write_atomic(Path(self._object_path(key)), data)
+        self.entries[key] = {
+            'title': title,
+            'sha256': hashlib.sha256(data).hexdigest(),
+            'bytes': len(data),
+            'paths': [],
+            'used_at': self._today
+        }
+        self._record_path(self.entries[key], output_path)
+        self._dirty = True
+
+    def save(self):
+        """索引保存（PRUNE_AFTER_DAYS 日使われていないエントリと内容ファイルを削除）"""
+        if not self._dirty:
+            return
+        cutoff = (datetime.now() - timedelta(days=PRUNE_AFTER_DAYS)).strftime('%Y-%m-%d')
+        for key in [key for key, entry in self.entries.items() if entry['used_at'] < cutoff]:
+            del self.entries[key]
+            try:
+                os.unlink(self._object_path(key))
+            except FileNotFoundError:
+                pass
+
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        self._write_atomic(self.index_path, json.dumps({
+            'version': STORE_VERSION,
+            'updated_at': datetime.now().isoformat(),
+            'entries': self.entries
+        }, ensure_ascii=False).encode('utf-8'))
+        self._dirty = False
+
+    def _write_atomic(self, output_path: Path, data: bytes):
+        """一時ファイル経由で原子的に書き込み"""
+        tmp_path = output_path.with_name(output_path.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, output_path)
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+複数キーワード一括照合オートマトン
+記事メタデータ抽出（metadata_extractor.py）とビルドログ分類（error_classifier.py）で共用する
+"""
+
+import re
+from typing import Dict, Any, Optional, Iterable, Iterator, Set, Tuple
+
+class KeywordAutomaton:
+    """複数キーワードの一括照合オートマトン
+
+    全キーワードの接頭辞木（Aho–Corasick の goto 関数）を最長一致優先の1つの正規表現に
+    コンパイルし、C実装の正規表現エンジンで1回だけ走査する。非重複走査で取りこぼす一致は
+    Aho–Corasick の出力リンク相当を構築時に事前計算して補う:
+      - 内包リンク: 一致したキーワードに含まれる短いキーワード（例: 東住吉区 → 住吉区）
+      - 重なりリンク: 一致したキーワードの途中から始まるキーワード（例: セルフケア → ケア事例）
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords = tuple(dict.fromkeys(keyword for keyword in keywords if keyword))
+        self._pattern = re.compile(self._trie_pattern(self.keywords))
+        self._contained: Dict[str, Tuple[str, ...]] = {}
+        self._overlaps: Dict[str, Tuple[Tuple[str, str], ...]] = {}
+        self._contained_at: Dict[str, Tuple[Tuple[str, int], ...]] = {}
+        self._overlaps_at: Dict[str, Tuple[Tuple[str, str, int], ...]] = {}
+        self._build_links()
+
+    @staticmethod
+    def _trie_pattern(keywords: Iterable[str]) -> str:
+        """接頭辞木を正規表現に変換（例: 東住吉区・東成区 → 東(?:住吉区|成区)）"""
+        trie: Dict[str, Any] = {}
+        for keyword in keywords:
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[''] = True
+
+        def emit(node: Dict[str, Any]) -> str:
+            branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+            if not branches:
+                return ''
+            is_end = '' in node
+            body = branches[0] if len(branches) == 1 and not is_end else '(?:' + '|'.join(branches) + ')'
+            # 終端かつ続きがある場合は省略可能（貪欲マッチで長い方を優先）
+            return body + '?' if is_end else body
+
+        return emit(trie) if trie else '(?!)'
+
+    def _build_links(self):
+        """内包リンク・重なりリンクの事前計算"""
+        for keyword in self.keywords:
+            contained = tuple(
+                other for other in self.keywords
+                if other != keyword and other in keyword
+            )
+            # 重なり: keyword[offset:] が other の接頭辞 → keyword[:offset] + other の出現で判定
+            overlaps = tuple(
+                (other, keyword[:offset] + other)
+                for other in self.keywords
+                for offset in range(1, len(keyword))
+                if len(other) > len(keyword) - offset and other.startswith(keyword[offset:])
+            )
+            if contained:
+                self._contained[keyword] = contained
+                # 出現位置付き（同じ語が複数回含まれる場合は全位置）
+                self._contained_at[keyword] = tuple(
+                    (other, offset)
+                    for other in contained
+                    for offset in range(len(keyword) - len(other) + 1)
+                    if keyword.startswith(other, offset)
+                )
+            if overlaps:
+                self._overlaps[keyword] = overlaps
+                self._overlaps_at[keyword] = tuple(
+                    (other, keyword[:offset] + other, offset)
+                    for other in self.keywords
+                    for offset in range(1, len(keyword))
+                    if len(other) > len(keyword) - offset and other.startswith(keyword[offset:])
+                )
+
+    def find_all(self, content: str) -> Set[str]:
+        """本文中に出現する全キーワード（重なり・内包を含む）"""
+        found = set(self._pattern.findall(content))
+        pending = list(found)
+
+        while pending:
+            keyword = pending.pop()
+            for other in self._contained.get(keyword, ()):
+                if other not in found:
+                    found.add(other)
+                    pending.append(other)
+            for other, joined in self._overlaps.get(keyword, ()):
+                if other not in found and joined in content:
+                    found.add(other)
+                    pending.append(other)
+
+        return found
+
+    def iter_matches(self, content: str, pos: int = 0, endpos: Optional[int] = None) -> Iterator[Tuple[str, int, int]]:
+        """全出現を (キーワード, 開始位置, 終了位置) で列挙（開始位置の昇順、重なり・内包を含む）"""
+        endpos = len(content) if endpos is None else endpos
+        # 重なりで一致の終端を越えた子は後続の一致と重複しうるため、その範囲内だけ出力済みを保持
+        seen: Set[Tuple[str, int]] = set()
+        seen_until = 0
+        for match in self._pattern.finditer(content, pos, endpos):
+            keyword, start = match.group(), match.start()
+            if start >= seen_until:
+                seen.clear()
+            elif (keyword, start) in seen:
+                continue
+            found = [(keyword, start, match.end())]
+            seen.add((keyword, start))
+            pending = [(keyword, start)]
+
+            while pending:
+                parent, parent_start = pending.pop()
+                children = [(other, parent_start + offset) for other, offset in self._contained_at.get(parent, ())]
+                children.extend(
+                    (other, parent_start + offset)
+                    for other, joined, offset in self._overlaps_at.get(parent, ())
+                    if content.startswith(joined, parent_start, endpos)
+                )
+                for other, other_start in children:
+                    if (other, other_start) not in seen:
+                        seen.add((other, other_start))
+                        pending.append((other, other_start))
+                        found.append((other, other_start, other_start + len(other)))
+
+            seen_until = max(seen_until, max(end for _, _, end in found))
+            if len(found) > 1:
+                found.sort(key=lambda item: (item[1], -len(item[0])))
+            yield from found
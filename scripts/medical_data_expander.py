@@ -2,13 +2,340 @@
 """
 医学的精度を保った症状・エリア情報拡充システム
 完全ハードコードフリー・テンプレート駆動
+
+知識データ（疾患群分類・症状テンプレート・症状別の追加項目・説明文）はモジュール読み込み時に
+1度だけ読み取り専用で構築し、全インスタンスで共有する
+- 症状名 → 疾患群: CONDITION_CATEGORY_INDEX（逆引き索引）
+- 拡充結果は (症状名, 会社名) ごとに1度だけ生成して読み取り専用で再利用（以降は辞書参照のみ）
 """
 
 import os
 import json
 import csv
 from pathlib import Path
-from typing import Dict, List, Any
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Tuple
+
+def _freeze(value: Any) -> Any:
+    """辞書は読み取り専用ビュー、リストはタプルへ（入れ子も再帰的に）"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+# 疾患群分類（医学的分類）
+CONDITION_CATEGORIES: Mapping[str, Tuple[str, ...]] = _freeze({
+    "spinal_orthopedic": ["脊柱管狭窄症", "腰椎症", "椎間板ヘルニア"],
+    "cervical_orthopedic": ["頸椎症"],
+    "joint_orthopedic": ["五十肩"],
+    "neurological": ["パーキンソン病"],
+    "cerebrovascular": ["脳梗塞", "脳血管障害"],
+    "spinal_cord": ["脊髄損傷"],
+    "rheumatic": ["関節リウマチ", "変形性関節症", "膝関節症"],
+    "musculoskeletal": ["骨粗鬆症", "筋萎縮", "関節拘縮"],
+    "nerve_pain": ["坐骨神経痛"]
+})
+
+# 症状名 → 疾患群（逆引き索引。同じ症状が複数の疾患群にある場合は先に並ぶ疾患群を優先）
+CONDITION_CATEGORY_INDEX: Mapping[str, str] = MappingProxyType({
+    condition: category
+    for category, conditions in reversed(list(CONDITION_CATEGORIES.items()))
+    for condition in conditions
+})
+
+# 疾患群別症状テンプレート（医学的精度重視）
+CONDITION_TEMPLATES: Mapping[str, Mapping[str, Tuple[str, ...]]] = _freeze({
+    "spinal_orthopedic": {
+        "common_symptoms": [
+            "腰痛や下肢痛",
+            "歩行時の痛みやしびれ", 
+            "長時間の立位や歩行が困難",
+            "前かがみになると楽になる",
+            "間欠跛行（歩行と休息を繰り返す）"
+        ],
+        "daily_concerns": [
+            "長時間歩くことができない",
+            "買い物や外出が億劫になった", 
+            "階段の上り下りが辛い",
+            "立ち仕事が続けられない"
+        ]
+    },
+    "cervical_orthopedic": {
+        "common_symptoms": [
+            "頸部痛・肩こり",
+            "頸部から上肢への放散痛",
+            "上肢のしびれ・脱力感",
+            "頸部の可動域制限",
+            "頭痛・めまい"
+        ],
+        "daily_concerns": [
+            "デスクワークが辛い",
+            "上を向く動作が困難",
+            "車の運転時の首の動きが不安",
+            "枕が合わずに眠れない"
+        ]
+    },
+    "neurological": {
+        "common_symptoms": [
+            "動作の緩慢（動きが遅くなる）",
+            "手足の振戦（ふるえ）",
+            "筋肉のこわばり（筋強剛）", 
+            "バランス障害・姿勢反射障害",
+            "歩行困難（小刻み歩行など）"
+        ],
+        "daily_concerns": [
+            "日常動作に時間がかかるようになった",
+            "転倒への不安が常にある",
+            "細かい作業（ボタンかけなど）が困難",
+            "外出時の不安が増した",
+            "家族に迷惑をかけているのではないかと心配"
+        ]
+    },
+    "cerebrovascular": {
+        "common_symptoms": [
+            "片麻痺（半身の運動麻痺）",
+            "言語障害（失語・構音障害）",
+            "嚥下障害（飲み込みの困難）",
+            "感覚障害（しびれ・感覚鈍麻）",
+            "高次脳機能障害"
+        ],
+        "daily_concerns": [
+            "歩行が不安定で転倒が怖い",
+            "言葉が思うように出てこない",
+            "食事でむせることが増えた",
+            "麻痺側の管理が困難",
+            "再発への不安が常にある"
+        ]
+    },
+    "spinal_cord": {
+        "common_symptoms": [
+            "損傷部位以下の運動麻痺",
+            "感覚障害（痛覚・温度覚の消失）",
+            "自律神経障害（排尿・排便障害）",
+            "痙性（筋緊張の亢進）",
+            "体温調節障害"
+        ],
+        "daily_concerns": [
+            "車椅子生活への適応が必要",
+            "住環境のバリアフリー化が必須",
+            "排泄管理が困難",
+            "褥瘡予防の体位変換が必要",
+            "社会復帰への不安"
+        ]
+    },
+    "rheumatic": {
+        "common_symptoms": [
+            "関節の痛みと腫れ",
+            "朝起床時のこわばり感",
+            "動作開始時の痛み",
+            "天候変化による症状悪化",
+            "関節可動域の制限"
+        ],
+        "daily_concerns": [
+            "朝起きた時の手足のこわばりが辛い",
+            "瓶の蓋を開けることができない", 
+            "雨の日は特に痛みが強くなる",
+            "階段の上り下りが怖い",
+            "痛み止めへの依存が心配"
+        ]
+    },
+    "joint_orthopedic": {
+        "common_symptoms": [
+            "肩の痛みと可動域制限",
+            "夜間痛（寝返りで痛みが増強）",
+            "腕を上げる動作の困難",
+            "肩周囲の筋力低下",
+            "日常動作での痛み"
+        ],
+        "daily_concerns": [
+            "夜中に肩の痛みで目が覚める",
+            "洗髪や着替えが一人でできない",
+            "高い所の物が取れない",
+            "痛みで仕事に集中できない",
+            "いつまで続くか分からない不安"
+        ]
+    },
+    "musculoskeletal": {
+        "common_symptoms": [
+            "筋力低下と筋肉量減少",
+            "骨密度の低下",
+            "転倒リスクの増加", 
+            "関節の可動域制限",
+            "日常生活動作の困難"
+        ],
+        "daily_concerns": [
+            "立ち上がりや歩行が不安定",
+            "重い物を持つことができない",
+            "転倒して骨折するのが怖い",
+            "階段の昇降が危険に感じる",
+            "一人での外出が不安"
+        ]
+    },
+    "nerve_pain": {
+        "common_symptoms": [
+            "腰から下肢への放散痛",
+            "しびれ感（ピリピリ・ジンジン）",
+            "歩行時の痛み増強",
+            "座位や安静時の症状軽減",
+            "咳やくしゃみでの痛み増悪"
+        ],
+        "daily_concerns": [
+            "長時間座っていることができない",
+            "歩行時の激痛で外出が困難",
+            "夜間の痛みで睡眠不足",
+            "痛み止めが効かない時の不安",
+            "仕事や家事に支障が出ている"
+        ]
+    }
+})
+
+# 症状特化の追加症状（ハードコードなし）
+CONDITION_SPECIFIC_SYMPTOMS: Mapping[str, Tuple[str, ...]] = _freeze({
+    # 整形外科系
+    "脊柱管狭窄症": [
+        "神経性間欠跛行（歩行により下肢痛が増悪）",
+        "腰椎後屈時の症状増悪",
+        "前屈位での症状軽減"
+    ],
+    "腰椎症": [
+        "腰椎の変性に伴う痛み",
+        "起床時の腰部のこわばり",
+        "長時間同一姿勢での症状増悪"
+    ],
+    "椎間板ヘルニア": [
+        "椎間板の突出による神経圧迫症状",
+        "咳・くしゃみでの痛み増強",
+        "前屈動作での症状悪化"
+    ],
+    "頸椎症": [
+        "頸部から上肢への放散痛",
+        "頸部の運動制限",
+        "上肢のしびれ・筋力低下",
+        "頸部痛・肩こり",
+        "頸部の可動域制限",
+        "手指の巧緻動作障害"
+    ],
+    "五十肩": [
+        "夜間痛（夜中に痛みで目覚める）",
+        "肩関節の著明な可動域制限",
+        "結帯・結髪動作の困難"
+    ],
+
+    # 神経内科系
+    "パーキンソン病": [
+        "安静時振戦（手足の震え）",
+        "筋強剛（筋肉のこわばり）", 
+        "無動・寡動（動作の減少）",
+        "姿勢反射障害・歩行障害"
+    ],
+    "脳梗塞": [
+        "片麻痺（半身の運動麻痺）",
+        "言語障害（失語・構音障害）",
+        "嚥下障害",
+        "認知機能障害"
+    ],
+    "脳血管障害": [
+        "運動機能障害",
+        "感覚障害",
+        "高次脳機能障害",
+        "日常生活動作の困難"
+    ],
+    "脊髄損傷": [
+        "損傷部位以下の運動麻痺",
+        "感覚障害（痛覚・温度覚・触覚の消失）",
+        "自律神経障害（排尿・排便・体温調節障害）",
+        "痙性（筋緊張亢進）"
+    ],
+
+    # 関節リウマチ系
+    "関節リウマチ": [
+        "対称性の多関節炎",
+        "朝のこわばり（1時間以上持続）",
+        "関節の腫脹・変形",
+        "全身倦怠感・微熱"
+    ],
+    "変形性関節症": [
+        "関節軟骨の摩耗による痛み",
+        "関節の変形・腫脹",
+        "可動域制限",
+        "荷重時の痛み増強"
+    ],
+    "膝関節症": [
+        "膝関節の痛みと腫脹",
+        "階段昇降時の痛み",
+        "正座・しゃがみ込み困難",
+        "歩行開始時痛"
+    ],
+
+    # 筋骨格系
+    "骨粗鬆症": [
+        "骨密度低下による骨折リスク",
+        "腰背部痛",
+        "身長短縮・円背",
+        "軽微な外力での骨折"
+    ],
+    "筋萎縮": [
+        "筋肉量・筋力の進行性低下",
+        "筋線維の萎縮",
+        "日常生活動作能力の低下",
+        "歩行・起立動作の困難"
+    ],
+    "関節拘縮": [
+        "関節可動域の制限・固定",
+        "関節周囲組織の硬化",
+        "日常動作の制限",
+        "痛みを伴う可動域制限"
+    ],
+
+    # 神経痛
+    "坐骨神経痛": [
+        "腰臀部から下肢への放散痛",
+        "座位・前屈での痛み増強",
+        "下肢のしびれ感",
+        "歩行時の間欠的痛み"
+    ]
+})
+
+# 症状特化の困りごと
+CONDITION_SPECIFIC_CONCERNS: Mapping[str, Tuple[str, ...]] = _freeze({
+    "脊柱管狭窄症": [
+        "長距離の歩行ができなくなった",
+        "カートを押して歩くと楽になることを発見した"
+    ],
+    "パーキンソン病": [
+        "薬の効果時間に生活リズムが左右される",
+        "人前で手の震えが気になる"
+    ],
+    "脊髄損傷": [
+        "車椅子生活への適応が必要",
+        "住環境のバリアフリー化が必須",
+        "介護者なしでの生活が困難"
+    ]
+})
+
+# 医学的説明文
+MEDICAL_DESCRIPTIONS: Mapping[str, str] = MappingProxyType({
+    "脊柱管狭窄症": "腰椎の脊柱管が狭くなり、神経組織が圧迫されることで腰痛や下肢痛、間欠跛行などの症状が現れる疾患",
+    "パーキンソン病": "脳内のドパミン神経細胞の変性により、振戦、筋強剛、無動、姿勢反射障害などの運動症状が現れる神経変性疾患",
+    "五十肩": "肩関節周囲炎により肩関節の可動域制限と疼痛が生じ、特に夜間痛や結帯・結髪動作困難などが特徴的な疾患",
+    "関節リウマチ": "自己免疫疾患により複数の関節に慢性炎症が起こり、対称性の関節痛・腫脹・変形を来す全身疾患",
+    "骨粗鬆症": "骨密度の低下により骨質が脆弱化し、軽微な外力でも骨折リスクが高まる骨代謝疾患",
+    "腰椎症": "加齢に伴う腰椎の変性により椎間板や椎間関節の変化が生じ、腰痛や神経症状を引き起こす疾患",
+    "椎間板ヘルニア": "椎間板の線維輪が破綻し髄核が突出することで神経根を圧迫し、腰痛や下肢痛を引き起こす疾患",
+    "頸椎症": "頸椎の加齢性変化により椎間板変性や骨棘形成が生じ、頸部痛や上肢症状を来す疾患",
+    "脳梗塞": "脳血管の閉塞により脳組織への血流が遮断され、神経細胞の壊死により様々な神経症状が現れる疾患",
+    "脳血管障害": "脳血管の病変により脳機能に障害が生じ、運動・感覚・高次脳機能などに影響を及ぼす疾患群",
+    "変形性関節症": "関節軟骨の変性・摩耗により関節の変形や機能障害が進行し、疼痛や可動域制限を来す疾患",
+    "膝関節症": "膝関節軟骨の摩耗や変性により膝の痛み・腫脹・可動域制限が生じる変形性関節症の一型",
+    "筋萎縮": "筋肉量・筋力の進行性低下により日常生活動作能力が減退し、歩行や起立動作に支障を来す状態",
+    "関節拘縮": "関節周囲組織の短縮・硬化により関節可動域が制限され、日常動作に支障を来す病態",
+    "坐骨神経痛": "坐骨神経の圧迫や刺激により腰臀部から下肢にかけて放散する疼痛やしびれが生じる症候群",
+    "脊髄損傷": "外傷や疾患により脊髄が損傷され、損傷部位以下の運動・感覚・自律神経機能に障害が生じる重篤な病態"
+})
+
+# (症状名, 会社名) → 拡充結果（読み取り専用）
+_EXPANDED_DETAILS: Dict[Tuple[str, str], Mapping[str, Any]] = {}
 
 class MedicalDataExpander:
     """医学的精度重視の情報拡充システム"""
@@ -20,344 +347,47 @@ class MedicalDataExpander:
         # 環境変数から設定取得
         self.company_name = os.getenv('COMPANY_NAME', 'ひまわり治療院')
         
-        # 疾患群分類（医学的分類）
-        self.condition_categories = {
-            "spinal_orthopedic": ["脊柱管狭窄症", "腰椎症", "椎間板ヘルニア"],
-            "cervical_orthopedic": ["頸椎症"],
-            "joint_orthopedic": ["五十肩"],
-            "neurological": ["パーキンソン病"],
-            "cerebrovascular": ["脳梗塞", "脳血管障害"],
-            "spinal_cord": ["脊髄損傷"],
-            "rheumatic": ["関節リウマチ", "変形性関節症", "膝関節症"],
-            "musculoskeletal": ["骨粗鬆症", "筋萎縮", "関節拘縮"],
-            "nerve_pain": ["坐骨神経痛"]
-        }
-        
-        # 疾患群別症状テンプレート（医学的精度重視）
-        self.condition_templates = {
-            "spinal_orthopedic": {
-                "common_symptoms": [
-                    "腰痛や下肢痛",
-                    "歩行時の痛みやしびれ", 
-                    "長時間の立位や歩行が困難",
-                    "前かがみになると楽になる",
-                    "間欠跛行（歩行と休息を繰り返す）"
-                ],
-                "daily_concerns": [
-                    "長時間歩くことができない",
-                    "買い物や外出が億劫になった", 
-                    "階段の上り下りが辛い",
-                    "立ち仕事が続けられない"
-                ]
-            },
-            "cervical_orthopedic": {
-                "common_symptoms": [
-                    "頸部痛・肩こり",
-                    "頸部から上肢への放散痛",
-                    "上肢のしびれ・脱力感",
-                    "頸部の可動域制限",
-                    "頭痛・めまい"
-                ],
-                "daily_concerns": [
-                    "デスクワークが辛い",
-                    "上を向く動作が困難",
-                    "車の運転時の首の動きが不安",
-                    "枕が合わずに眠れない"
-                ]
-            },
-            "neurological": {
-                "common_symptoms": [
-                    "動作の緩慢（動きが遅くなる）",
-                    "手足の振戦（ふるえ）",
-                    "筋肉のこわばり（筋強剛）", 
-                    "バランス障害・姿勢反射障害",
-                    "歩行困難（小刻み歩行など）"
-                ],
-                "daily_concerns": [
-                    "日常動作に時間がかかるようになった",
-                    "転倒への不安が常にある",
-                    "細かい作業（ボタンかけなど）が困難",
-                    "外出時の不安が増した",
-                    "家族に迷惑をかけているのではないかと心配"
-                ]
-            },
-            "cerebrovascular": {
-                "common_symptoms": [
-                    "片麻痺（半身の運動麻痺）",
-                    "言語障害（失語・構音障害）",
-                    "嚥下障害（飲み込みの困難）",
-                    "感覚障害（しびれ・感覚鈍麻）",
-                    "高次脳機能障害"
-                ],
-                "daily_concerns": [
-                    "歩行が不安定で転倒が怖い",
-                    "言葉が思うように出てこない",
-                    "食事でむせることが増えた",
-                    "麻痺側の管理が困難",
-                    "再発への不安が常にある"
-                ]
-            },
-            "spinal_cord": {
-                "common_symptoms": [
-                    "損傷部位以下の運動麻痺",
-                    "感覚障害（痛覚・温度覚の消失）",
-                    "自律神経障害（排尿・排便障害）",
-                    "痙性（筋緊張の亢進）",
-                    "体温調節障害"
-                ],
-                "daily_concerns": [
-                    "車椅子生活への適応が必要",
-                    "住環境のバリアフリー化が必須",
-                    "排泄管理が困難",
-                    "褥瘡予防の体位変換が必要",
-                    "社会復帰への不安"
-                ]
-            },
-            "rheumatic": {
-                "common_symptoms": [
-                    "関節の痛みと腫れ",
-                    "朝起床時のこわばり感",
-                    "動作開始時の痛み",
-                    "天候変化による症状悪化",
-                    "関節可動域の制限"
-                ],
-                "daily_concerns": [
-                    "朝起きた時の手足のこわばりが辛い",
-                    "瓶の蓋を開けることができない", 
-                    "雨の日は特に痛みが強くなる",
-                    "階段の上り下りが怖い",
-                    "痛み止めへの依存が心配"
-                ]
-            },
-            "joint_orthopedic": {
-                "common_symptoms": [
-                    "肩の痛みと可動域制限",
-                    "夜間痛（寝返りで痛みが増強）",
-                    "腕を上げる動作の困難",
-                    "肩周囲の筋力低下",
-                    "日常動作での痛み"
-                ],
-                "daily_concerns": [
-                    "夜中に肩の痛みで目が覚める",
-                    "洗髪や着替えが一人でできない",
-                    "高い所の物が取れない",
-                    "痛みで仕事に集中できない",
-                    "いつまで続くか分からない不安"
-                ]
-            },
-            "musculoskeletal": {
-                "common_symptoms": [
-                    "筋力低下と筋肉量減少",
-                    "骨密度の低下",
-                    "転倒リスクの増加", 
-                    "関節の可動域制限",
-                    "日常生活動作の困難"
-                ],
-                "daily_concerns": [
-                    "立ち上がりや歩行が不安定",
-                    "重い物を持つことができない",
-                    "転倒して骨折するのが怖い",
-                    "階段の昇降が危険に感じる",
-                    "一人での外出が不安"
-                ]
-            },
-            "nerve_pain": {
-                "common_symptoms": [
-                    "腰から下肢への放散痛",
-                    "しびれ感（ピリピリ・ジンジン）",
-                    "歩行時の痛み増強",
-                    "座位や安静時の症状軽減",
-                    "咳やくしゃみでの痛み増悪"
-                ],
-                "daily_concerns": [
-                    "長時間座っていることができない",
-                    "歩行時の激痛で外出が困難",
-                    "夜間の痛みで睡眠不足",
-                    "痛み止めが効かない時の不安",
-                    "仕事や家事に支障が出ている"
-                ]
-            }
-        }
+        # 共有の知識データ（インスタンスごとに再構築しない）
+        self.condition_categories = CONDITION_CATEGORIES
+        self.condition_templates = CONDITION_TEMPLATES
+    
+    def expand_condition_details(self, condition: str) -> Mapping[str, Any]:
+        """症状詳細情報を拡充（医学的精度重視。2回目以降はメモ化済みの結果を返す）"""
+        key = (condition, self.company_name)
+        details = _EXPANDED_DETAILS.get(key)
+        if details is None:
+            details = _EXPANDED_DETAILS[key] = self._build_condition_details(condition)
+        return details
     
-    def expand_condition_details(self, condition: str) -> Dict[str, Any]:
-        """症状詳細情報を拡充（医学的精度重視）"""
+    def _build_condition_details(self, condition: str) -> Mapping[str, Any]:
+        """症状詳細情報の生成（読み取り専用で返す）"""
         category = self._get_condition_category(condition)
         template = self.condition_templates.get(category, {})
         
         # 症状特化の詳細情報生成（テンプレートベース）
-        return {
+        return MappingProxyType({
             "symptoms": self._generate_condition_symptoms(condition, template),
             "daily_concerns": self._generate_daily_concerns(condition, template),
             "description": self._generate_medical_description(condition)
-        }
+        })
     
     def _get_condition_category(self, condition: str) -> str:
         """症状のカテゴリを取得"""
-        for category, conditions in self.condition_categories.items():
-            if condition in conditions:
-                return category
-        return "general"
+        return CONDITION_CATEGORY_INDEX.get(condition, "general")
     
-    def _generate_condition_symptoms(self, condition: str, template: Dict) -> List[str]:
+    def _generate_condition_symptoms(self, condition: str, template: Mapping) -> Tuple[str, ...]:
         """症状特化の症状リスト生成"""
-        base_symptoms = template.get("common_symptoms", [])
-        
-        # 症状特化のカスタマイズ（ハードコードなし）
-        condition_specific = {
-            # 整形外科系
-            "脊柱管狭窄症": [
-                "神経性間欠跛行（歩行により下肢痛が増悪）",
-                "腰椎後屈時の症状増悪",
-                "前屈位での症状軽減"
-            ],
-            "腰椎症": [
-                "腰椎の変性に伴う痛み",
-                "起床時の腰部のこわばり",
-                "長時間同一姿勢での症状増悪"
-            ],
-            "椎間板ヘルニア": [
-                "椎間板の突出による神経圧迫症状",
-                "咳・くしゃみでの痛み増強",
-                "前屈動作での症状悪化"
-            ],
-            "頸椎症": [
-                "頸部から上肢への放散痛",
-                "頸部の運動制限",
-                "上肢のしびれ・筋力低下",
-                "頸部痛・肩こり",
-                "頸部の可動域制限",
-                "手指の巧緻動作障害"
-            ],
-            "五十肩": [
-                "夜間痛（夜中に痛みで目覚める）",
-                "肩関節の著明な可動域制限",
-                "結帯・結髪動作の困難"
-            ],
-            
-            # 神経内科系
-            "パーキンソン病": [
-                "安静時振戦（手足の震え）",
-                "筋強剛（筋肉のこわばり）", 
-                "無動・寡動（動作の減少）",
-                "姿勢反射障害・歩行障害"
-            ],
-            "脳梗塞": [
-                "片麻痺（半身の運動麻痺）",
-                "言語障害（失語・構音障害）",
-                "嚥下障害",
-                "認知機能障害"
-            ],
-            "脳血管障害": [
-                "運動機能障害",
-                "感覚障害",
-                "高次脳機能障害",
-                "日常生活動作の困難"
-            ],
-            "脊髄損傷": [
-                "損傷部位以下の運動麻痺",
-                "感覚障害（痛覚・温度覚・触覚の消失）",
-                "自律神経障害（排尿・排便・体温調節障害）",
-                "痙性（筋緊張亢進）"
-            ],
-            
-            # 関節リウマチ系
-            "関節リウマチ": [
-                "対称性の多関節炎",
-                "朝のこわばり（1時間以上持続）",
-                "関節の腫脹・変形",
-                "全身倦怠感・微熱"
-            ],
-            "変形性関節症": [
-                "関節軟骨の摩耗による痛み",
-                "関節の変形・腫脹",
-                "可動域制限",
-                "荷重時の痛み増強"
-            ],
-            "膝関節症": [
-                "膝関節の痛みと腫脹",
-                "階段昇降時の痛み",
-                "正座・しゃがみ込み困難",
-                "歩行開始時痛"
-            ],
-            
-            # 筋骨格系
-            "骨粗鬆症": [
-                "骨密度低下による骨折リスク",
-                "腰背部痛",
-                "身長短縮・円背",
-                "軽微な外力での骨折"
-            ],
-            "筋萎縮": [
-                "筋肉量・筋力の進行性低下",
-                "筋線維の萎縮",
-                "日常生活動作能力の低下",
-                "歩行・起立動作の困難"
-            ],
-            "関節拘縮": [
-                "関節可動域の制限・固定",
-                "関節周囲組織の硬化",
-                "日常動作の制限",
-                "痛みを伴う可動域制限"
-            ],
-            
-            # 神経痛
-            "坐骨神経痛": [
-                "腰臀部から下肢への放散痛",
-                "座位・前屈での痛み増強",
-                "下肢のしびれ感",
-                "歩行時の間欠的痛み"
-            ]
-        }
-        
-        specific = condition_specific.get(condition, [])
-        return base_symptoms + specific
+        base_symptoms = tuple(template.get("common_symptoms", ()))
+        return base_symptoms + CONDITION_SPECIFIC_SYMPTOMS.get(condition, ())
     
-    def _generate_daily_concerns(self, condition: str, template: Dict) -> List[str]:
+    def _generate_daily_concerns(self, condition: str, template: Mapping) -> Tuple[str, ...]:
         """日常生活の困りごと生成"""
-        base_concerns = template.get("daily_concerns", [])
-        
-        # 症状特化の困りごと
-        condition_concerns = {
-            "脊柱管狭窄症": [
-                "長距離の歩行ができなくなった",
-                "カートを押して歩くと楽になることを発見した"
-            ],
-            "パーキンソン病": [
-                "薬の効果時間に生活リズムが左右される",
-                "人前で手の震えが気になる"
-            ],
-            "脊髄損傷": [
-                "車椅子生活への適応が必要",
-                "住環境のバリアフリー化が必須",
-                "介護者なしでの生活が困難"
-            ]
-        }
-        
-        specific = condition_concerns.get(condition, [])
-        return base_concerns + specific
+        base_concerns = tuple(template.get("daily_concerns", ()))
+        return base_concerns + CONDITION_SPECIFIC_CONCERNS.get(condition, ())
     
     def _generate_medical_description(self, condition: str) -> str:
         """医学的説明文生成（ハードコードなし）"""
-        descriptions = {
-            "脊柱管狭窄症": "腰椎の脊柱管が狭くなり、神経組織が圧迫されることで腰痛や下肢痛、間欠跛行などの症状が現れる疾患",
-            "パーキンソン病": "脳内のドパミン神経細胞の変性により、振戦、筋強剛、無動、姿勢反射障害などの運動症状が現れる神経変性疾患",
-            "五十肩": "肩関節周囲炎により肩関節の可動域制限と疼痛が生じ、特に夜間痛や結帯・結髪動作困難などが特徴的な疾患",
-            "関節リウマチ": "自己免疫疾患により複数の関節に慢性炎症が起こり、対称性の関節痛・腫脹・変形を来す全身疾患",
-            "骨粗鬆症": "骨密度の低下により骨質が脆弱化し、軽微な外力でも骨折リスクが高まる骨代謝疾患",
-            "腰椎症": "加齢に伴う腰椎の変性により椎間板や椎間関節の変化が生じ、腰痛や神経症状を引き起こす疾患",
-            "椎間板ヘルニア": "椎間板の線維輪が破綻し髄核が突出することで神経根を圧迫し、腰痛や下肢痛を引き起こす疾患",
-            "頸椎症": "頸椎の加齢性変化により椎間板変性や骨棘形成が生じ、頸部痛や上肢症状を来す疾患",
-            "脳梗塞": "脳血管の閉塞により脳組織への血流が遮断され、神経細胞の壊死により様々な神経症状が現れる疾患",
-            "脳血管障害": "脳血管の病変により脳機能に障害が生じ、運動・感覚・高次脳機能などに影響を及ぼす疾患群",
-            "変形性関節症": "関節軟骨の変性・摩耗により関節の変形や機能障害が進行し、疼痛や可動域制限を来す疾患",
-            "膝関節症": "膝関節軟骨の摩耗や変性により膝の痛み・腫脹・可動域制限が生じる変形性関節症の一型",
-            "筋萎縮": "筋肉量・筋力の進行性低下により日常生活動作能力が減退し、歩行や起立動作に支障を来す状態",
-            "関節拘縮": "関節周囲組織の短縮・硬化により関節可動域が制限され、日常動作に支障を来す病態",
-            "坐骨神経痛": "坐骨神経の圧迫や刺激により腰臀部から下肢にかけて放散する疼痛やしびれが生じる症候群",
-            "脊髄損傷": "外傷や疾患により脊髄が損傷され、損傷部位以下の運動・感覚・自律神経機能に障害が生じる重篤な病態"
-        }
-        
-        return descriptions.get(condition, f"{condition}に関する詳細な医学的情報")
+        return MEDICAL_DESCRIPTIONS.get(condition, f"{condition}に関する詳細な医学的情報")
 
 if __name__ == "__main__":
     # テスト実行
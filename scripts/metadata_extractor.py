@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+記事メタデータ一括抽出
+カテゴリ判定語・区名・症状名をまとめた1つのキーワードオートマトンで記事を1回だけ走査し、
+タイトル・カテゴリ・地域・症状を抽出する（従来の if/in 連鎖と同じ優先順位）
+
+短い記事では平均が従来の if/in 連鎖より 1〜2 割遅い（早期に一致する in 走査に正規表現の
+1回走査が及ばない）。判定語が見つからない記事でも走査は1回で済むため p99 は下がり、
+判定語・区名・症状名を増やしても走査回数が増えない点を優先している
+"""
+
+import re
+from typing import Dict, List, Any, Optional, Iterable, Tuple
+
+from keyword_automaton import KeywordAutomaton
+
+# カテゴリ判定ルール（上から順に優先）
+CATEGORY_RULES: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("symptom_guide", ("症状解説", "でお悩みの方へ")),
+    ("prevention", ("セルフケア", "予防")),
+    ("qa", ("よくある質問", "FAQ")),
+    ("case_study", ("ケア事例", "事例")),
+    ("competitive_analysis", ("競合分析", "選び方")),
+    ("experience_story", ("体験談", "あなたへ")),
+)
+DEFAULT_CATEGORY = "symptom_guide"
+
+# 地域名候補（先に並ぶものを優先）
+AREA_CANDIDATES: Tuple[str, ...] = (
+    "住吉区", "北区", "天王寺区", "浪速区", "中央区", "都島区", "此花区",
+    "旭区", "城東区", "生野区", "鶴見区", "住之江区", "大正区", "東成区",
+    "西成区", "港区", "西区", "福島区", "淀川区", "東淀川区", "西淀川区",
+    "阿倍野区", "東住吉区", "平野区"
+)
+
+# 症状名候補（先に並ぶものを優先）
+CONDITION_CANDIDATES: Tuple[str, ...] = (
+    "パーキンソン病", "脳血管障害", "関節拘縮", "筋萎縮", "骨粗鬆症",
+    "椎間板ヘルニア", "脊柱管狭窄症", "坐骨神経痛", "変形性関節症",
+    "リウマチ", "五十肩", "頸椎症", "腰痛症", "脊髄損傷", "廃用症候群",
+    "その他"
+)
+
+TITLE_PATTERN = re.compile(r'^#\s+(.+)$', re.MULTILINE)
+UNDETECTED_TITLE = "タイトル未検出"
+
+class ArticleMetadataExtractor:
+    """記事メタデータ抽出器（タイトル・カテゴリ・地域・症状）"""
+
+    def __init__(self, category_rules=CATEGORY_RULES, areas: Iterable[str] = AREA_CANDIDATES,
+                 conditions: Iterable[str] = CONDITION_CANDIDATES, default_category: str = DEFAULT_CATEGORY):
+        self.default_category = default_category
+        self.areas = tuple(areas)
+        self.conditions = tuple(conditions)
+
+        # キーワード → ((役割, 優先順位), ...)  役割: 0=カテゴリ, 1=地域, 2=症状
+        self._categories = tuple(category for category, _ in category_rules)
+        self._roles: Dict[str, Tuple[Tuple[int, int], ...]] = {}
+        candidates = (
+            [(marker, rank) for rank, (_, markers) in enumerate(category_rules) for marker in markers],
+            list((area, rank) for rank, area in enumerate(self.areas)),
+            list((condition, rank) for rank, condition in enumerate(self.conditions)),
+        )
+        for role, keywords in enumerate(candidates):
+            ranks: Dict[str, int] = {}
+            for keyword, rank in keywords:
+                ranks.setdefault(keyword, rank)  # 重複時は上位を採用
+            for keyword, rank in ranks.items():
+                self._roles[keyword] = self._roles.get(keyword, ()) + ((role, rank),)
+
+        self.automaton = KeywordAutomaton(self._roles)
+
+    def extract(self, content: str) -> Dict[str, Any]:
+        """記事内容分析"""
+        # タイトルは最初の見出しで探索が止まるため記事先頭のみ参照
+        title_match = TITLE_PATTERN.search(content)
+
+        best: List[Optional[int]] = [None, None, None]
+        for keyword in self.automaton.find_all(content):
+            for role, rank in self._roles[keyword]:
+                if best[role] is None or rank < best[role]:
+                    best[role] = rank
+
+        category_rank, area_rank, condition_rank = best
+        return {
+            'title': title_match.group(1).strip() if title_match else UNDETECTED_TITLE,
+            'category': self.default_category if category_rank is None else self._categories[category_rank],
+            'area': None if area_rank is None else self.areas[area_rank],
+            'condition': None if condition_rank is None else self.conditions[condition_rank]
+        }
+
+_default_extractor: Optional[ArticleMetadataExtractor] = None
+
+def extract_metadata(content: str) -> Dict[str, Any]:
+    """既定ルールでのメタデータ抽出（抽出器は初回呼び出し時に1度だけ構築）"""
+    global _default_extractor
+    if _default_extractor is None:
+        _default_extractor = ArticleMetadataExtractor()
+    return _default_extractor.extract(content)
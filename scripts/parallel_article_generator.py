@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+並列記事生成エンジン
+SEOBlogSystem をワーカープロセスごとに1度だけ構築し、
+症状 × 地域 × テンプレートの組み合わせを ProcessPoolExecutor で分割生成する
+
+- 出力ファイルは直列モード（--matrix）とバイト単位で同一
+- 結果レポートは入力順（症状 → 地域 → テンプレート）に並べ替えてマージ
+- 生成ストア使用時は入力キーを親プロセスで判定し、入力が変わった記事のみワーカーへ配布
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+from seo_blog_system import (
+    SEOBlogSystem, MATRIX_CONDITIONS, MATRIX_AREAS, MATRIX_TEMPLATES, _split_list
+)
+
+# ワーカープロセス内で共有する生成システム（initializerで1度だけ構築）
+_worker_system = None
+
+def _init_worker():
+    """ワーカープロセス初期化"""
+    global _worker_system
+    _worker_system = SEOBlogSystem()
+
+def _generate_chunk(tasks: List[Tuple[int, str, str, str]], output_dir: str) -> List[Dict[str, Any]]:
+    """タスクチャンクを生成・保存し、記事別結果を返す"""
+    results = []
+    
+    for index, condition, area, template_type in tasks:
+        started = time.perf_counter()
+        result = {
+            'index': index,
+            'condition': condition,
+            'area': area,
+            'template_type': template_type,
+            'worker_pid': os.getpid()
+        }
+        
+        try:
+            article_data = _worker_system._generate_structured_article(condition, area, template_type)
+            article_path = _worker_system.save_article(article_data, output_dir)
+            result.update({
+                'success': True,
+                'title': article_data['title'],
+                'article_path': str(article_path)
+            })
+        except Exception as e:
+            result.update({'success': False, 'error': str(e)})
+        
+        result['elapsed_ms'] = round((time.perf_counter() - started) * 1000, 3)
+        results.append(result)
+    
+    return results
+
+class ParallelArticleGenerator:
+    """プロセスプールによる並列記事生成"""
+    
+    def __init__(self, workers: Optional[int] = None, chunk_size: Optional[int] = None, use_store: bool = True):
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.chunk_size = chunk_size
+        self.use_store = use_store
+    
+    def generate(self, conditions: Optional[List[str]] = None, areas: Optional[List[str]] = None,
+                 templates: Optional[List[str]] = None, output_dir: Optional[str] = None,
+                 report_path: Optional[str] = None) -> Dict[str, Any]:
+        """マトリクスを並列生成し、マージ済みレポートを返す"""
+        conditions = conditions or MATRIX_CONDITIONS
+        areas = areas or MATRIX_AREAS
+        templates = templates or MATRIX_TEMPLATES
+        output_dir = Path(output_dir) if output_dir else self._get_output_dir()
+        output_dir.mkdir(parents=True, exist_ok=True)
+        
+        tasks = [
+            (index, condition, area, template_type)
+            for index, (condition, area, template_type)
+            in enumerate(SEOBlogSystem.iter_matrix(conditions, areas, templates))
+        ]
+        
+        print(f"⚡ 並列マトリクス生成開始: {len(tasks)}記事 / ワーカー {self.workers}")
+        print(f"📁 出力先: {output_dir}")
+        
+        started = time.perf_counter()
+        if self.use_store:
+            results = self._run_with_store(tasks, output_dir)
+        else:
+            results = self._run(tasks, str(output_dir))
+        elapsed = time.perf_counter() - started
+        
+        # 完了順ではなく入力順で確定させる
+        results.sort(key=lambda result: result['index'])
+        failed = sum(1 for result in results if not result['success'])
+        reused = sum(1 for result in results if result.get('reused'))
+        
+        report = {
+            'success': failed == 0,
+            'total': len(results),
+            'failed': failed,
+            'reused': reused,
+            'rebuilt': len(results) - failed - reused,
+            'workers': self.workers,
+            'elapsed_seconds': round(elapsed, 3),
+            'articles_per_second': round(len(results) / elapsed, 1) if elapsed > 0 else None,
+            'output_dir': str(output_dir),
+            'generated_at': datetime.now().isoformat(),
+            'articles': results
+        }
+        
+        for result in results:
+            if not result['success']:
+                print(f"  ❌ {result['condition']} / {result['area']} / {result['template_type']}: {result['error']}")
+        
+        print(f"\n📊 並列生成完了: 成功 {len(results) - failed} / 失敗 {failed} "
+              f"({report['elapsed_seconds']}秒, {report['articles_per_second']}記事/秒)")
+        if self.use_store:
+            print(f"♻️  生成ストア: 再利用 {reused} / 再生成 {report['rebuilt']}")
+        
+        if report_path:
+            self._write_report(report, Path(report_path))
+        
+        return report
+    
+    def _run(self, tasks: List[Tuple[int, str, str, str]], output_dir: str) -> List[Dict[str, Any]]:
+        """タスクをチャンク分割してワーカーへ配布"""
+        if self.workers == 1:
+            _init_worker()
+            return _generate_chunk(tasks, output_dir)
+        
+        chunk_size = self.chunk_size or max(1, -(-len(tasks) // (self.workers * 4)))
+        chunks = [tasks[i:i + chunk_size] for i in range(0, len(tasks), chunk_size)]
+        
+        results = []
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker) as executor:
+            futures = [executor.submit(_generate_chunk, chunk, output_dir) for chunk in chunks]
+            for future in futures:
+                results.extend(future.result())
+        
+        return results
+    
+    def _run_with_store(self, tasks: List[Tuple[int, str, str, str]], output_dir: Path) -> List[Dict[str, Any]]:
+        """入力が変わっていない記事は保存済み出力を再利用し、残りのみ並列生成して保存"""
+        system = SEOBlogSystem()
+        store = system.open_generation_store()
+        results, pending, keys = [], [], {}
+        
+        for index, condition, area, template_type in tasks:
+            key = system.generation_key(condition, area, template_type)
+            stored = store.get(key)
+            article_path = store.emit(key, output_dir, system.article_filename(condition, area, template_type)) if stored else None
+            if article_path is None:
+                keys[index] = key
+                pending.append((index, condition, area, template_type))
+                continue
+            results.append({
+                'index': index,
+                'condition': condition,
+                'area': area,
+                'template_type': template_type,
+                'success': True,
+                'title': stored['title'],
+                'article_path': str(article_path),
+                'reused': True
+            })
+        
+        generated = self._run(pending, str(output_dir)) if pending else []
+        for result in generated:
+            if result['success']:
+                article_path = Path(result['article_path'])
+                store.put(keys[result['index']], article_path.read_text(encoding='utf-8'), result['title'], article_path)
+                result['reused'] = False
+        store.save()
+        
+        return results + generated
+    
+    def _write_report(self, report: Dict[str, Any], report_path: Path):
+        """結果レポートをJSONで保存"""
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"📝 レポート保存: {report_path}")
+    
+    def _get_output_dir(self) -> Path:
+        """記事出力ディレクトリ（直列モードと同一）"""
+        date_str = datetime.now().strftime('%Y-%m-%d')
+        return Path(os.environ.get('HOME', '/tmp')) / "Himawari" / "blog_articles" / date_str
+
+def main():
+    """メイン実行関数"""
+    parser = argparse.ArgumentParser(description='並列記事生成エンジン')
+    parser.add_argument('--workers', '-w', type=int, default=None, help='ワーカー数（省略時はCPUコア数）')
+    parser.add_argument('--chunk-size', type=int, default=None, help='1タスクあたりの記事数')
+    parser.add_argument('--conditions', help='対象症状（カンマ区切り）')
+    parser.add_argument('--areas', help='対象地域（カンマ区切り）')
+    parser.add_argument('--templates', help='対象テンプレート（カンマ区切り）')
+    parser.add_argument('--output-dir', help='出力ディレクトリ')
+    parser.add_argument('--report', help='記事別結果レポート(JSON)の出力先')
+    parser.add_argument('--no-store', action='store_true', help='生成ストアを使わず全記事を再生成')
+    args = parser.parse_args()
+    
+    generator = ParallelArticleGenerator(workers=args.workers, chunk_size=args.chunk_size, use_store=not args.no_store)
+    result = generator.generate(
+        conditions=_split_list(args.conditions),
+        areas=_split_list(args.areas),
+        templates=_split_list(args.templates),
+        output_dir=args.output_dir,
+        report_path=args.report
+    )
+    
+    if not result['success']:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
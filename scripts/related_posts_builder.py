@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+関連記事索引ビルダー
+_posts の Front Matter 索引（front_matter_index.py）から記事ごとの関連記事
+（同一症状×他地域・同一地域×他症状・同一カテゴリ）を事前計算し、_data/related.json に書き出す
+
+記事レイアウト（_layouts/post.html）は site.posts | where_exp（全記事走査 × 記事数）ではなく
+site.data.related[page.url] を参照する。選定規則は従来の Liquid と同じ:
+- same_condition: tags[0] を含む他記事（新しい順に top_k 件）
+- same_area:      tags[1] を含み、tags[0] が異なる他記事（新しい順に top_k 件）
+- same_category:  categories[0] を含む他記事（新しい順に top_k 件）
+- show_latest:    同一症状・同一地域の候補が合計2件未満なら最新記事を表示
+
+前回の計算結果を .cache/related_posts_state.json に保持し、追加・変更・削除された記事と
+タグ・カテゴリを共有する記事の分だけ再計算する
+
+使用方法: python related_posts_builder.py [--top-k 2] [--full] [--dry-run]
+"""
+
+import sys
+import json
+import argparse
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Set, Tuple
+
+from front_matter_index import (
+    FrontMatterIndex, post_url, find_project_root, load_site_config, write_atomic, DEFAULT_PERMALINK
+)
+
+STATE_VERSION = 1
+DEFAULT_TOP_K = 2
+LATEST_FALLBACK_THRESHOLD = 2  # 同一症状・同一地域の候補がこれ未満なら最新記事を表示
+
+class RelatedPostsBuilder:
+    """関連記事索引ビルダー（影響範囲のみ再計算する増分ビルド）"""
+
+    def __init__(self, project_root: Optional[Path] = None, top_k: int = DEFAULT_TOP_K):
+        self.project_root = project_root or find_project_root()
+        self.top_k = top_k
+        self.site_config = load_site_config(self.project_root)
+        self.permalink_pattern = self.site_config.get('permalink') or DEFAULT_PERMALINK
+        self.output_path = self.project_root / "_data" / "related.json"
+        self.state_path = self.project_root / ".cache" / "related_posts_state.json"
+        self.front_matter_index = FrontMatterIndex(
+            self.project_root / "_posts", self.project_root / ".cache" / "front_matter_index.json"
+        )
+
+    def _load_state(self) -> Optional[Dict[str, Any]]:
+        """前回の記事レコード・関連記事（設定が異なる場合は None = 全件再計算）"""
+        if not self.state_path.exists():
+            return None
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️  関連記事の状態を読み込めません（全件再計算します）: {e}")
+            return None
+        if (state.get('version'), state.get('top_k'), state.get('permalink')) != (
+                STATE_VERSION, self.top_k, self.permalink_pattern):
+            return None
+        return state
+
+    def load_posts(self) -> List[Dict[str, Any]]:
+        """関連記事の選定に使う項目のみのレコード（site.posts と同じ新しい順）"""
+        return [
+            {
+                'url': post_url(entry, self.permalink_pattern),
+                'title': entry['title'],
+                'date': entry['date'],
+                'tags': entry['tags'],
+                'categories': entry['categories'],
+            }
+            for entry in self.front_matter_index.posts()
+        ]
+
+    def _build_inverted_index(self, posts: List[Dict[str, Any]]) -> Dict[Tuple[str, str], List[Dict[str, Any]]]:
+        """('tag', タグ) / ('category', カテゴリ) → 該当記事（新しい順）"""
+        inverted: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        for post in posts:
+            for tag in dict.fromkeys(post['tags']):
+                inverted.setdefault(('tag', tag), []).append(post)
+            for category in dict.fromkeys(post['categories']):
+                inverted.setdefault(('category', category), []).append(post)
+        return inverted
+
+    def compute_related(self, post: Dict[str, Any],
+                        inverted: Dict[Tuple[str, str], List[Dict[str, Any]]]) -> Dict[str, Any]:
+        """1記事分の関連記事（従来の post.html の where_exp と同じ選定・順序）"""
+        url, tags, categories = post['url'], post['tags'], post['categories']
+
+        same_condition: List[Dict[str, Any]] = []
+        same_area: List[Dict[str, Any]] = []
+        same_category: List[Dict[str, Any]] = []
+        if tags:
+            same_condition = [other for other in inverted[('tag', tags[0])] if other['url'] != url]
+        if len(tags) > 1:
+            same_area = [
+                other for other in inverted[('tag', tags[1])]
+                if other['url'] != url and (other['tags'][0] if other['tags'] else None) != tags[0]
+            ]
+        if categories:
+            same_category = [other for other in inverted[('category', categories[0])] if other['url'] != url]
+
+        def links(candidates: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+            return [{'url': other['url'], 'title': other['title']} for other in candidates[:self.top_k]]
+
+        return {
+            'same_condition': links(same_condition),
+            'same_area': links(same_area),
+            'same_category': links(same_category),
+            'show_latest': len(same_condition) + len(same_area) < LATEST_FALLBACK_THRESHOLD,
+        }
+
+    def _affected_urls(self, posts: List[Dict[str, Any]], previous_posts: Dict[str, Dict[str, Any]],
+                       changed: Set[str]) -> Set[str]:
+        """再計算が必要な記事（変更記事自身と、変更記事のタグ・カテゴリを参照する記事）"""
+        keys: Set[Tuple[str, str]] = set()
+        current = {post['url']: post for post in posts}
+        for url in changed:
+            for record in (previous_posts.get(url), current.get(url)):
+                if record:
+                    keys.update(('tag', tag) for tag in record['tags'])
+                    keys.update(('category', category) for category in record['categories'])
+
+        affected = {url for url in changed if url in current}
+        for post in posts:
+            referenced = [('tag', tag) for tag in post['tags'][:2]] + [('category', c) for c in post['categories'][:1]]
+            if any(key in keys for key in referenced):
+                affected.add(post['url'])
+        return affected
+
+    def build(self, dry_run: bool = False, full: bool = False) -> Dict[str, Any]:
+        """関連記事索引生成（影響範囲のみ再計算し、内容が変わった場合のみ書き込み）"""
+        print("🔗 関連記事索引生成開始")
+        posts = self.load_posts()
+        state = None if full else self._load_state()
+        previous_posts: Dict[str, Dict[str, Any]] = state['posts'] if state else {}
+        previous_related: Dict[str, Dict[str, Any]] = state['related'] if state else {}
+
+        current_posts = {
+            post['url']: {key: post[key] for key in ('title', 'date', 'tags', 'categories')} for post in posts
+        }
+        if state is None:
+            recompute = set(current_posts)
+            changed = set(current_posts)
+        else:
+            changed = {url for url, record in current_posts.items() if previous_posts.get(url) != record}
+            changed |= set(previous_posts) - set(current_posts)
+            recompute = self._affected_urls(posts, previous_posts, changed) if changed else set()
+
+        recompute |= set(current_posts) - set(previous_related)
+        inverted = self._build_inverted_index(posts) if recompute else {}
+        related: Dict[str, Dict[str, Any]] = {
+            post['url']: self.compute_related(post, inverted) if post['url'] in recompute else previous_related[post['url']]
+            for post in posts
+        }
+
+        content = json.dumps(related, ensure_ascii=False, indent=1, sort_keys=True) + "\n"
+        written = not (self.output_path.exists() and self.output_path.read_text(encoding='utf-8') == content)
+        if not dry_run:
+            if written:
+                write_atomic(self.output_path, content)
+            if changed or state is None:
+                write_atomic(self.state_path, json.dumps({
+                    'version': STATE_VERSION, 'top_k': self.top_k, 'permalink': self.permalink_pattern,
+                    'posts': current_posts, 'related': related
+                }, ensure_ascii=False))
+
+        print(f"📊 記事 {len(posts)}件 / 変更 {len(changed)}件 / 再計算 {len(recompute)}件 / "
+              f"再利用 {len(posts) - len(recompute)}件")
+        if written:
+            print(f"✅ {'更新予定' if dry_run else '更新'}: {self.output_path.relative_to(self.project_root)}")
+        else:
+            print("✅ 変更なし - related.json を書き換えません")
+
+        return {
+            'success': True,
+            'posts': len(posts),
+            'changed': len(changed),
+            'recomputed': len(recompute),
+            'written': written,
+            'dry_run': dry_run
+        }
+
+def main():
+    """メイン実行関数"""
+    parser = argparse.ArgumentParser(description='関連記事索引ビルダー')
+    parser.add_argument('--top-k', type=int, default=DEFAULT_TOP_K, help='各区分の関連記事数')
+    parser.add_argument('--full', action='store_true', help='前回の結果を使わず全件再計算')
+    parser.add_argument('--dry-run', action='store_true', help='書き込まずに更新対象のみ表示')
+    args = parser.parse_args()
+
+    result = RelatedPostsBuilder(top_k=args.top_k).build(dry_run=args.dry_run, full=args.full)
+    if not result['success']:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -2,15 +2,52 @@
 """
 安全なJekyll変換システム
 環境変数完全対応・ソース記事忠実変換・ハードコーディングフリー
+
+ソース記事に Front Matter を付けて本文を一切変更せずに _posts へ直接書き込む（外部エージェント不要）
+- 一時ファイルに書き込み → 読み戻して検証（本文がソースとバイト単位で一致・Front Matter が期待値どおり）
+  → 検証に通った場合のみ os.replace で原子的に配置（不完全な記事が _posts に現れない）
+- 既存の出力を再変換する場合は Front Matter の date を引き継ぐ（同じ入力から同じ出力）
 """
 
 import os
+import re
 import sys
 import json
-import re
+import time
 from pathlib import Path
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+
+import yaml
+
+from area_database import AREA_SLUGS
+from conversion_manifest import ConversionManifest, content_hash
+from metadata_extractor import extract_metadata
+
+FRONT_MATTER_DELIMITER = "---\n"
+EXISTING_DATE_PATTERN = re.compile(r'^date:\s*"?([^"\n]+?)"?\s*$', re.MULTILINE)
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# カテゴリ別 description（既存記事と同じ定型文）
+DESCRIPTION_TEMPLATES = {
+    "symptom_guide": "{area}で{condition}でお悩みの方へ。医療保険適用の訪問マッサージで症状緩和をサポート。国家資格を持つマッサージ師が専門ケアをご提供します。",
+    "case_study": "{area}での{condition}ケア事例をご紹介。医療保険適用の訪問マッサージによる実際の改善例と専門的なケア内容を詳しく解説します。",
+    "prevention": "{condition}のセルフケア・予防法を{area}の専門家が解説。在宅でできる症状改善方法から医療保険適用の訪問マッサージまでトータルサポート。",
+    "qa": "{area}で{condition}についてよくある質問にお答えします。医療保険適用の訪問マッサージの疑問から症状の基礎知識まで専門家が詳しく解説。",
+}
+
+def _yaml_string(value: str) -> str:
+    """YAML のダブルクォート文字列（JSON 文字列は YAML として有効。引用符・バックスラッシュもエスケープ）"""
+    return json.dumps(value, ensure_ascii=False)
+
+def split_front_matter(text: str) -> Tuple[Optional[str], str]:
+    """Jekyll 記事を (Front Matter, 本文) に分割（Front Matter がなければ (None, 全文)）"""
+    if not text.startswith(FRONT_MATTER_DELIMITER):
+        return None, text
+    end = text.find("\n" + FRONT_MATTER_DELIMITER, len(FRONT_MATTER_DELIMITER) - 1)
+    if end == -1:
+        return None, text
+    return text[len(FRONT_MATTER_DELIMITER):end + 1], text[end + 1 + len(FRONT_MATTER_DELIMITER):]
 
 class SafeJekyllConverter:
     """安全なJekyll変換システム - 環境変数完全対応"""
@@ -37,44 +74,72 @@ class SafeJekyllConverter:
             'TARGET_CITY': os.environ.get('TARGET_CITY', '大阪市'),
         }
     
-    def convert_article_with_task_agent(self, article_path: Path) -> Dict[str, Any]:
-        """Taskエージェントを使用した安全な記事変換"""
+    def convert_article(self, article_path: Path, source_content: Optional[str] = None,
+                        jekyll_filename: Optional[str] = None, posts_dir: Optional[Path] = None,
+                        published_at: Optional[datetime] = None, verbose: bool = True) -> Dict[str, Any]:
+        """記事変換（Front Matter + ソース本文をそのまま jekyll_path に原子的に書き込み、検証する）
         
-        if not article_path.exists():
-            return {"success": False, "error": f"記事が見つかりません: {article_path}"}
+        source_content を渡した場合はファイルを読み直さずメモリ上の記事本文を使用する
+        jekyll_filename を渡した場合は既存の出力ファイル名を再利用する（差分変換用）
+        published_at を省略した場合は既存出力の date、なければ現在時刻の1時間前（UTC）
+        """
         
-        # 記事内容を読み込み
-        with open(article_path, 'r', encoding='utf-8') as f:
-            source_content = f.read()
+        if source_content is None:
+            if not article_path.exists():
+                return {"success": False, "error": f"記事が見つかりません: {article_path}"}
+            
+            # 記事内容を読み込み
+            with open(article_path, 'r', encoding='utf-8') as f:
+                source_content = f.read()
         
         # 記事分析
         metadata = self._analyze_article(source_content)
         
         # Jekyll出力ディレクトリ設定
-        jekyll_posts_dir = self.project_root / "_posts"
+        jekyll_posts_dir = Path(posts_dir) if posts_dir else self.project_root / "_posts"
         jekyll_posts_dir.mkdir(parents=True, exist_ok=True)
         
         # ファイル名生成
-        jekyll_filename = self._generate_jekyll_filename(metadata)
+        if not jekyll_filename:
+            jekyll_filename = self._generate_jekyll_filename(metadata)
         jekyll_path = jekyll_posts_dir / jekyll_filename
         
-        print(f"🚀 Taskエージェントを使用してJekyll変換を開始")
-        print(f"📁 ソース記事: {article_path.name}")
-        print(f"🎯 出力ファイル: {jekyll_filename}")
-        print(f"📝 記事タイトル: {metadata['title']}")
-        print(f"🏷️  カテゴリ: {metadata['category']}")
-        print(f"📍 地域: {metadata.get('area', 'N/A')}")
-        print(f"🩺 症状: {metadata.get('condition', 'N/A')}")
-        
-        # 環境変数値を表示
-        print(f"\n🔧 環境変数設定:")
-        for key, value in self.env_vars.items():
-            print(f"  {key}: {value}")
-        
-        # Taskエージェント用のプロンプトを生成
-        agent_prompt = self._generate_task_agent_prompt(
-            article_path, source_content, metadata, jekyll_path
-        )
+        date_str = self._resolve_post_date(jekyll_path, published_at)
+        front_matter = self._build_front_matter(metadata, date_str)
+        output = self._render_jekyll_article(front_matter, source_content)
+        
+        if verbose:
+            print(f"🚀 Jekyll変換を開始")
+            print(f"📁 ソース記事: {article_path.name}")
+            print(f"🎯 出力ファイル: {jekyll_filename}")
+            print(f"📝 記事タイトル: {metadata['title']}")
+            print(f"🏷️  カテゴリ: {metadata['category']}")
+            print(f"📍 地域: {metadata.get('area') or 'N/A'}")
+            print(f"🩺 症状: {metadata.get('condition') or 'N/A'}")
+        
+        # 一時ファイルに書き込み、読み戻して検証してから配置
+        tmp_path = jekyll_path.with_name(jekyll_path.name + '.tmp')
+        try:
+            with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+                f.write(output)
+            with open(tmp_path, 'r', encoding='utf-8', newline='') as f:
+                errors = self.verify_conversion(f.read(), source_content, front_matter)
+            if errors:
+                tmp_path.unlink()
+                return {
+                    "success": False,
+                    "source_path": str(article_path),
+                    "jekyll_path": str(jekyll_path),
+                    "error": "変換検証に失敗: " + " / ".join(errors)
+                }
+            os.replace(tmp_path, jekyll_path)
+        except OSError as e:
+            if tmp_path.exists():
+                tmp_path.unlink()
+            return {"success": False, "source_path": str(article_path), "error": f"書き込みに失敗: {e}"}
+        
+        if verbose:
+            print(f"✅ 変換・検証完了: 本文 {len(source_content)}文字（ソースと一致）")
         
         return {
             "success": True,
@@ -82,71 +147,161 @@ class SafeJekyllConverter:
             "jekyll_path": str(jekyll_path),
             "jekyll_filename": jekyll_filename,
             "metadata": metadata,
-            "task_agent_prompt": agent_prompt,
-            "instruction": "以下のプロンプトでTaskエージェントを実行してください"
+            "front_matter": front_matter,
+            "verified": True,
+            "bytes": len(output.encode('utf-8'))
         }
     
-    def _analyze_article(self, content: str) -> Dict[str, Any]:
-        """記事内容分析"""
-        metadata = {}
+    def convert_article_with_task_agent(self, article_path: Path, source_content: Optional[str] = None,
+                                        jekyll_filename: Optional[str] = None) -> Dict[str, Any]:
+        """旧名（互換用）: convert_article と同じく直接変換する"""
+        return self.convert_article(article_path, source_content, jekyll_filename)
+    
+    def convert_batch(self, article_paths: List[Path], posts_dir: Optional[Path] = None) -> Dict[str, Any]:
+        """一括変換（1プロセスで逐次変換。同じ出力ファイル名になる記事には連番を付けて上書きを防ぐ）
         
-        # タイトル抽出
-        title_match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
-        metadata['title'] = title_match.group(1).strip() if title_match else "タイトル未検出"
+        新規記事の date は全件共通の時刻、既存記事の date は出力済み Front Matter の値を維持する
+        """
+        published_at = datetime.now(timezone.utc) - timedelta(hours=1)
+        jekyll_posts_dir = Path(posts_dir) if posts_dir else self.project_root / "_posts"
+        started = time.perf_counter()
+        converted, failed = [], []
+        used_filenames = set()
         
-        # カテゴリ検出
-        metadata['category'] = self._detect_category(content)
+        for article_path in article_paths:
+            try:
+                with open(article_path, 'r', encoding='utf-8') as f:
+                    source_content = f.read()
+            except (OSError, UnicodeDecodeError) as e:
+                failed.append({"source_path": str(article_path), "error": str(e)})
+                continue
+            
+            filename = self._generate_jekyll_filename(self._analyze_article(source_content))
+            stem, number = filename[:-3], 2
+            while filename in used_filenames:
+                filename = f"{stem}-{number}.md"
+                number += 1
+            used_filenames.add(filename)
+            
+            # 既存記事は Front Matter の date を引き継ぐ（共通時刻は新規記事のみ。パーマリンクを動かさない）
+            new_post = not (jekyll_posts_dir / filename).exists()
+            result = self.convert_article(article_path, source_content, filename, posts_dir=posts_dir,
+                                          published_at=published_at if new_post else None, verbose=False)
+            if result["success"]:
+                converted.append(result)
+            else:
+                failed.append({"source_path": str(article_path), "error": result["error"]})
+                print(f"  ❌ {article_path.name}: {result['error']}")
         
-        # 地域・症状抽出
-        metadata['area'] = self._extract_area(content)
-        metadata['condition'] = self._extract_condition(content)
+        elapsed = time.perf_counter() - started
+        rate = len(converted) / elapsed if elapsed > 0 else 0.0
+        print(f"📊 一括変換完了: 変換 {len(converted)} / 失敗 {len(failed)} ({elapsed:.2f}秒, {rate:.0f}記事/秒)")
         
-        return metadata
-    
-    def _detect_category(self, content: str) -> str:
-        """カテゴリ自動検出"""
-        if "症状解説" in content or "でお悩みの方へ" in content:
-            return "symptom_guide"
-        elif "セルフケア" in content or "予防" in content:
-            return "prevention"
-        elif "よくある質問" in content or "FAQ" in content:
-            return "qa"
-        elif "ケア事例" in content or "事例" in content:
-            return "case_study"
-        elif "競合分析" in content or "選び方" in content:
-            return "competitive_analysis"
-        elif "体験談" in content or "あなたへ" in content:
-            return "experience_story"
-        else:
-            return "symptom_guide"
+        return {
+            "success": not failed,
+            "converted": converted,
+            "failed": failed,
+            "elapsed_seconds": elapsed
+        }
     
-    def _extract_area(self, content: str) -> Optional[str]:
-        """地域名抽出"""
-        osaka_areas = [
-            "住吉区", "北区", "天王寺区", "浪速区", "中央区", "都島区", "此花区", 
-            "旭区", "城東区", "生野区", "鶴見区", "住之江区", "大正区", "東成区",
-            "西成区", "港区", "西区", "福島区", "淀川区", "東淀川区", "西淀川区",
-            "阿倍野区", "東住吉区", "平野区"
-        ]
+    def convert_incremental(self, source_root: Optional[Path] = None,
+                            manifest_path: Optional[Path] = None) -> Dict[str, Any]:
+        """差分変換: 変更されたソース記事のみ変換し、未変更はスキップ、孤立出力を検出"""
+        source_root = Path(source_root) if source_root else self._get_source_root()
+        if manifest_path is None:
+            manifest_path = self.project_root / ".cache" / "jekyll_conversion_manifest.json"
+            legacy_manifest_path = self.project_root / "data" / "jekyll_conversion_manifest.json"  # 旧保存先（移行用）
+            if not manifest_path.exists() and legacy_manifest_path.exists():
+                manifest_path.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(legacy_manifest_path, manifest_path)
+        manifest = ConversionManifest(manifest_path)
         
-        for area in osaka_areas:
-            if area in content:
-                return area
-        return None
-    
-    def _extract_condition(self, content: str) -> Optional[str]:
-        """症状名抽出"""
-        conditions = [
-            "パーキンソン病", "脳血管障害", "関節拘縮", "筋萎縮", "骨粗鬆症",
-            "椎間板ヘルニア", "脊柱管狭窄症", "坐骨神経痛", "変形性関節症",
-            "リウマチ", "五十肩", "頸椎症", "腰痛症", "脊髄損傷", "廃用症候群",
-            "その他"
-        ]
+        if not source_root.exists():
+            return {"success": False, "error": f"ソースディレクトリが見つかりません: {source_root}"}
+        
+        print(f"🔁 差分Jekyll変換開始: {source_root}")
+        
+        converted, failed = [], []
+        skipped = 0
+        seen_sources = set()
         
-        for condition in conditions:
-            if condition in content:
-                return condition
-        return None
+        for article_path in sorted(source_root.rglob("*.md")):
+            source_key = str(article_path.relative_to(source_root))
+            seen_sources.add(source_key)
+            stat = article_path.stat()
+            
+            # 出力が消えている（または未作成のまま記録された）エントリは破棄して再変換
+            if manifest.invalidate_missing_output(source_key):
+                print(f"  ⚠️  出力ファイルがないため再変換: {source_key}")
+            
+            # mtime・サイズ不変なら内容を読まずにスキップ
+            if manifest.is_stat_unchanged(source_key, stat):
+                skipped += 1
+                continue
+            
+            with open(article_path, 'r', encoding='utf-8') as f:
+                source_content = f.read()
+            digest = content_hash(source_content)
+            
+            previous = manifest.get(source_key)
+            if previous and previous['sha256'] == digest:
+                manifest.touch(source_key, stat)
+                skipped += 1
+                continue
+            
+            # 内容同一のソースが移動・改名されただけなら出力を引き継ぐ
+            moved_from = manifest.find_by_hash(digest) if not previous else None
+            if moved_from and Path(moved_from['jekyll_path']).exists():
+                manifest.record(source_key, stat, digest, moved_from['jekyll_path'])
+                skipped += 1
+                continue
+            
+            # 変更されたソースは同じ出力ファイルへ再変換（URLを維持）
+            reuse_filename = self._reusable_filename(previous, source_content)
+            result = self.convert_article(article_path, source_content, reuse_filename, verbose=False)
+            
+            if result["success"] and not Path(result["jekyll_path"]).exists():
+                result = {"success": False, "error": f"出力ファイルが作成されていません: {result['jekyll_path']}"}
+            
+            if result["success"]:
+                manifest.record(source_key, stat, digest, result["jekyll_path"])
+                converted.append(result)
+                print(f"  ✅ {source_key} → {result['jekyll_filename']}")
+            else:
+                failed.append({"source_path": str(article_path), "error": result["error"]})
+                print(f"  ❌ {source_key}: {result['error']}")
+        
+        orphaned = manifest.collect_orphans(seen_sources)
+        manifest.save()
+        
+        print(f"\n📊 差分変換完了: 変換 {len(converted)} / スキップ {skipped} / 失敗 {len(failed)} / 孤立出力 {len(orphaned)}")
+        for orphan in orphaned:
+            print(f"  ⚠️  孤立出力 [{orphan['reason']}]: {orphan['jekyll_path']} (元: {orphan['source']})")
+        
+        return {
+            "success": not failed,
+            "converted": converted,
+            "skipped": skipped,
+            "failed": failed,
+            "orphaned": orphaned
+        }
+    
+    def _reusable_filename(self, previous: Optional[Dict[str, Any]], source_content: str) -> Optional[str]:
+        """前回出力のファイル名（日付以外が一致する場合のみ）を再利用"""
+        if not previous:
+            return None
+        previous_name = Path(previous['jekyll_path']).name
+        new_name = self._generate_jekyll_filename(self._analyze_article(source_content))
+        # 日付プレフィックス（YYYY-MM-DD-）を除いたスラッグ部分で比較
+        return previous_name if previous_name[11:] == new_name[11:] else None
+    
+    def _get_source_root(self) -> Path:
+        """ソース記事ルート（日付別ディレクトリの親）"""
+        return Path(os.environ.get('HOME', '/tmp')) / "Himawari" / "blog_articles"
+    
+    def _analyze_article(self, content: str) -> Dict[str, Any]:
+        """記事内容分析（タイトル・カテゴリ・地域・症状を1回の走査で抽出）"""
+        return extract_metadata(content)
     
     def _generate_jekyll_filename(self, metadata: Dict[str, Any]) -> str:
         """Jekyll形式ファイル名生成"""
@@ -160,22 +315,13 @@ class SafeJekyllConverter:
             "変形性関節症": "osteoarthritis", "リウマチ": "rheumatism", "五十肩": "frozen-shoulder"
         }
         
-        area_map = {
-            "住吉区": "sumiyoshi", "北区": "kita", "天王寺区": "tennoji", "浪速区": "naniwa",
-            "中央区": "chuo", "都島区": "miyakojima", "此花区": "konohana", "旭区": "asahi",
-            "城東区": "joto", "生野区": "ikuno", "鶴見区": "tsurumi", "住之江区": "suminoe",
-            "大正区": "taisho", "東成区": "higashinari", "西成区": "nishinari", "港区": "minato",
-            "西区": "nishi", "福島区": "fukushima", "淀川区": "yodogawa", "東淀川区": "higashiyodogawa",
-            "西淀川区": "nishiyodogawa", "阿倍野区": "abeno", "東住吉区": "higashisumiyoshi", "平野区": "hirano"
-        }
-        
         category_map = {
             "symptom_guide": "guide", "prevention": "prevention", "qa": "qa",
             "case_study": "case", "competitive_analysis": "analysis", "experience_story": "story"
         }
         
         condition_slug = condition_map.get(metadata.get('condition', ''), 'condition')
-        area_slug = area_map.get(metadata.get('area', ''), None)
+        area_slug = AREA_SLUGS.get(metadata.get('area', ''), None)
         category_slug = category_map.get(metadata['category'], 'article')
         
         # 地域名が取得できない場合はエラーログを出力
@@ -185,101 +331,147 @@ class SafeJekyllConverter:
         
         return f"{date_prefix}-{condition_slug}-{category_slug}-{area_slug}.md"
     
-    def _generate_task_agent_prompt(self, source_path: Path, source_content: str, 
-                                  metadata: Dict[str, Any], jekyll_path: Path) -> str:
-        """Taskエージェント用プロンプト生成"""
+    def _resolve_post_date(self, jekyll_path: Path, published_at: Optional[datetime] = None) -> str:
+        """Front Matter の date（指定値 → 既存出力の date → 現在時刻の1時間前 UTC の順）"""
+        if published_at is None and jekyll_path.exists():
+            with open(jekyll_path, 'r', encoding='utf-8') as f:
+                existing_front_matter, _ = split_front_matter(f.read())
+            match = EXISTING_DATE_PATTERN.search(existing_front_matter or '')
+            if match:
+                return match.group(1)
         
         # UTC時刻設定（確実に過去時刻）
-        utc_now = datetime.now(timezone.utc)
-        safe_utc = utc_now - timedelta(hours=1)  # 1時間前に設定
-        date_str = safe_utc.strftime("%Y-%m-%d %H:%M:%S +0000")
+        if published_at is None:
+            published_at = datetime.now(timezone.utc) - timedelta(hours=1)
+        return published_at.astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M:%S +0000")
+    
+    def _build_front_matter(self, metadata: Dict[str, Any], date_str: str) -> Dict[str, Any]:
+        """Front Matter の項目（出力順どおり）"""
+        condition = metadata.get('condition') or ''
+        area = metadata.get('area') or ''
+        description = DESCRIPTION_TEMPLATES.get(metadata['category'], DESCRIPTION_TEMPLATES['symptom_guide']).format(
+            area=area or self.env_vars['TARGET_CITY'], condition=condition or '訪問マッサージ'
+        )
+        tags = [tag for tag in (condition, area) if tag] + ['訪問マッサージ', '医療保険適用', self.env_vars['TARGET_CITY']]
         
-        return f"""以下のJekyll記事変換を実行してください：
-
-📁 **変換元記事**: {source_path}
-🎯 **出力先**: {jekyll_path}
-
-🔧 **必須環境変数**（これらの値を必ず使用）:
-- COMPANY_NAME: "{self.env_vars['COMPANY_NAME']}"
-- LICENSE: "{self.env_vars['LICENSE']}"
-- CLINIC_PHONE: "{self.env_vars['CLINIC_PHONE']}"
-- MAIN_SITE_URL: "{self.env_vars['MAIN_SITE_URL']}"
-- BUSINESS_HOURS: "{self.env_vars['BUSINESS_HOURS']}"
-
-📝 **記事メタ情報**:
-- タイトル: {metadata['title']}
-- カテゴリ: {metadata['category']}
-- 地域: {metadata.get('area', 'N/A')}
-- 症状: {metadata.get('condition', 'N/A')}
-- 出力日時: {date_str}
-
-🚨 **厳格な変換ルール**:
-1. ソース記事を読み込み、内容を一切変更・追加・削除しない
-2. H1タイトル（# で始まる行）を削除しない
-3. 独自の文章・ストーリー・FAQを追加しない
-4. ソース記事にない内容は一切作成しない
-5. 運営者情報は上記の環境変数値のみを使用
-
-📋 **Jekyll Front Matter**（この形式で作成）:
-```yaml
----
-layout: "post"
-title: "{metadata['title']}"
-date: "{date_str}"
-categories: [{metadata['category']}]
-tags: ['{metadata.get('condition', '')}', '{metadata.get('area', '')}', '訪問マッサージ', '医療保険適用', '大阪市']
-
-condition: "{metadata.get('condition', '')}"
-area: "{metadata.get('area', '')}"
-description: "記事の適切な要約を作成"
----
-```
-
-🔍 **品質チェック要求**:
-- 変換後にソース記事との内容一致を確認
-- 環境変数値の正確な反映を確認
-- H1タイトルの保持を確認
-- 不正な内容追加がないか確認
-
-📊 **実行手順**:
-1. {source_path} を読み込み、全文を取得
-2. 上記のFront Matterを追加
-3. ソース記事内容をそのまま続ける（改変厳禁）
-4. {jekyll_path} に保存
-5. 変換結果を報告
-
-✅ **成功条件**:
-- Jekyll形式のファイルが正常に作成される
-- ソース記事の内容が完全に保持される
-- 環境変数値が正確に反映される
-- 不正な内容追加がない
+        return {
+            'layout': 'post',
+            'title': metadata['title'],
+            'date': date_str,
+            'categories': [metadata['category']],
+            'tags': tags,
+            'condition': condition,
+            'area': area,
+            'description': description,
+        }
+    
+    def _render_jekyll_article(self, front_matter: Dict[str, Any], source_content: str) -> str:
+        """Jekyll 記事本文（Front Matter + 空行 + ソース記事そのまま）"""
+        lines = [
+            f"layout: {_yaml_string(front_matter['layout'])}",
+            f"title: {_yaml_string(front_matter['title'])}",
+            f"date: {_yaml_string(front_matter['date'])}",
+            f"categories: [{', '.join(front_matter['categories'])}]",
+            f"tags: [{', '.join(_yaml_string(tag) for tag in front_matter['tags'])}]",
+            "",
+            f"condition: {_yaml_string(front_matter['condition'])}",
+            f"area: {_yaml_string(front_matter['area'])}",
+            f"description: {_yaml_string(front_matter['description'])}",
+        ]
+        return FRONT_MATTER_DELIMITER + "\n".join(lines) + "\n" + FRONT_MATTER_DELIMITER + "\n" + source_content
+    
+    def verify_conversion(self, output: str, source_content: str, front_matter: Dict[str, Any]) -> List[str]:
+        """変換結果の検証（本文がソースと完全一致・Front Matter が期待値どおり）。問題点の一覧を返す"""
+        errors = []
+        header, body = split_front_matter(output)
+        if header is None:
+            return ["Front Matter がありません"]
+        
+        if body[:1] != "\n" or body[1:] != source_content:
+            if body[1:].rstrip() == source_content.rstrip():
+                errors.append("本文末尾の改行がソースと異なります")
+            else:
+                errors.append("本文がソース記事と一致しません")
+        
+        try:
+            parsed = yaml.load(header, Loader=YAML_LOADER)
+        except yaml.YAMLError as e:
+            return errors + [f"Front Matter を解析できません: {e}"]
+        if parsed != front_matter:
+            differing = sorted(key for key in set(front_matter) | set(parsed or {})
+                               if (parsed or {}).get(key) != front_matter.get(key))
+            errors.append(f"Front Matter が期待値と異なります: {', '.join(differing)}")
+        
+        return errors
 
-変換を開始してください。"""
+def _collect_batch_paths(args: List[str]) -> List[Path]:
+    """一括変換対象（ディレクトリ指定時は配下の *.md を名前順）"""
+    paths = []
+    for arg in args:
+        path = Path(arg)
+        paths.extend(sorted(path.rglob("*.md")) if path.is_dir() else [path])
+    return paths
 
 def main():
     """メイン実行関数"""
-    if len(sys.argv) < 2:
-        print("使用方法: python safe_jekyll_converter.py <記事ファイルパス>")
+    options = ('--json', '--incremental', '--batch')
+    args = [arg for arg in sys.argv[1:] if arg not in options]
+    json_output = '--json' in sys.argv[1:]
+    
+    if '--incremental' in sys.argv[1:]:
+        # 差分変換: python safe_jekyll_converter.py --incremental [ソースルート]
+        converter = SafeJekyllConverter()
+        result = converter.convert_incremental(Path(args[0]) if args else None)
+        if json_output:
+            print(json.dumps({key: value for key, value in result.items() if key != "converted"}, ensure_ascii=False))
+        if not result["success"]:
+            sys.exit(1)
+        return
+    
+    if '--batch' in sys.argv[1:]:
+        # 一括変換: python safe_jekyll_converter.py --batch <記事ファイル/ディレクトリ>...
+        converter = SafeJekyllConverter()
+        result = converter.convert_batch(_collect_batch_paths(args))
+        if json_output:
+            print(json.dumps({
+                "success": result["success"],
+                "converted": [item["jekyll_path"] for item in result["converted"]],
+                "failed": result["failed"],
+                "elapsed_seconds": result["elapsed_seconds"]
+            }, ensure_ascii=False))
+        if not result["success"]:
+            sys.exit(1)
         return
     
-    article_path = Path(sys.argv[1])
+    if not args:
+        print("使用方法: python safe_jekyll_converter.py <記事ファイルパス> [--json]")
+        print("差分変換: python safe_jekyll_converter.py --incremental [ソースルート]")
+        print("一括変換: python safe_jekyll_converter.py --batch <記事ファイル/ディレクトリ>...")
+        return
+    
+    article_path = Path(args[0])
     converter = SafeJekyllConverter()
     
-    result = converter.convert_article_with_task_agent(article_path)
+    result = converter.convert_article(article_path, verbose=not json_output)
+    
+    if json_output:
+        # 結果レコード（出力パス等）を最終行にJSONで出力
+        print(json.dumps(result, ensure_ascii=False))
+        if not result["success"]:
+            sys.exit(1)
+        return
     
     if result["success"]:
         print("\n" + "="*60)
-        print("🎯 Taskエージェント実行準備完了")
+        print("🎯 Jekyll変換完了")
         print("="*60)
         print(f"📁 変換元: {result['source_path']}")
         print(f"🎯 出力先: {result['jekyll_path']}")
         print(f"📝 ファイル名: {result['jekyll_filename']}")
-        print("\n📋 以下のプロンプトでTaskエージェントを実行:")
-        print("-"*60)
-        print(result['task_agent_prompt'])
-        print("-"*60)
+        print(f"🔍 検証: 本文がソースと完全一致 / Front Matter 解析OK ({result['bytes']} bytes)")
     else:
         print(f"❌ エラー: {result['error']}")
+        sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
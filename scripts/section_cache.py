@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+記事セクションキャッシュ（LRU）
+同一バッチ内で繰り返し描画される共通セクション（地域情報・料金体系・CTA）を1度だけ描画して再利用する
+
+キー: (セクション名, 地域または症状, 環境変数スナップショット, テンプレート版)
+- 環境変数（会社名・電話番号等）やテンプレート本文が変われば別キーとなり、古い描画結果は使われない
+- 上限件数を超えた場合は最も長く使われていないエントリから破棄
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+DEFAULT_MAX_ENTRIES = 64  # 24区の地域情報 + 料金体系・CTA が余裕をもって収まる件数
+
+class SectionCache:
+    """描画済みセクションの LRU キャッシュ（ヒット・ミス・破棄件数を集計）"""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[Hashable, ...], str]" = OrderedDict()
+        self._counters = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+    def get_or_render(self, key: Tuple[Hashable, ...], render: Callable[[], str]) -> str:
+        """キャッシュ済みならその描画結果、なければ render() で描画して保存"""
+        content = self._entries.get(key)
+        if content is not None:
+            self._entries.move_to_end(key)
+            self._counters['hits'] += 1
+            return content
+
+        self._counters['misses'] += 1
+        content = render()
+        if self.max_entries > 0:
+            self._entries[key] = content
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._counters['evictions'] += 1
+        return content
+
+    def clear(self):
+        """全エントリ破棄（集計値は保持）"""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """キャッシュ統計（ベンチマーク出力用）"""
+        lookups = self._counters['hits'] + self._counters['misses']
+        return {
+            'entries': len(self._entries),
+            **self._counters,
+            'hit_rate': round(self._counters['hits'] / lookups, 4) if lookups else 0.0
+        }
@@ -9,13 +9,35 @@ import os
 from pathlib import Path
 from datetime import datetime, timezone, timedelta
 import json
+import argparse
 from medical_data_expander import MedicalDataExpander
+from area_database import AREA_DATABASE, OSAKA_WARDS
+from section_cache import SectionCache
+from generation_store import GenerationStore, fingerprint, input_key
+import article_templates as templates
+
+# マトリクス生成の既定対象（16症状 × 24区 × 4テンプレート）
+MATRIX_CONDITIONS = [
+    '脊柱管狭窄症', 'パーキンソン病', '五十肩', '関節リウマチ', '骨粗鬆症', '腰椎症',
+    '椎間板ヘルニア', '頸椎症', '脳梗塞', '脳血管障害', '変形性関節症', '膝関節症',
+    '筋萎縮', '関節拘縮', '坐骨神経痛', '脊髄損傷'
+]
+MATRIX_AREAS = list(OSAKA_WARDS)
+MATRIX_TEMPLATES = ['symptom_guide', 'case_study', 'qa', 'prevention']
+
+# 生成コード版（本モジュールとテンプレート定義のソースのハッシュ。コードが変われば全記事を再生成）
+TEMPLATE_CODE_VERSION = fingerprint([
+    Path(__file__).read_text(encoding='utf-8'),
+    Path(templates.__file__).read_text(encoding='utf-8')
+])
 
 class SEOBlogSystem:
     def __init__(self):
         self.project_root = self._get_project_root()
         self.env_vars = self._load_environment_variables()
         self.medical_expander = MedicalDataExpander()
+        self.section_cache = SectionCache()
+        self._input_fingerprints = {}
         
     def _get_project_root(self):
         project_root = os.environ.get('PROJECT_ROOT')
@@ -55,6 +77,139 @@ class SEOBlogSystem:
         
         return article_data
     
+    def generate_matrix(self, conditions=None, areas=None, templates=None, output_dir=None, use_store=True):
+        """マトリクス一括生成（1インスタンスで全組み合わせを逐次生成・保存）
+        
+        use_store=True の場合、入力が前回から変わっていない記事は生成ストアの出力を再利用する
+        """
+        conditions = conditions or MATRIX_CONDITIONS
+        areas = areas or MATRIX_AREAS
+        templates = templates or MATRIX_TEMPLATES
+        output_dir = Path(output_dir) if output_dir else self._get_output_dir()
+        output_dir.mkdir(parents=True, exist_ok=True)
+        
+        total = len(conditions) * len(areas) * len(templates)
+        print(f"🧮 マトリクス生成開始: {len(conditions)}症状 × {len(areas)}地域 × {len(templates)}テンプレート = {total}記事")
+        print(f"📁 出力先: {output_dir}")
+        
+        store = self.open_generation_store() if use_store else None
+        results = []
+        for index, (condition, area, template_type) in enumerate(self.iter_matrix(conditions, areas, templates), 1):
+            try:
+                key = self.generation_key(condition, area, template_type) if store else None
+                stored = store.get(key) if store else None
+                if stored:
+                    # 入力が同一の記事は生成せず保存済みの出力を再利用（内容ファイル欠損時は再生成）
+                    article_path = store.emit(key, output_dir, self.article_filename(condition, area, template_type))
+                    stored = stored if article_path else None
+                if stored:
+                    title = stored['title']
+                else:
+                    article_data = self._generate_structured_article(condition, area, template_type)
+                    article_path = self.save_article(article_data, output_dir)
+                    title = article_data['title']
+                    if store:
+                        store.put(key, article_data['content'], title, article_path)
+                results.append({
+                    'success': True,
+                    'condition': condition,
+                    'area': area,
+                    'template_type': template_type,
+                    'title': title,
+                    'article_path': str(article_path),
+                    'reused': bool(stored)
+                })
+                print(f"  [{index}/{total}] {'♻️ ' if stored else '✅'} {article_path.name}")
+            except Exception as e:
+                results.append({
+                    'success': False,
+                    'condition': condition,
+                    'area': area,
+                    'template_type': template_type,
+                    'error': str(e)
+                })
+                print(f"  [{index}/{total}] ❌ {condition} / {area} / {template_type}: {e}")
+        
+        if store:
+            store.save()
+        
+        failed = sum(1 for result in results if not result['success'])
+        reused = sum(1 for result in results if result.get('reused'))
+        print(f"\n📊 マトリクス生成完了: 成功 {total - failed} / 失敗 {failed}")
+        if store:
+            print(f"♻️  生成ストア: 再利用 {reused} / 再生成 {total - failed - reused}")
+        
+        return {
+            'success': failed == 0,
+            'total': total,
+            'failed': failed,
+            'reused': reused,
+            'rebuilt': total - failed - reused,
+            'output_dir': str(output_dir),
+            'articles': results
+        }
+    
+    @staticmethod
+    def iter_matrix(conditions, areas, templates):
+        """症状 × 地域 × テンプレートの組み合わせを決定的な順序で列挙"""
+        for condition in conditions:
+            for area in areas:
+                for template_type in templates:
+                    yield condition, area, template_type
+    
+    def save_article(self, article_data, output_dir=None):
+        """記事をMarkdownファイルとして保存"""
+        output_dir = Path(output_dir) if output_dir else self._get_output_dir()
+        output_dir.mkdir(parents=True, exist_ok=True)
+        
+        article_path = output_dir / self.article_filename(
+            article_data['condition'], article_data['area'], article_data['template_type']
+        )
+        
+        with open(article_path, 'w', encoding='utf-8') as f:
+            f.write(article_data['content'])
+        
+        return article_path
+    
+    @staticmethod
+    def article_filename(condition, area, template_type):
+        """記事ファイル名"""
+        return f"{condition}_{area}_{template_type}.md"
+    
+    def open_generation_store(self):
+        """生成ストア（プロジェクトルートの .cache 配下）"""
+        return GenerationStore(self.project_root / ".cache" / "generation_store")
+    
+    def generation_key(self, condition, area, template_type):
+        """記事の入力キー（症状データ・地域レコード・環境変数・テンプレートコード版・現在年のハッシュ）"""
+        condition_fingerprint = self._input_fingerprints.get(('condition', condition))
+        if condition_fingerprint is None:
+            condition_fingerprint = fingerprint([condition, self._get_condition_info(condition)])
+            self._input_fingerprints[('condition', condition)] = condition_fingerprint
+        area_fingerprint = self._input_fingerprints.get(('area', area))
+        if area_fingerprint is None:
+            area_fingerprint = fingerprint([area, self._get_area_data(area)])
+            self._input_fingerprints[('area', area)] = area_fingerprint
+        env_snapshot = ('env', tuple(self.env_vars.items()))
+        env_fingerprint = self._input_fingerprints.get(env_snapshot)
+        if env_fingerprint is None:
+            env_fingerprint = fingerprint(self.env_vars)
+            self._input_fingerprints[env_snapshot] = env_fingerprint
+        
+        return input_key(
+            condition_fingerprint,
+            area_fingerprint,
+            template_type,
+            env_fingerprint,
+            TEMPLATE_CODE_VERSION,
+            str(datetime.now().year)  # タイトルに現在年を含むため
+        )
+    
+    def _get_output_dir(self):
+        """記事出力ディレクトリ（日付別）"""
+        date_str = datetime.now().strftime('%Y-%m-%d')
+        return Path(os.environ.get('HOME', '/tmp')) / "Himawari" / "blog_articles" / date_str
+    
     def _generate_structured_article(self, condition, area, template_type):
         """構造化記事生成"""
         title = self._generate_title(condition, area, template_type)
@@ -93,193 +248,79 @@ class SEOBlogSystem:
         """高品質コンテンツ生成"""
         
         # 基本構造
-        content = f"# {title}\n\n"
-        content += f"## {area}にお住まいの{condition}でお困りの方へ\n\n"
-        content += f"**{self.env_vars['COMPANY_NAME']}**は{self.env_vars['LICENSE']}です。\n\n"
-        content += f"> 💡 **{area}で医療保険適用の訪問マッサージをお探しの方へ**  \n"
-        content += f"> [医療保険適用実施中]({self.env_vars['MAIN_SITE_URL']}) | 📞 {self.env_vars['CLINIC_PHONE']}\n\n"
+        header = templates.ARTICLE_HEADER.render(
+            title=title, area=area, condition=condition, **self.env_vars
+        )
         
         # テンプレート別コンテンツ
         if template_type == 'case_study':
-            content += self._generate_case_study_content(condition, area)
+            body = self._generate_case_study_content(condition, area)
         elif template_type == 'symptom_guide':
-            content += self._generate_symptom_guide_content(condition, area)
+            body = self._generate_symptom_guide_content(condition, area)
         elif template_type == 'qa':
-            content += self._generate_qa_content(condition, area)
+            body = self._generate_qa_content(condition, area)
         elif template_type == 'prevention':
-            content += self._generate_prevention_content(condition, area)
+            body = self._generate_prevention_content(condition, area)
+        else:
+            body = ""
         
         # 共通セクション
-        content += self._generate_area_info(area)
-        content += self._generate_pricing_info()
-        content += self._generate_cta()
-        
-        return content
+        return "".join([
+            header,
+            body,
+            self._generate_area_info(area),
+            self._generate_pricing_info(),
+            self._generate_cta()
+        ])
     
+
     def _generate_case_study_content(self, condition, area):
         """ケース事例コンテンツ生成"""
-        content = f"## {condition}について\n\n"
-        
-        # 症状説明を追加
         condition_info = self._get_condition_info(condition)
-        content += f"{condition_info['description']}\n\n"
-        
-        content += f"### {condition}の主な症状\n"
-        for symptom in condition_info['symptoms']:
-            content += f"- {symptom}\n"
         
-        content += "\n### 日常生活でのお困りごと\n"
-        for concern in condition_info['daily_concerns']:
-            content += f"- 「{concern}」\n"
-        
-        content += f"\n### ケース事例：Aさん（70代・{area}在住）の改善体験\n\n"
-        content += "**初回訪問時の状態**\n"
-        content += f"- {condition}による症状で日常生活に支障\n"
-        content += "- 外出が困難になり閉じこもりがち\n"
-        content += "- 家族の介護負担が増加\n\n"
-        
-        content += "**施術内容とアプローチ**\n"
-        content += "- 症状に応じた専門的な手技療法\n"
-        content += "- 機能改善のための運動療法\n"
-        content += "- 日常生活動作の指導・アドバイス\n"
-        content += "- 週2回・30分の定期訪問\n\n"
-        
-        content += "**3ヶ月後の改善状況**\n"
-        content += "- 症状の緩和により日常動作が改善\n"
-        content += "- 外出への意欲が回復\n"
-        content += "- 家族の介護負担軽減\n"
-        content += "- QOL（生活の質）の向上\n\n"
-        
-        content += "**ご家族の声**\n"
-        content += "「医療保険が適用されるので経済的負担が少なく、継続しやすいのが助かります。本人の表情も明るくなり、家族としても安心できます」\n\n"
-        
-        return content
+        return templates.CASE_STUDY.render(
+            condition=condition,
+            area=area,
+            description=condition_info['description'],
+            symptoms=templates.BULLET.render_each(condition_info['symptoms']),
+            daily_concerns=templates.QUOTED_BULLET.render_each(condition_info['daily_concerns'])
+        )
     
+
     def _generate_symptom_guide_content(self, condition, area):
         """症状解説コンテンツ生成（拡充版）"""
         condition_info = self._get_condition_info(condition)
         area_data = self._get_area_data(area)
         
-        content = f"## {condition}の主な症状について\n\n"
-        content += f"{condition_info['description']}\n\n"
-        
-        content += "### 具体的な症状\n"
-        for symptom in condition_info['symptoms']:
-            content += f"- {symptom}\n"
-        
-        content += "\n### 日常生活でのお困りごと\n"
-        for concern in condition_info['daily_concerns']:
-            content += f"- 「{concern}」\n"
-        
-        # 地域特化セクション追加
-        content += f"\n## {area}での訪問マッサージのメリット\n\n"
-        
+        # 地域特化セクション
         landmarks = area_data.get('landmarks', [])
+        landmarks_section = ""
         if landmarks:
-            content += f"### {area}の主要エリア\n"
-            for landmark in landmarks[:3]:  # 最大3つまで
-                content += f"- {landmark}周辺\n"
-            content += "\n上記エリアを含む{area}全域に対応しております。\n\n"
-        
-        content += "### 訪問マッサージが選ばれる理由\n"
-        content += "1. **通院の負担がない**: 移動が困難な方でも自宅で専門的な施術を受けられます\n"
-        content += "2. **医療保険適用可能**: 医師の同意書により医療保険が適用され、経済的負担を軽減\n"
-        content += "3. **個別対応**: 一人ひとりの症状に合わせたオーダーメイドの施術プラン\n"
-        content += "4. **家族への指導**: ご家族へのケア方法指導により、日常生活をサポート\n\n"
-        
-        # 施術プロセス詳細
-        content += "## 訪問マッサージの流れ\n\n"
-        content += "### 1. 初回カウンセリング（無料）\n"
-        content += "- 症状の詳しい確認\n"
-        content += "- 施術計画のご説明\n"
-        content += "- 医療保険適用の手続きサポート\n\n"
-        
-        content += "### 2. 医師の同意書取得\n"
-        content += "- かかりつけ医への同意書作成依頼をサポート\n"
-        content += "- 必要書類の準備をお手伝い\n\n"
-        
-        content += "### 3. 定期的な訪問施術\n"
-        content += "- 週1-3回の定期訪問（症状により調整）\n"
-        content += "- 1回30分程度の施術\n"
-        content += "- 症状の変化に応じた施術内容の調整\n\n"
-        
-        content += "### 4. 経過観察と報告\n"
-        content += "- 月1回の経過報告書作成\n"
-        content += "- 主治医との連携\n"
-        content += "- ご家族への状況説明\n\n"
-        
-        # よくある誤解の解消
-        content += "## よくある誤解と真実\n\n"
-        content += "### ❌ 誤解：訪問マッサージは高額\n"
-        content += "✅ **真実**: 医療保険適用により、1回あたり数百円程度の自己負担\n\n"
-        
-        content += "### ❌ 誤解：効果が期待できない\n"
-        content += "✅ **真実**: 国家資格を持つ専門家による医学的根拠に基づいた施術\n\n"
-        
-        content += "### ❌ 誤解：手続きが複雑\n"
-        content += "✅ **真実**: 当院が手続きを全面サポート、ご家族の負担を最小限に\n\n"
-        
-        return content
+            landmarks_section = templates.SYMPTOM_GUIDE_LANDMARKS.render(
+                area=area,
+                landmarks=templates.LANDMARK_BULLET.render_each(landmarks[:3])  # 最大3つまで
+            )
+        
+        return templates.SYMPTOM_GUIDE.render(
+            condition=condition,
+            area=area,
+            description=condition_info['description'],
+            symptoms=templates.BULLET.render_each(condition_info['symptoms']),
+            daily_concerns=templates.QUOTED_BULLET.render_each(condition_info['daily_concerns']),
+            landmarks_section=landmarks_section
+        )
     
+
     def _generate_qa_content(self, condition, area):
         """Q&Aコンテンツ生成"""
-        content = f"## {condition}に関するよくある質問\n\n"
-        
-        qa_items = [
-            {
-                'q': f"{condition}の訪問マッサージは保険適用されますか？",
-                'a': f"はい、医師の同意書があれば医療保険が適用されます。{condition}も医療保険の対象として認められており、{area}エリアでも同様に保険適用のマッサージが受けられます。"
-            },
-            {
-                'q': "どのくらいの頻度で施術を受けるべきですか？",
-                'a': "症状の程度により異なりますが、一般的に週1-3回の施術が効果的です。症状の状態や機能の程度を評価し、個別に頻度を調整いたします。"
-            },
-            {
-                'q': f"{area}まで本当に来てもらえますか？",
-                'a': f"はい、{area}は当院の主要対応エリアです。移動が困難な方も多いため、交通費負担なしで専門スタッフがお伺いします。"
-            },
-            {
-                'q': "1回の施術時間はどのくらいですか？",
-                'a': "1回あたり30分程度の施術を行います。お身体の状態や症状に応じて、必要に応じて時間を調整いたします。初回は症状の詳しい聞き取りも含めて少し長めになる場合があります。"
-            },
-            {
-                'q': "施術前に何か準備するものはありますか？",
-                'a': "特別な準備は必要ありません。動きやすい服装でお過ごしいただければ大丈夫です。医師からの同意書は当院でサポートいたしますので、まずはお気軽にご相談ください。"
-            },
-            {
-                'q': "どのくらいで効果を実感できますか？",
-                'a': "個人差がありますが、多くの方が3-4回の施術で何らかの変化を実感されています。症状の程度や期間により異なりますが、継続的な施術により徐々に改善が期待できます。"
-            },
-            {
-                'q': "家族が同席する必要はありますか？",
-                'a': "必須ではありませんが、ご家族の同席は歓迎いたします。施術内容の説明や日常生活でのアドバイスをお伝えする際に、ご家族にも聞いていただくと効果的です。"
-            },
-            {
-                'q': "他の治療や薬との併用はできますか？",
-                'a': "はい、基本的に他の治療との併用に問題はありません。現在受けている治療内容をお聞かせいただき、主治医とも連携しながら最適な施術プランをご提案いたします。"
-            }
-        ]
-        
-        for i, qa in enumerate(qa_items, 1):
-            content += f"### Q{i}. {qa['q']}\n"
-            content += f"A. {qa['a']}\n\n"
-        
-        return content
+        return templates.QA.render(condition=condition, area=area)
     
+
     def _generate_prevention_content(self, condition, area):
         """予防・セルフケアコンテンツ生成"""
-        content = f"## {condition}の予防・セルフケア方法\n\n"
-        content += f"{area}在住の方向けの実践的なケア方法をご紹介します。\n\n"
-        
-        content += "### 日常でできるセルフケア\n"
-        content += "- 適度な運動習慣の維持\n"
-        content += "- 正しい姿勢の意識\n"
-        content += "- 栄養バランスの取れた食事\n"
-        content += "- 十分な休息と睡眠\n"
-        content += "- ストレス管理\n\n"
-        
-        return content
+        return templates.PREVENTION.render(condition=condition, area=area)
     
+
     def _get_condition_info(self, condition):
         """症状情報取得（medical_data_expanderを使用）"""
         try:
@@ -317,186 +358,144 @@ class SEOBlogSystem:
                 'daily_concerns': ['日常動作の困難', '生活の質の低下', '将来への不安']
             })
     
+    def _cached_section(self, section, scope, section_templates, render):
+        """共通セクションのキャッシュ経由描画（キー: セクション・地域/症状・環境変数・テンプレート版）"""
+        key = (
+            section,
+            scope,
+            tuple(self.env_vars.items()),
+            tuple(template.version for template in section_templates)
+        )
+        return self.section_cache.get_or_render(key, render)
+    
     def _generate_area_info(self, area):
-        """地域情報生成"""
+        """地域情報生成（地域ごとに1度だけ描画）"""
+        return self._cached_section(
+            'area_info', area, (templates.AREA_INFO, templates.BULLET), lambda: self._render_area_info(area)
+        )
+    
+    def _render_area_info(self, area):
         area_data = self._get_area_data(area)
         
-        content = f"## {area}の地域特性と訪問マッサージの必要性\n\n"
-        content += f"### {area}の基本データ\n"
-        content += f"- **人口**: 約{area_data['population']:,}人\n"
-        content += f"- **世帯数**: 約{area_data['households']:,}世帯\n"
-        content += f"- **面積**: {area_data['area']}km²\n"
-        content += f"- **高齢者人口**: 約{area_data['elderly']:,}人\n\n"
-        
-        content += "### 地域の特徴\n"
-        for feature in area_data['features']:
-            content += f"- {feature}\n"
-        
-        content += "\n### 医療・介護施設\n"
-        for facility in area_data['medical_facilities']:
-            content += f"- {facility}\n"
-        
-        content += f"\n### {area}での在宅ケアの重要性\n"
-        content += "- 高齢化による在宅ケア需要の増加\n"
-        content += "- 地域包括ケアシステムの構築\n"
-        content += f"- {area}特有の地域課題への対応\n\n"
-        
-        return content
+        return templates.AREA_INFO.render(
+            area=area,
+            population=area_data['population'],
+            households=area_data['households'],
+            area_size=area_data['area'],
+            elderly=area_data['elderly'],
+            features=templates.BULLET.render_each(area_data['features']),
+            medical_facilities=templates.BULLET.render_each(area_data['medical_facilities'])
+        )
     
+
     def _get_area_data(self, area):
         """地域データ取得 - 大阪市24区完全版database（高品質版）"""
-        # generate_area_database.pyから抽出した実際の記事ファイルベースの高品質版area_database
-        area_database = {
-            '北区': {
-                'population': 135567, 'households': 71234, 'area': '10.34', 'elderly': 33891,
-                'features': ['梅田スカイビル・グランフロント大阪の都心機能', 'JR大阪駅・阪急梅田駅・阪神梅田駅の交通結節点', '中之島公園・淀川河川敷の水辺環境', '新梅田シティ・茶屋町の商業エリア', '梅田地下街・阪急百貨店の商業集積', '国際的なビジネス・観光拠点'],
-                'medical_facilities': ['北区医師会診療所', '梅田地区総合クリニック', '複数のクリニックと診療所', '訪問看護ステーション', '介護老人保健施設']
-            },
-            '都島区': {
-                'population': 104567, 'households': 51234, 'area': '6.08', 'elderly': 28123,
-                'features': ['毛馬桜之宮公園の桜並木と水辺環境', '淀川・大川に囲まれた川沿いの緑豊かな住環境', '桜ノ宮駅・都島駅・野江内代駅の交通利便性', 'JR・地下鉄・京阪の交通結節点', '古くからの住宅地と新しいマンションが混在', '都心近接の住宅地域'],
-                'medical_facilities': ['都島区医師会診療所', '地域クリニック・診療所', '訪問看護ステーション', '介護関連施設']
-            },
-            '福島区': {
-                'population': 78067, 'households': 39541, 'area': '4.67', 'elderly': 20583,
-                'features': ['福島駅・新福島駅の都心直結交通利便性', '堂島川沿いの水辺環境と景観', '高級マンションと下町情緒の共存地域', 'JR東西線・阪神本線の交通結節点', 'オフィス街へのアクセス抜群の立地', 'コンパクトで都市機能集積の住環境'],
-                'medical_facilities': ['関西電力病院附属福島クリニック', '福島病院', '福島区医師会診療所', '複数のクリニックと診療所', '訪問看護ステーション', '介護老人保健施設', 'デイサービス・デイケア施設']
-            },
-            '此花区': {
-                'population': 67234, 'households': 31567, 'area': '19.25', 'elderly': 19876,
-                'features': ['ユニバーサル・スタジオ・ジャパンの国際観光地', 'JR桜島線・阪神なんば線の交通アクセス', '舞洲・夢洲の新開発ベイエリア', '大阪湾に面した臨海工業・住宅地域', '工業地域と住宅地の調和する混在地域', '春島・桜島など島嶼部を含む地域'],
-                'medical_facilities': ['此花区医師会診療所', '地域クリニック・診療所', '訪問看護ステーション', '介護関連施設']
-            },
-            '西区': {
-                'population': 101293, 'households': 51247, 'area': '5.21', 'elderly': 24107,
-                'features': ['京セラドーム大阪の大規模スポーツ施設', '靱公園の緑豊かな都心オアシス', '本町・阿波座のオフィス街商業地域', '新町・北堀江のトレンド発信エリア', '都心居住の人気高級住宅地', '地下鉄各線アクセスの交通利便性'],
-                'medical_facilities': ['西区民病院', '靱公園クリニック', '西区医師会診療所', '複数のクリニックと診療所', '訪問看護ステーション', '介護老人保健施設', 'デイサービス・デイケア施設']
-            },
-            '港区': {
-                'population': 84321, 'households': 42156, 'area': '7.86', 'elderly': 23567,
-                'features': ['大阪港・天保山ハーバービレッジの海運観光拠点', '海遊館・天保山大観覧車の観光施設', 'JR大阪環状線・地下鉄中央線の交通利便性', '築港・弁天町の工業と住宅の調和地域', '海に面した開放的な港湾環境', '大阪港咲洲トンネルの湾岸アクセス'],
-                'medical_facilities': ['港区医師会診療所', '地域クリニック・診療所', '訪問看護ステーション', '介護関連施設']
-            },
-            '大正区': {
-                'population': 62083, 'households': 29821, 'area': '9.43', 'elderly': 19600,
-                'features': ['木津川・正蓮寺川に囲まれた水辺の工業地域', '大正駅・ドーム前千代崎駅の阪神電鉄沿線', '昔ながらの町工場と住宅が共存する下町', '高齢化率約32%の大阪市内高水準地域', 'なみはや大橋からの都心アクセス', '工業遺産と住環境の調和する歴史的地域'],
-                'medical_facilities': ['大正病院', '大正区医師会', '複数の介護施設・訪問看護ステーション']
-            },
-            '天王寺区': {
-                'population': 78324, 'households': 41256, 'area': '4.84', 'elderly': 21789,
-                'features': ['天王寺動物園・美術館の文化教育施設', '四天王寺など歴史ある寺院群', 'JR・地下鉄・近鉄の主要交通結節点', '上町台地の坂道が多い地形特性', '大阪赤十字病院など医療機関の充実', '天王寺公園・茶臼山古墳の歴史的環境'],
-                'medical_facilities': ['天王寺区医師会診療所', '大阪赤十字病院', '大阪警察病院', '訪問看護ステーション', '介護関連施設']
-            },
-            '浪速区': {
-                'population': 71717, 'households': 37891, 'area': '4.37', 'elderly': 19234,
-                'features': ['新世界・通天閣の大阪代表観光エリア', '日本橋電気街（でんでんタウン）の電子商業地', 'JR難波駅・大阪難波駅の交通結節点', '難波・心斎橋の繁華街に隣接', '外国人観光客の多い国際色豊かな地域', '商業・娯楽施設の高密度集積地'],
-                'medical_facilities': ['大阪警察病院', 'なんば駅前クリニック', '浪速区医師会診療所', '複数のクリニックと診療所', '訪問看護ステーション', '介護老人保健施設', 'デイサービス・デイケア施設']
-            },
-            '西淀川区': {
-                'population': 98765, 'households': 47234, 'area': '14.22', 'elderly': 27891,
-                'features': ['阪神電車・JR東西線の交通利便性', '神崎川沿いの水辺環境と河川敷', '工業地域から住宅地への都市再生', '公害対策・環境改善の歴史と取り組み', '佃・野里・福の住宅密集地域', '環境改善が進む良好な住環境'],
-                'medical_facilities': ['西淀川区医師会診療所', '地域クリニック・診療所', '訪問看護ステーション', '介護関連施設']
-            },
-            '東淀川区': {
-                'population': 176543, 'households': 83456, 'area': '13.27', 'elderly': 48123,
-                'features': ['阪急京都線・千里線の交通要衝', '淀川河川敷の自然環境とレクリエーション', '上新庄・淡路・崇禅寺の商業・住宅地', '住宅密集地域の親しみやすいコミュニティ', '高齢化率の高い地域特性', '東淀川大橋など淀川との結びつき'],
-                'medical_facilities': ['東淀川区医師会診療所', '地域クリニック・診療所', '訪問看護ステーション', '介護関連施設']
-            },
-            '東成区': {
-                'population': 81234, 'households': 41567, 'area': '4.54', 'elderly': 23456,
-                'features': ['深江稲荷神社の歴史ある下町地域', '地下鉄中央線・今里筋線の交通利便性', 'コンパクトな住宅密集地域', '深江商店街など商店街文化が根付く', '大阪城公園に近接する立地', '高齢化率の高い地域コミュニティ'],
-                'medical_facilities': ['東成区医師会診療所', '地域クリニック・診療所', '訪問看護ステーション', '介護関連施設']
-            },
-            '生野区': {
-                'population': 129742, 'households': 59876, 'area': '8.37', 'elderly': 36234,
-                'features': ['鶴橋・桃谷のコリアタウン多文化共生地域', '韓国・朝鮮料理の本格的グルメエリア', '近鉄大阪線・JR大阪環状線の鉄道交通要衝', '生野コリアタウンの国際色豊かな商店街文化', '多様な文化背景を持つ住民構成', 'キムチ横丁などの観光スポット'],
-                'medical_facilities': ['生野中央病院', '桃谷病院', '生野区医師会診療所', '複数のクリニックと診療所', '訪問看護ステーション', '介護老人保健施設', 'デイサービス・デイケア施設']
-            },
-            '旭区': {
-                'population': 92341, 'households': 43567, 'area': '6.32', 'elderly': 27654,
-                'features': ['千林商店街の活気ある下町文化', '地下鉄谷町線・今里筋線の交通アクセス', '密集住宅地域の親しみやすいコミュニティ', '高齢化率の高い地域特性', '旭神社など地域に根付いた文化', '地域コミュニティが活発な住環境'],
-                'medical_facilities': ['旭区医師会診療所', '地域クリニック・診療所', '訪問看護ステーション', '介護関連施設']
-            },
-            '城東区': {
-                'population': 167890, 'households': 79234, 'area': '8.38', 'elderly': 45623,
-                'features': ['地下鉄長堀鶴見緑地線・今里筋線の交通利便性', '大阪城公園に隣接する歴史的立地', '関目・野江・蒲生の住宅密集地域', '商店街文化が根付く下町コミュニティ', '高齢化率の高い地域特性', '城東貨物線沿いの工業・住宅混在地域'],
-                'medical_facilities': ['城東区医師会診療所', '地域クリニック・診療所', '訪問看護ステーション', '介護関連施設']
-            },
-            '阿倍野区': {
-                'population': 107372, 'households': 52341, 'area': '5.99', 'elderly': 29678,
-                'features': ['あべのハルカス・天王寺駅の副都心機能', '阿倍野筋商店街の大阪代表的商業集積', 'JR・地下鉄・近鉄・阪堺電車の交通結節点', '天王寺ミオ・キューズモールの大型商業施設', '都市機能と商業の高度集積地域', '昭和町などの住宅地と商業地の調和'],
-                'medical_facilities': ['大阪市立大学医学部附属病院阿倍野医療センター', '阿倍野区医師会診療所', '複数のクリニックと診療所', '訪問看護ステーション', '介護老人保健施設']
-            },
-            '住吉区': {
-                'population': 150527, 'households': 73892, 'area': '9.4', 'elderly': 41142,
-                'features': ['住吉大社の門前町として発展した歴史的地域', '6本の鉄道路線が通る交通要衝地域', '帝塚山などの高級住宅街エリア', '長居公園・我孫子など多様な地域性', '住宅密度の高い都市近郊住宅地', '住吉大社の初詣客で賑わう地域'],
-                'medical_facilities': ['大阪急性期・総合医療センター', '住吉区医師会診療所', '複数のクリニックと診療所', '訪問看護ステーション', '介護老人保健施設', 'デイサービス・デイケア施設']
-            },
-            '東住吉区': {
-                'population': 126123, 'households': 56789, 'area': '9.75', 'elderly': 34567,
-                'features': ['長居公園・長居陸上競技場のスポーツ拠点', '近鉄南大阪線の住宅地交通利便性', 'ファミリー世帯中心の静かな住環境', '長居植物園の緑豊かな自然環境', 'スポーツ・レクリエーション施設の充実', '住宅地としての良好な生活環境'],
-                'medical_facilities': ['東住吉森本病院', '長居病院', '東住吉区医師会診療所', '複数のクリニックと診療所', '訪問看護ステーション', '介護老人保健施設', 'デイサービス・デイケア施設']
-            },
-            '西成区': {
-                'population': 110234, 'households': 67891, 'area': '7.37', 'elderly': 39456,
-                'features': ['あいりん地域の社会的課題と支援体制', '南海電鉄・地下鉄四つ橋線の交通アクセス', '新今宮・天下茶屋・岸里の住宅密集地域', '社会福祉・生活保護の重要拠点', '地域再生・まちづくりの取り組み', '多様な社会的背景を持つ住民構成'],
-                'medical_facilities': ['西成区医師会診療所', '地域クリニック・診療所', '訪問看護ステーション', '介護関連施設', '社会福祉施設']
-            },
-            '住之江区': {
-                'population': 121548, 'households': 57892, 'area': '20.61', 'elderly': 33432,
-                'features': ['南港・咲洲の副都心ベイエリア', 'ATCやコスモスクエアの商業集積地', 'インテックス大阪などの展示会場', '住之江公園の豊かな緑と競艇場', '海に面した開放的な湾岸住環境', '住之江温泉など観光・レクリエーション施設'],
-                'medical_facilities': ['住之江区医師会診療所', '南港病院', '地域クリニック・診療所', '訪問看護ステーション', '介護関連施設']
-            },
-            '中央区': {
-                'population': 98234, 'households': 53456, 'area': '8.87', 'elderly': 24567,
-                'features': ['大阪城・難波宮跡の歴史文化遺産', '本町・淀屋橋・北浜のビジネス中枢地区', '地下鉄御堂筋線・中央線・谷町線の交通結節', '高層マンション・タワーマンションの都心居住', '商業・業務機能の高度集積地域', '大阪市役所など行政機能の中心'],
-                'medical_facilities': ['中央区医師会診療所', '地域クリニック・診療所', '訪問看護ステーション', '介護関連施設']
-            },
-            '鶴見区': {
-                'population': 112543, 'households': 52876, 'area': '15.2', 'elderly': 31245,
-                'features': ['鶴見緑地公園・花博記念公園の豊かな自然', '国際花と緑の博覧会（花博）開催地の歴史', '地下鉄長堀鶴見緑地線の利便性', 'ファミリー世帯中心の住宅地環境', '緑豊かな郊外型住環境', '鶴見緑地プールなどスポーツ・レクリエーション施設'],
-                'medical_facilities': ['鶴見区医師会診療所', '関西医科大学総合医療センター', '地域クリニック・診療所', '訪問看護ステーション', '介護関連施設']
-            },
-            '平野区': {
-                'population': 195021, 'households': 87456, 'area': '15.28', 'elderly': 56447,
-                'features': ['大阪市24区中3番目の広域面積を持つ区', '平野郷の歴史ある住宅密集地域', '新興住宅地と古い街並みが混在', '高齢化率約28.9%の大阪市内高水準', '住宅地が分散し通院負担が大きい地域', '地下鉄谷町線の交通利便性'],
-                'medical_facilities': ['平野総合病院', '杭全病院', '平野区医師会診療所', '複数の介護施設・訪問看護ステーション']
-            },
-            '淀川区': {
-                'population': 174312, 'households': 81234, 'area': '12.64', 'elderly': 43567,
-                'features': ['新大阪駅の新幹線・在来線交通拠点', '十三駅の阪急電鉄ターミナル要衝', '淀川河川敷の自然環境とレクリエーション', 'ビジネスホテル・企業オフィスの集積', '都市機能の高度集積ビジネス地域', '新大阪副都心の商業・業務機能'],
-                'medical_facilities': ['淀川キリスト教病院', '新大阪病院', '淀川区医師会診療所', '複数のクリニックと診療所', '訪問看護ステーション', '介護老人保健施設', 'デイサービス・デイケア施設']
-            }
-        }
+        # 共有地域データストア（モジュール読み込み時に1度だけ構築）を参照
+        area_data = AREA_DATABASE.get(area)
+        if area_data is not None:
+            return area_data
         
-        return area_database.get(area, {
+        return {
             'population': 80000, 'households': 40000, 'area': '5.0', 'elderly': 22000,
             'features': [f'{area}の特色ある地域環境', '交通アクセスの利便性', '医療・福祉施設の充実', '住民コミュニティの活発さ'],
             'medical_facilities': [f'{area}医師会診療所', '地域クリニック・診療所', '訪問看護ステーション', '介護関連施設']
-        })
+        }
     
     def _generate_pricing_info(self):
         """料金体系生成"""
-        content = "### 医療保険適用で安心の料金体系\n"
-        content += "- 1回30分の施術：450円（1割負担）\n"
-        content += "- 月1回コース：1800円（税込）\n"
-        content += "- 月2回コース：3600円（税込）\n"
-        content += "- 月3回コース：5400円（税込）\n\n"
-        return content
+        return self._cached_section('pricing', None, (templates.PRICING,), templates.PRICING.render)
     
+
     def _generate_cta(self):
         """CTA生成"""
-        content = "**今すぐ医療保険適用でお申し込みください**\n"
-        content += f"📞 **[{self.env_vars['CLINIC_PHONE']}](tel:{self.env_vars['CLINIC_PHONE']})**\n"
-        content += f"⏰ {self.env_vars['BUSINESS_HOURS']}\n\n"
-        content += "---\n"
-        content += f"**運営**: {self.env_vars['COMPANY_NAME']} ({self.env_vars['LICENSE']})\n"
-        return content
+        return self._cached_section('cta', None, (templates.CTA,), lambda: templates.CTA.render(**self.env_vars))
+
+def _split_list(value):
+    """カンマ区切り引数をリスト化"""
+    return [item.strip() for item in value.split(',') if item.strip()] if value else None
+
+def run_matrix(argv):
+    """--matrix モード実行"""
+    parser = argparse.ArgumentParser(description='SEOブログシステム マトリクス一括生成')
+    parser.add_argument('--matrix', action='store_true', help='症状 × 地域 × テンプレートの一括生成')
+    parser.add_argument('--conditions', help='対象症状（カンマ区切り、省略時は全16症状）')
+    parser.add_argument('--areas', help='対象地域（カンマ区切り、省略時は大阪市24区）')
+    parser.add_argument('--templates', help='対象テンプレート（カンマ区切り、省略時は全4種）')
+    parser.add_argument('--output-dir', help='出力ディレクトリ（省略時は ~/Himawari/blog_articles/<日付>）')
+    parser.add_argument('--workers', type=int, default=1, help='並列ワーカー数（2以上でプロセスプール使用）')
+    parser.add_argument('--report', help='記事別結果レポート(JSON)の出力先')
+    parser.add_argument('--no-store', action='store_true', help='生成ストアを使わず全記事を再生成')
+    args = parser.parse_args(argv)
+    
+    if args.workers > 1 or args.report:
+        from parallel_article_generator import ParallelArticleGenerator
+        generator = ParallelArticleGenerator(workers=args.workers, use_store=not args.no_store)
+        result = generator.generate(
+            conditions=_split_list(args.conditions),
+            areas=_split_list(args.areas),
+            templates=_split_list(args.templates),
+            output_dir=args.output_dir,
+            report_path=args.report
+        )
+        if not result['success']:
+            sys.exit(1)
+        return
+    
+    system = SEOBlogSystem()
+    result = system.generate_matrix(
+        conditions=_split_list(args.conditions),
+        areas=_split_list(args.areas),
+        templates=_split_list(args.templates),
+        output_dir=args.output_dir,
+        use_store=not args.no_store
+    )
+    
+    if not result['success']:
+        sys.exit(1)
+
+def run_single_json(argv):
+    """--json モード: 1記事を生成・保存し、結果レコードをJSONで標準出力へ"""
+    parser = argparse.ArgumentParser(description='SEOブログシステム（結果レコード出力）')
+    parser.add_argument('condition')
+    parser.add_argument('area')
+    parser.add_argument('template_type')
+    parser.add_argument('--json', action='store_true', help='記事を保存し結果レコードをJSONで出力')
+    parser.add_argument('--output-dir', help='出力ディレクトリ（省略時は ~/Himawari/blog_articles/<日付>）')
+    args = parser.parse_args(argv)
+    
+    try:
+        system = SEOBlogSystem()
+        article_data = system._generate_structured_article(args.condition, args.area, args.template_type)
+        article_path = system.save_article(article_data, args.output_dir)
+        record = {
+            'success': True,
+            'article_path': str(article_path),
+            'title': article_data['title'],
+            'condition': args.condition,
+            'area': args.area,
+            'template_type': args.template_type
+        }
+    except Exception as e:
+        record = {'success': False, 'error': str(e)}
+    
+    print(json.dumps(record, ensure_ascii=False))
+    if not record['success']:
+        sys.exit(1)
 
 def main():
+    if '--matrix' in sys.argv[1:]:
+        run_matrix(sys.argv[1:])
+        return
+    
+    if '--json' in sys.argv[1:]:
+        run_single_json(sys.argv[1:])
+        return
+    
     if len(sys.argv) != 4:
         print("使用方法: python seo_blog_system.py <症状名> <地域名> <テンプレート>")
         print("例: python seo_blog_system.py パーキンソン病 西区 case_study")
+        print("一括生成: python seo_blog_system.py --matrix [--conditions ...] [--areas ...] [--templates ...] [--no-store]")
+        print("結果レコード出力: python seo_blog_system.py <症状名> <地域名> <テンプレート> --json")
         return
     
     condition = sys.argv[1]
@@ -507,4 +506,4 @@ def main():
     article = system.generate_article(condition, area, template_type)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
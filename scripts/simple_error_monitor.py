@@ -8,13 +8,16 @@ Date: 2025-08-10
 """
 
 from flask import Flask, request, jsonify
-import json
 import logging
-import requests
 import os
 from datetime import datetime
 from pathlib import Path
 
+from error_classifier import SIMPLE_ERROR_PATTERNS, CATEGORY_SEVERITY, get_default_classifier
+from error_log_store import ErrorLogStore
+from alert_notifier import AlertNotifier, FunctionChannel, slack_channel, discord_channel
+from alert_aggregator import AlertAggregator
+
 # ログ設定
 logging.basicConfig(
     level=logging.INFO,
@@ -32,40 +35,32 @@ app = Flask(__name__)
 PROJECT_NAME = os.getenv('PROJECT_NAME', 'ブログシステム')
 SLACK_WEBHOOK_URL = os.getenv('SLACK_WEBHOOK_URL', '')  # オプション
 DISCORD_WEBHOOK_URL = os.getenv('DISCORD_WEBHOOK_URL', '')  # オプション
+LOG_DIR = Path('/Users/skem/Himawari/SEO_AUTO_BLOG_PROJECT/logs')
+
+# 詳細エラーログ（追記専用 JSONL・5MB でローテーション。旧 detailed_errors.json は初回起動時に移行）
+error_store = ErrorLogStore(
+    LOG_DIR,
+    max_bytes=int(os.getenv('ERROR_LOG_MAX_BYTES', str(5 * 1024 * 1024))),
+    backup_count=int(os.getenv('ERROR_LOG_BACKUPS', '5')),
+    fsync=os.getenv('ERROR_LOG_FSYNC', 'interval')
+)
 
 class SimpleErrorAnalyzer:
     """シンプルなエラー検出・分析"""
     
     def __init__(self):
-        self.common_error_patterns = {
-            'ruby_gems': [
-                'cannot load such file --',
-                'LoadError',
-                'Bundler::GemNotFound',
-                'Could not find gem'
-            ],
-            'jekyll': [
-                'Liquid syntax error',
-                'YAML front matter',
-                'Layout does not exist',
-                'jekyll build failed'
-            ],
-            'netlify': [
-                'dependency_installation script returned non-zero exit code',
-                'Build script returned non-zero exit code',
-                'Command failed with exit code'
-            ]
-        }
+        self.common_error_patterns = SIMPLE_ERROR_PATTERNS
+        # 全パターンを1つのオートマトンにコンパイル済みの共有分類器（ログ1回走査）
+        self.classifier = get_default_classifier()
     
     def analyze_error(self, error_message, platform="unknown"):
         """エラー分析（修正提案なし）"""
-        detected_issues = []
-        
-        error_lower = error_message.lower()
+        detected = set(self.classifier.classify(error_message)['signatures'])
         
+        detected_issues = []
         for category, patterns in self.common_error_patterns.items():
             for pattern in patterns:
-                if pattern.lower() in error_lower:
+                if f"{category}:{pattern}" in detected:
                     detected_issues.append({
                         'category': category,
                         'pattern': pattern,
@@ -77,14 +72,28 @@ class SimpleErrorAnalyzer:
     
     def _get_severity(self, category):
         """エラーの深刻度判定"""
-        severity_map = {
-            'ruby_gems': 'HIGH',    # ビルド完全停止
-            'jekyll': 'MEDIUM',     # 一部記事影響
-            'netlify': 'HIGH'       # デプロイ失敗
-        }
-        return severity_map.get(category, 'MEDIUM')
+        return CATEGORY_SEVERITY.get(category, 'MEDIUM')
 
 def send_alert(error_data):
+    """アラート送信（同一エラーはウィンドウ内で集約し、最初の1件のみ即時送信）"""
+    
+    decision = aggregator.observe(error_data)
+    if decision['action'] == 'suppress':
+        platform, site_name, signature = decision['key']
+        logger.info(f"🔁 同一エラーを集約: {platform} / {site_name} ({decision['count']}回目) {signature[:80]}")
+        return
+    
+    dispatch_alert(error_data)
+
+def send_repeat_summary(summary):
+    """集約ウィンドウ終了時の要約アラート（ウィンドウ内の再発回数付き）"""
+    dispatch_alert(dict(
+        summary['error_data'],
+        occurrences=summary['count'],
+        window_seconds=summary['window_seconds']
+    ))
+
+def dispatch_alert(error_data):
     """アラート送信（複数チャンネル）"""
     
     alert_message = format_alert_message(error_data)
@@ -96,16 +105,8 @@ def send_alert(error_data):
     # ファイルログ（必須）
     log_detailed_error(error_data)
     
-    # Slack通知（オプション）
-    if SLACK_WEBHOOK_URL:
-        send_slack_alert(alert_message)
-    
-    # Discord通知（オプション）
-    if DISCORD_WEBHOOK_URL:
-        send_discord_alert(alert_message)
-    
-    # システム通知（macOS）
-    send_system_notification(alert_message)
+    # Slack・Discord・システム通知（チャンネルごとに非同期送信。集中時はダイジェストにまとめる）
+    notifier.notify(alert_message)
 
 def format_alert_message(error_data):
     """アラートメッセージ整形"""
@@ -118,8 +119,13 @@ def format_alert_message(error_data):
     
     detected_issues = error_data.get('detected_issues', [])
     
+    title = "BUILD ERROR ALERT"
+    if error_data.get('occurrences'):
+        minutes = max(1, round(error_data.get('window_seconds', 0) / 60))
+        title = f"BUILD ERROR REPEATED ×{error_data['occurrences']} (last {minutes} min)"
+    
     message = f"""
-🚨 {PROJECT_NAME} - BUILD ERROR ALERT
+🚨 {PROJECT_NAME} - {title}
 
 ⏰ Time: {timestamp}
 🌐 Platform: {platform}
@@ -163,74 +169,42 @@ def log_detailed_error(error_data):
         'raw_payload': error_data.get('raw_payload')
     }
     
-    # JSON形式でログファイルに記録
-    log_file = Path('/Users/skem/Himawari/SEO_AUTO_BLOG_PROJECT/logs/detailed_errors.json')
-    
+    # JSONL形式で1行追記（全件の読み込み・書き直しなし）
     try:
-        if log_file.exists():
-            with open(log_file, 'r', encoding='utf-8') as f:
-                logs = json.load(f)
-        else:
-            logs = []
-        
-        logs.append(log_entry)
-        
-        # 最新100件のみ保持
-        if len(logs) > 100:
-            logs = logs[-100:]
-        
-        with open(log_file, 'w', encoding='utf-8') as f:
-            json.dump(logs, f, indent=2, ensure_ascii=False)
-            
+        error_store.append(log_entry)
     except Exception as e:
         logger.error(f"詳細ログ記録エラー: {e}")
 
-def send_slack_alert(message):
-    """Slack通知"""
-    try:
-        payload = {
-            "text": message,
-            "username": "Error Monitor Bot",
-            "icon_emoji": ":warning:"
-        }
-        
-        response = requests.post(SLACK_WEBHOOK_URL, json=payload, timeout=10)
-        
-        if response.status_code == 200:
-            logger.info("✅ Slack通知送信成功")
-        else:
-            logger.warning(f"⚠️ Slack通知失敗: {response.status_code}")
-            
-    except Exception as e:
-        logger.error(f"Slack通知エラー: {e}")
-
-def send_discord_alert(message):
-    """Discord通知"""
-    try:
-        payload = {
-            "content": message,
-            "username": "Error Monitor"
-        }
-        
-        response = requests.post(DISCORD_WEBHOOK_URL, json=payload, timeout=10)
-        
-        if response.status_code in [200, 204]:
-            logger.info("✅ Discord通知送信成功")
-        else:
-            logger.warning(f"⚠️ Discord通知失敗: {response.status_code}")
-            
-    except Exception as e:
-        logger.error(f"Discord通知エラー: {e}")
-
 def send_system_notification(message):
     """システム通知（macOS）"""
-    try:
-        # macOS通知
-        os.system(f'''osascript -e 'display notification "{PROJECT_NAME}でエラー発生" with title "Build Error Alert"' ''')
-        logger.info("✅ システム通知送信")
-        
-    except Exception as e:
-        logger.error(f"システム通知エラー: {e}")
+    # macOS通知
+    os.system(f'''osascript -e 'display notification "{PROJECT_NAME}でエラー発生" with title "Build Error Alert"' ''')
+
+def build_notifier():
+    """通知チャンネル構成（Slack・Discord は URL 設定時のみ）"""
+    channels = []
+    if SLACK_WEBHOOK_URL:
+        channels.append(slack_channel(SLACK_WEBHOOK_URL))
+    if DISCORD_WEBHOOK_URL:
+        channels.append(discord_channel(DISCORD_WEBHOOK_URL))
+    channels.append(FunctionChannel('システム通知', send_system_notification))
+    rate_burst = max(1.0, float(os.getenv('ALERT_RATE_BURST', '3')))
+    rate_per_minute = float(os.getenv('ALERT_RATE_PER_MINUTE', '6'))
+    return AlertNotifier(
+        channels,
+        digest_window=float(os.getenv('ALERT_DIGEST_SECONDS', '5')),
+        max_retries=int(os.getenv('ALERT_MAX_RETRIES', '3')),
+        # チャンネルごとのトークンバケット（バースト数, 毎分の送信数）。毎分の送信数 0 以下で制限なし
+        rate_limits={'*': (rate_burst, rate_per_minute)} if rate_per_minute > 0 else None
+    )
+
+notifier = build_notifier()
+
+# (プラットフォーム, サイト, エラーシグネチャ) 単位の集約ウィンドウ（0 で集約なし）
+aggregator = AlertAggregator(
+    window=float(os.getenv('ALERT_WINDOW_SECONDS', '600')),
+    on_summary=send_repeat_summary
+)
 
 @app.route('/health')
 def health_check():
@@ -239,9 +213,28 @@ def health_check():
         "status": "healthy", 
         "timestamp": datetime.now().isoformat(),
         "project": PROJECT_NAME,
-        "mode": "ERROR_DETECTION_ONLY"
+        "mode": "ERROR_DETECTION_ONLY",
+        "error_log": error_store.stats(),
+        "notifier": notifier.stats(),
+        "aggregator": aggregator.stats()
     })
 
+@app.route('/errors')
+def list_errors():
+    """詳細エラーログ参照（?platform=&severity=&since=&until=&limit=&cursor=）"""
+    try:
+        result = error_store.query(
+            platform=request.args.get('platform'),
+            severity=request.args.get('severity'),
+            since=request.args.get('since'),
+            until=request.args.get('until'),
+            limit=min(int(request.args.get('limit', 50)), 500),
+            cursor=int(request.args['cursor']) if request.args.get('cursor') else None
+        )
+        return jsonify(result), 200
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
 @app.route('/netlify-webhook', methods=['POST'])
 def netlify_webhook():
     """Netlify Webhookエンドポイント（検出専用）"""
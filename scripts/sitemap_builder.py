@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+sitemap.xml 生成
+Front Matter 索引（front_matter_index.py）の記事URL・本文ハッシュと固定ページから
+sitemap.xml を生成する（jekyll-sitemap / Liquid テンプレートの全体ビルドに依存しない）
+
+- <lastmod>: URLごとのコンテンツハッシュを状態ファイル（scripts/sitemap_state.json、リポジトリ管理下）に保持し、
+  内容が変わった時のみ更新。新規URLは記事日付（固定ページは最終コミット日時）
+  → 新しいクローン・CI 上でも lastmod がチェックアウト時刻に変わらない
+- 50,000 URL 超: sitemap-N.xml に分割し sitemap.xml をサイトマップインデックスにする
+- URL集合・ハッシュに変化がなければファイルを書き換えない
+
+使用方法: python sitemap_builder.py [--dry-run]
+"""
+
+import os
+import re
+import sys
+import json
+import hashlib
+import argparse
+import subprocess
+from pathlib import Path
+from urllib.parse import quote
+from datetime import datetime, timezone
+from xml.sax.saxutils import escape
+from typing import Dict, List, Any, Optional
+
+import yaml
+
+from front_matter_index import (
+    FrontMatterIndex, post_url, find_project_root, load_site_config, write_atomic, DEFAULT_PERMALINK
+)
+
+MAX_URLS_PER_SITEMAP = 50000
+STATE_VERSION = 1
+SITEMAP_NAMESPACE = "http://www.sitemaps.org/schemas/sitemap/0.9"
+PAGE_GLOBS = ("*.html", "*.md", "areas/*/index.*", "symptoms/*/index.*")
+EXCLUDED_PAGE_PATTERN = re.compile(r'(^|/)(404|feed|sitemap)[^/]*$')
+
+def read_page_front_matter(page_path: Path) -> Optional[Dict[str, Any]]:
+    """固定ページの Front Matter 取得（Front Matter がないファイルは Jekyll のページではないため None）"""
+    with open(page_path, 'r', encoding='utf-8') as f:
+        if f.readline().rstrip() != '---':
+            return None
+        header_lines = []
+        for line in f:
+            if line.rstrip() == '---':
+                front_matter = yaml.safe_load(''.join(header_lines)) or {}
+                return front_matter if isinstance(front_matter, dict) else {}
+            header_lines.append(line)
+    return None
+
+def page_url(relative_path: str, front_matter: Dict[str, Any]) -> str:
+    """固定ページURL（permalink 優先、なければ Jekyll の既定規則: index → ディレクトリ, .md → .html）"""
+    if front_matter.get('permalink'):
+        return str(front_matter['permalink'])
+
+    path = '/' + relative_path
+    if path.endswith('/index.html') or path.endswith('/index.md'):
+        return path.rsplit('/', 1)[0] + '/'
+    if path.endswith('.md'):
+        return path[:-3] + '.html'
+    return path
+
+def w3c_datetime(value: datetime) -> str:
+    """W3C Datetime 形式（例: 2025-08-14T22:47:00+00:00）"""
+    return value.astimezone(timezone.utc).isoformat(timespec='seconds')
+
+class SitemapBuilder:
+    """sitemap.xml 生成（コンテンツハッシュ基準の lastmod 管理付き）"""
+
+    def __init__(self, project_root: Optional[Path] = None, max_urls: int = MAX_URLS_PER_SITEMAP):
+        self.project_root = project_root or find_project_root()
+        self.max_urls = max_urls
+        self.site_config = load_site_config(self.project_root)
+        self.site_url = (os.environ.get('SITE_URL') or self.site_config.get('url') or '').rstrip('/')
+        self.permalink_pattern = self.site_config.get('permalink') or DEFAULT_PERMALINK
+        # _data 配下はサイトデータとして Liquid から参照されるため、ビルド用の状態はスクリプトと並べて管理
+        self.state_path = self.project_root / "scripts" / "sitemap_state.json"
+        self.legacy_state_paths = [  # 旧保存先（移行用）
+            self.project_root / "_data" / "sitemap_state.json",
+            self.project_root / ".cache" / "sitemap_state.json",
+        ]
+        self.front_matter_index = FrontMatterIndex(
+            self.project_root / "_posts", self.project_root / ".cache" / "front_matter_index.json"
+        )
+
+    def _load_state(self) -> Dict[str, Dict[str, str]]:
+        """URL → {hash, lastmod} の状態読み込み"""
+        state_path = next((path for path in [self.state_path] + self.legacy_state_paths if path.exists()), None)
+        if state_path is None:
+            return {}
+        try:
+            with open(state_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data.get('urls', {}) if data.get('version') == STATE_VERSION else {}
+        except (OSError, ValueError) as e:
+            print(f"⚠️  サイトマップ状態を読み込めません（lastmod を再初期化します）: {e}")
+            return {}
+
+    def _save_state(self, urls: Dict[str, Dict[str, str]]):
+        """状態保存（一時ファイル経由で原子的に置換）"""
+        write_atomic(self.state_path, json.dumps(
+            {'version': STATE_VERSION, 'urls': urls}, ensure_ascii=False, indent=1, sort_keys=True
+        ))
+
+    def collect_urls(self) -> List[Dict[str, Any]]:
+        """記事・固定ページのURLとコンテンツハッシュ一覧"""
+        urls = []
+
+        for entry in self.front_matter_index.posts():
+            # 本文ハッシュと Front Matter の主要項目をまとめてハッシュ化（タイトル変更等も検出）
+            signature = json.dumps(
+                {key: entry[key] for key in ('title', 'date', 'description', 'categories', 'tags', 'body_sha256')},
+                ensure_ascii=False, sort_keys=True
+            )
+            urls.append({
+                'loc': post_url(entry, self.permalink_pattern),
+                'hash': hashlib.sha256(signature.encode('utf-8')).hexdigest(),
+                'initial_lastmod': datetime.strptime(entry['date'], "%Y-%m-%d %H:%M:%S %z"),
+                'changefreq': 'monthly',
+                'priority': '0.8'
+            })
+
+        seen_pages = set()
+        for pattern in PAGE_GLOBS:
+            for page_path in sorted(self.project_root.glob(pattern)):
+                relative_path = page_path.relative_to(self.project_root).as_posix()
+                if EXCLUDED_PAGE_PATTERN.search(relative_path):
+                    continue
+                front_matter = read_page_front_matter(page_path)
+                if front_matter is None or front_matter.get('sitemap') is False:
+                    continue
+
+                loc = page_url(relative_path, front_matter)
+                if loc in seen_pages:
+                    continue  # 同一 permalink の index.md / index.html は1件にまとめる
+                seen_pages.add(loc)
+
+                urls.append({
+                    'loc': loc,
+                    'hash': hashlib.sha256(page_path.read_bytes()).hexdigest(),
+                    'initial_lastmod': page_path,  # 新規URLの場合のみ _page_lastmod で解決
+                    'changefreq': 'monthly',
+                    'priority': '0.7'
+                })
+
+        return urls
+
+    def _page_lastmod(self, page_path: Path) -> datetime:
+        """固定ページの初回 lastmod（最終コミット日時。未コミットのファイルは更新日時）"""
+        try:
+            committed = subprocess.run(
+                ["git", "log", "-1", "--format=%cI", "--", str(page_path)],
+                cwd=self.project_root, capture_output=True, text=True, timeout=10
+            ).stdout.strip()
+        except (OSError, subprocess.SubprocessError):
+            committed = ''
+        if committed:
+            return datetime.fromisoformat(committed)
+        return datetime.fromtimestamp(page_path.stat().st_mtime, timezone.utc)
+
+    def _absolute_url(self, loc: str) -> str:
+        """サイトURL付きの絶対URL（非ASCII文字はパーセントエンコード）"""
+        return self.site_url + quote(loc, safe="/:%-._~!$&'()*+,;=@")
+
+    def render(self, entries: List[Dict[str, str]]) -> Dict[str, str]:
+        """ファイル名 → XML（上限超過時は分割し sitemap.xml をインデックスにする）"""
+        def urlset(chunk: List[Dict[str, str]]) -> str:
+            lines = ['<?xml version="1.0" encoding="UTF-8"?>', f'<urlset xmlns="{SITEMAP_NAMESPACE}">']
+            for entry in chunk:
+                lines.append(
+                    f"  <url>\n    <loc>{escape(entry['loc'])}</loc>\n    <lastmod>{entry['lastmod']}</lastmod>\n"
+                    f"    <changefreq>{entry['changefreq']}</changefreq>\n    <priority>{entry['priority']}</priority>\n  </url>"
+                )
+            lines.append('</urlset>')
+            return "\n".join(lines) + "\n"
+
+        if len(entries) <= self.max_urls:
+            return {"sitemap.xml": urlset(entries)}
+
+        files = {}
+        index_lines = ['<?xml version="1.0" encoding="UTF-8"?>', f'<sitemapindex xmlns="{SITEMAP_NAMESPACE}">']
+        for number, start in enumerate(range(0, len(entries), self.max_urls), 1):
+            chunk = entries[start:start + self.max_urls]
+            filename = f"sitemap-{number}.xml"
+            files[filename] = urlset(chunk)
+            index_lines.append(
+                f"  <sitemap>\n    <loc>{escape(self._absolute_url('/' + filename))}</loc>\n"
+                f"    <lastmod>{max(entry['lastmod'] for entry in chunk)}</lastmod>\n  </sitemap>"
+            )
+        index_lines.append('</sitemapindex>')
+        files["sitemap.xml"] = "\n".join(index_lines) + "\n"
+        return files
+
+    def build(self, dry_run: bool = False) -> Dict[str, Any]:
+        """サイトマップ生成（URL集合・ハッシュに変化がなければ書き換えない）"""
+        print("🗺️  サイトマップ生成開始")
+        now = datetime.now(timezone.utc)
+        previous_state = self._load_state()
+        state: Dict[str, Dict[str, str]] = {}
+        entries = []
+        changed_urls = 0
+
+        for url in self.collect_urls():
+            loc = self._absolute_url(url['loc'])
+            previous = previous_state.get(loc)
+            if previous and previous['hash'] == url['hash']:
+                lastmod = previous['lastmod']
+            else:
+                # 新規URLは記事日付（固定ページはファイル更新日時）、内容変更は現在時刻
+                initial = url['initial_lastmod']
+                if isinstance(initial, Path):
+                    initial = self._page_lastmod(initial)
+                lastmod = w3c_datetime(initial if not previous else now)
+                changed_urls += 1
+            state[loc] = {'hash': url['hash'], 'lastmod': lastmod}
+            entries.append({
+                'loc': loc, 'lastmod': lastmod,
+                'changefreq': url['changefreq'], 'priority': url['priority']
+            })
+
+        removed_urls = len(set(previous_state) - set(state))
+        written = []
+        if (changed_urls or removed_urls or not (self.project_root / "sitemap.xml").exists()
+                or not self.state_path.exists()):
+            files = self.render(entries)
+            stale = [
+                path for path in self.project_root.glob("sitemap-*.xml") if path.name not in files
+            ]
+            for filename, content in files.items():
+                output_path = self.project_root / filename
+                if output_path.exists() and output_path.read_text(encoding='utf-8') == content:
+                    continue
+                written.append(filename)
+                if not dry_run:
+                    write_atomic(output_path, content)
+            if not dry_run:
+                for path in stale:
+                    path.unlink()
+                self._save_state(state)
+
+        print(f"📊 URL {len(entries)}件 / 新規・更新 {changed_urls}件 / 削除 {removed_urls}件")
+        if written:
+            print(f"✅ {'更新予定' if dry_run else '更新'}: {', '.join(written)}")
+        else:
+            print("✅ 変更なし - サイトマップを書き換えません")
+
+        return {
+            'success': True,
+            'urls': len(entries),
+            'changed': changed_urls,
+            'removed': removed_urls,
+            'written': written,
+            'dry_run': dry_run
+        }
+
+def main():
+    """メイン実行関数"""
+    parser = argparse.ArgumentParser(description='sitemap.xml 生成')
+    parser.add_argument('--dry-run', action='store_true', help='書き込まずに更新対象のみ表示')
+    args = parser.parse_args()
+
+    result = SitemapBuilder().build(dry_run=args.dry_run)
+    if not result['success']:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
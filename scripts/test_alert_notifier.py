@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+アラート通知ファンアウトのテストスクリプト
+ローカルに Slack / Discord 代替の HTTP 受信サーバー（http.server）を起動し、
+AlertNotifier の並行送信・ダイジェスト集約・再送・接続再利用を確認する
+
+使用方法: python test_alert_notifier.py
+"""
+
+import sys
+import json
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from alert_notifier import AlertNotifier, FunctionChannel, WebhookChannel, slack_channel, discord_channel
+
+class StubReceiver:
+    """Webhook 受信サーバー（応答遅延・失敗回数・ステータスを指定可能）"""
+
+    def __init__(self, delay: float = 0.0, fail_times: int = 0, fail_status: int = 500, retry_after: str = None):
+        self.delay = delay
+        self.fail_times = fail_times
+        self.fail_status = fail_status
+        self.retry_after = retry_after
+        self.requests = []
+        self.connections = set()
+        receiver = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'  # keep-alive（接続再利用の確認用）
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+                receiver.connections.add(self.client_address)
+                time.sleep(receiver.delay)
+                receiver.requests.append((time.monotonic(), body))
+                if len(receiver.requests) <= receiver.fail_times:
+                    self.send_response(receiver.fail_status)
+                    if receiver.retry_after:
+                        self.send_header('Retry-After', receiver.retry_after)
+                else:
+                    self.send_response(200)
+                self.send_header('Content-Length', '2')
+                self.end_headers()
+                self.wfile.write(b'ok')
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/hook"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+
+def check_concurrent_fanout():
+    """遅いチャンネルが他チャンネルと呼び出し元を待たせないか"""
+    fast, slow = StubReceiver(), StubReceiver(delay=1.5)
+    notifier = AlertNotifier([slack_channel(fast.url), discord_channel(slow.url)], digest_window=0)
+
+    started = time.monotonic()
+    notifier.notify("🚨 test alert")
+    returned_ms = (time.monotonic() - started) * 1000
+    notifier.flush(timeout=10)
+
+    fast_at, slow_at = fast.requests[0][0] - started, slow.requests[0][0] - started
+    print(f"   notify 戻り {returned_ms:.1f}ms / 高速チャンネル着信 {fast_at:.2f}s / 低速チャンネル着信 {slow_at:.2f}s")
+    notifier.shutdown()
+    fast.close(), slow.close()
+    return returned_ms < 50 and fast_at < 0.5 and slow_at >= 1.5
+
+def check_digest_batching():
+    """集中したアラートが1通のダイジェストにまとまるか"""
+    receiver = StubReceiver()
+    notifier = AlertNotifier([slack_channel(receiver.url)], digest_window=0.5)
+    for i in range(5):
+        notifier.notify(f"🚨 alert {i}")
+        time.sleep(0.05)
+    notifier.flush(timeout=10)
+    notifier.notify("🚨 alert after window")
+    notifier.flush(timeout=10)
+
+    texts = [body['text'] for _, body in receiver.requests]
+    print(f"   受信 {len(texts)}通 / 先頭: {texts[0].splitlines()[0] if texts else '-'}")
+    stats = notifier.stats()['Slack']
+    notifier.shutdown()
+    receiver.close()
+    return (
+        len(texts) == 2 and texts[0].startswith("📦 アラート 5件")
+        and all(f"alert {i}" in texts[0] for i in range(5))
+        and texts[1] == "🚨 alert after window"
+        and stats['sent'] == 6 and stats['digests'] == 1
+    )
+
+def check_retry_with_backoff():
+    """5xx・429（Retry-After）の後に再送で成功するか"""
+    flaky = StubReceiver(fail_times=2, fail_status=503)
+    limited = StubReceiver(fail_times=1, fail_status=429, retry_after='1')
+    notifier = AlertNotifier(
+        [slack_channel(flaky.url), discord_channel(limited.url)], digest_window=0, backoff_base=0.1
+    )
+    notifier.notify("🚨 retry test")
+    notifier.flush(timeout=15)
+
+    stats = notifier.stats()
+    limited_gap = limited.requests[1][0] - limited.requests[0][0] if len(limited.requests) > 1 else 0
+    print(f"   Slack 試行 {len(flaky.requests)}回 / Discord 試行 {len(limited.requests)}回 (Retry-After 間隔 {limited_gap:.2f}s)")
+    notifier.shutdown()
+    flaky.close(), limited.close()
+    return (
+        stats['Slack']['sent'] == 1 and stats['Slack']['retries'] == 2
+        and stats['Discord']['sent'] == 1 and limited_gap >= 0.95
+    )
+
+def check_gives_up_and_isolated():
+    """再送上限で諦め、他チャンネルには影響しないか（4xx は再送しない）"""
+    broken, bad_request, ok = StubReceiver(fail_times=99, fail_status=500), StubReceiver(fail_times=99, fail_status=400), StubReceiver()
+    system_messages = []
+    notifier = AlertNotifier([
+        WebhookChannel('broken', broken.url, lambda m: {'text': m}),
+        WebhookChannel('bad_request', bad_request.url, lambda m: {'text': m}),
+        slack_channel(ok.url),
+        FunctionChannel('system', system_messages.append),
+    ], digest_window=0, max_retries=2, backoff_base=0.05)
+    notifier.notify("🚨 isolation test")
+    notifier.flush(timeout=10)
+
+    stats = notifier.stats()
+    print(f"   broken 試行 {len(broken.requests)}回 / 400 試行 {len(bad_request.requests)}回 / system {len(system_messages)}件")
+    notifier.shutdown()
+    broken.close(), bad_request.close(), ok.close()
+    return (
+        len(broken.requests) == 3 and stats['broken']['failed'] == 1
+        and len(bad_request.requests) == 1 and stats['bad_request']['failed'] == 1
+        and stats['Slack']['sent'] == 1 and system_messages == ["🚨 isolation test"]
+    )
+
+def check_session_reuse():
+    """連続送信で HTTP 接続が再利用されるか"""
+    receiver = StubReceiver()
+    notifier = AlertNotifier([slack_channel(receiver.url)], digest_window=0)
+    for i in range(5):
+        notifier.notify(f"🚨 alert {i}")
+        notifier.flush(timeout=10)
+    print(f"   送信 {len(receiver.requests)}回 / 接続 {len(receiver.connections)}本")
+    notifier.shutdown()
+    receiver.close()
+    return len(receiver.requests) == 5 and len(receiver.connections) == 1
+
+def check_discord_length_limit():
+    """Discord の2000文字上限: 集中したアラートは分割送信、単独で長すぎるアラートのみ切り詰め"""
+    receiver = StubReceiver()
+    notifier = AlertNotifier([discord_channel(receiver.url)], digest_window=0.3)
+    for i in range(5):
+        notifier.notify(f"🚨 alert {i} " + "x" * 800)
+    notifier.notify("y" * 5000)
+    notifier.flush(timeout=10)
+    stats = notifier.stats()['Discord']
+    notifier.shutdown()
+    receiver.close()
+
+    contents = [body['content'] for _, body in receiver.requests]
+    print(f"   送信 {len(contents)}通 / 最大 {max(len(c) for c in contents)}文字 / sent {stats['sent']}")
+    return (
+        len(contents) > 1 and all(len(c) <= 2000 for c in contents)
+        and all(any(f"alert {i} " in c for c in contents) for i in range(5))
+        and any(c.endswith("（省略）") and c.startswith("y") for c in contents)
+        and stats['sent'] == 6 and stats['failed'] == 0
+    )
+
+def check_rate_limit_validation():
+    """毎分の送信数 0 以下の送信制限は構築時に拒否（無限待ちでワーカーが停止しない）"""
+    rejected = []
+    for rate in [(3, 0), (3, -1), (0, 6)]:
+        try:
+            AlertNotifier([FunctionChannel('test', lambda message: True)], rate_limits={'*': rate})
+        except ValueError:
+            rejected.append(rate)
+
+    sent = []
+    notifier = AlertNotifier([FunctionChannel('test', sent.append)], digest_window=0, rate_limits={'*': (1, 600)})
+    for i in range(2):
+        notifier.notify(f"alert {i}")
+    flushed = notifier.flush(timeout=5)
+    notifier.shutdown()
+
+    print(f"   拒否 {len(rejected)}/3 件 / 送信 {len(sent)}通")
+    return len(rejected) == 3 and flushed and all(any(f"alert {i}" in m for m in sent) for i in range(2))
+
+def main():
+    """テスト実行メイン"""
+    print("🧪 アラート通知ファンアウト テスト")
+    print("=" * 60)
+
+    tests = [
+        ("並行ファンアウト", check_concurrent_fanout),
+        ("ダイジェスト集約", check_digest_batching),
+        ("バックオフ再送", check_retry_with_backoff),
+        ("再送上限・チャンネル分離", check_gives_up_and_isolated),
+        ("接続再利用", check_session_reuse),
+        ("Discord 文字数上限（分割送信）", check_discord_length_limit),
+        ("送信制限の値検証", check_rate_limit_validation),
+    ]
+
+    passed = 0
+    for test_name, test_func in tests:
+        print(f"\n▶ {test_name}")
+        try:
+            if test_func():
+                print(f"✅ {test_name} 成功")
+                passed += 1
+            else:
+                print(f"❌ {test_name} 失敗")
+        except Exception as e:
+            print(f"❌ {test_name} エラー: {str(e)}")
+
+    print("\n" + "=" * 60)
+    print(f"🎯 テスト結果: {passed}/{len(tests)} 成功")
+    if passed != len(tests):
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
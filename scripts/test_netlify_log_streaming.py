@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+ビルドログ ストリーミング解析のテストスクリプト
+記録済みビルドログを返すローカルのスタブ Netlify API（http.server）を起動し、
+EnhancedNetlifyMonitor.stream_build_log の逐次解析・致命的エラーでの打ち切りを確認する
+
+使用方法: python test_netlify_log_streaming.py
+"""
+
+import sys
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from error_classifier import get_default_classifier
+from enhanced_netlify_monitor import EnhancedNetlifyMonitor
+
+SITE_ID = "stub-site"
+
+# 記録済みビルドログ（Ruby 3.4 で csv gem 不足。失敗後に大量のスタックトレースが続く）
+RUBY34_FAILURE_LOG = "\n".join([
+    "10:15:02 AM: Netlify Build",
+    "10:15:03 AM: Attempting Ruby version 3.4.1, read from environment",
+    "10:15:10 AM: Using bundler 2.5.9",
+    "10:15:41 AM: Bundle complete! 12 Gemfile dependencies, 45 gems now installed.",
+    "10:15:42 AM: $ bundle exec jekyll build",
+    "10:15:43 AM: bundler: failed to load command: jekyll (/opt/buildhome/.rbenv/versions/3.4.1/bin/jekyll)",
+    "10:15:43 AM: /opt/buildhome/.rbenv/versions/3.4.1/lib/ruby/3.4.0/bundled_gems.rb:82:in `require':"
+    " cannot load such file -- csv (LoadError)",
+] + [
+    f"10:15:43 AM: \tfrom /opt/buildhome/.rbenv/versions/3.4.1/lib/ruby/gems/3.4.0/gems/jekyll-4.3.3/lib/jekyll.rb:{n}:in `<top (required)>'"
+    for n in range(40000)
+] + [
+    "10:15:44 AM: Command failed with exit code 1: bundle exec jekyll build",
+    "10:15:44 AM: Build script returned non-zero exit code: 2",
+]) + "\n"
+
+# 記録済みビルドログ（成功。Jekyll の警告と日本語を含む）
+JEKYLL_WARNING_LOG = "\n".join([
+    "10:20:02 AM: Netlify Build",
+    "10:20:45 AM: $ bundle exec jekyll build",
+    "10:20:46 AM: Configuration file: /opt/build/repo/_config.yml",
+] + [
+    f"10:20:47 AM:   Generating... _posts/2025-08-14-住吉区-パーキンソン病-{n}.md"
+    for n in range(3000)
+] + [
+    "10:20:48 AM: Build Warning: Layout 'post' does not exist. (YAML front matter を確認)",
+    "10:20:48 AM:   Liquid Warning: Liquid syntax error (line 3): Expected end_of_string",
+    "10:20:50 AM:                     done in 3.412 seconds.",
+    "10:20:51 AM: Site is live ✨",
+])
+
+RECORDED_LOGS = {
+    'deploy-ruby34': RUBY34_FAILURE_LOG,
+    'deploy-warning': JEKYLL_WARNING_LOG,
+}
+
+class StubNetlifyHandler(BaseHTTPRequestHandler):
+    """Netlify API スタブ（デプロイ一覧・デプロイ詳細・ビルドログ）"""
+
+    def do_GET(self):
+        parts = self.path.strip('/').split('/')
+        if parts == ['sites', SITE_ID, 'deploys']:
+            deploys = [{'id': deploy_id, 'state': 'error', 'created_at': '2025-08-14T10:15:44Z'} for deploy_id in RECORDED_LOGS]
+            return self._send_json(deploys)
+        if len(parts) == 2 and parts[0] == 'deploys' and parts[1] in RECORDED_LOGS:
+            return self._send_json({'id': parts[1], 'state': 'error', 'error_message': 'Build script returned non-zero exit code: 2', 'deploy_time': 42})
+        if len(parts) == 5 and parts[:3] == ['sites', SITE_ID, 'deploys'] and parts[4] == 'log' and parts[3] in RECORDED_LOGS:
+            return self._send_log(RECORDED_LOGS[parts[3]].encode('utf-8'))
+        self.send_response(404)
+        self.end_headers()
+
+    def _send_json(self, data):
+        body = json.dumps(data).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_log(self, body):
+        """ビルド中の逐次出力を模して小分けに送信（クライアント切断で中断）"""
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain')  # charset なし（Netlify と同じ）
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        try:
+            for start in range(0, len(body), 8192):
+                self.wfile.write(body[start:start + 8192])
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+def start_stub_server():
+    """スタブサーバー起動（空きポートを自動割り当て）"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubNetlifyHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+def check_stops_on_fatal(monitor):
+    """致命的エラー検出で受信を打ち切り、gem名を抽出できるか"""
+    result = monitor.stream_build_log('deploy-ruby34')
+    total_bytes = len(RUBY34_FAILURE_LOG.encode('utf-8'))
+    print(f"   受信 {result['bytes_read']}/{total_bytes} bytes, {result['lines_scanned']}行, 打ち切り={result['stopped_early']}")
+    print(f"   Rubyエラー: {result['ruby_errors']}")
+    return (
+        result['success'] and result['stopped_early']
+        and result['bytes_read'] < total_bytes // 4
+        and result['fatal']['id'] == 'missing_gem:cannot load such file -- csv'
+        and result['fatal']['line'] == 7
+        and "Missing gem: csv" in result['ruby_errors']
+    )
+
+def check_matches_full_text(monitor):
+    """打ち切りなしの逐次解析が全文一括解析と同じ結果（位置・行番号・日本語のチャンク境界を含む）"""
+    expected = get_default_classifier().classify(JEKYLL_WARNING_LOG)
+    for chunk_size in (7, 1000, 64 * 1024):
+        result = monitor.stream_build_log('deploy-warning', stop_on_fatal=False, chunk_size=chunk_size)
+        spans = [(m['id'], m['start'], m['line'], m['line_text']) for m in result['matches']]
+        if spans != [(m['id'], m['start'], m['line'], m['line_text']) for m in expected['matches']]:
+            print(f"   ❌ chunk_size={chunk_size} で不一致: {spans}")
+            return False
+    print(f"   一致シグネチャ: {expected['signatures']}")
+    return bool(expected['matches']) and not result['stopped_early']
+
+def check_full_log_without_stop(monitor):
+    """打ち切りなしでは全ログを受信し、後続の Netlify エラーも検出するか"""
+    result = monitor.stream_build_log('deploy-ruby34', stop_on_fatal=False)
+    return (
+        result['bytes_read'] == len(RUBY34_FAILURE_LOG.encode('utf-8'))
+        and 'netlify:Build script returned non-zero exit code' in result['signatures']
+        and result['tail'].endswith("Build script returned non-zero exit code: 2\n")
+    )
+
+def check_deploy_details_stream(monitor):
+    """get_deploy_details(stream=True) がログ末尾と解析結果を返すか"""
+    details = monitor.get_deploy_details('deploy-ruby34', stream=True)
+    return (
+        details is not None and details['state'] == 'error'
+        and details['log_analysis']['stopped_early']
+        and "cannot load such file -- csv" in details['build_log']
+    )
+
+def check_missing_log(monitor):
+    """ログが取得できない場合は success=False"""
+    result = monitor.stream_build_log('deploy-unknown')
+    return not result['success'] and result['status_code'] == 404
+
+def main():
+    """テスト実行メイン"""
+    print("🧪 ビルドログ ストリーミング解析テスト")
+    print("=" * 60)
+
+    server, base_url = start_stub_server()
+    monitor = EnhancedNetlifyMonitor(base_url=base_url, site_id=SITE_ID)
+    print(f"📡 スタブ Netlify API: {base_url}")
+
+    tests = [
+        ("致命的エラーで打ち切り", check_stops_on_fatal),
+        ("全文一括解析との一致", check_matches_full_text),
+        ("打ち切りなしの全受信", check_full_log_without_stop),
+        ("デプロイ詳細（stream）", check_deploy_details_stream),
+        ("ログ取得失敗", check_missing_log),
+    ]
+
+    passed = 0
+    for test_name, test_func in tests:
+        print(f"\n▶ {test_name}")
+        try:
+            if test_func(monitor):
+                print(f"✅ {test_name} 成功")
+                passed += 1
+            else:
+                print(f"❌ {test_name} 失敗")
+        except Exception as e:
+            print(f"❌ {test_name} エラー: {str(e)}")
+
+    server.shutdown()
+    print("\n" + "=" * 60)
+    print(f"🎯 テスト結果: {passed}/{len(tests)} 成功")
+    if passed != len(tests):
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
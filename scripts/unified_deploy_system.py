@@ -11,19 +11,32 @@
 
 import os
 import sys
+import csv
+import json
 import subprocess
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 import argparse
 
+# デプロイコミットに含めるパス（プロジェクトルート相対。git_dir は別途追加）
+# 記事本体と、デプロイ前に再生成する索引（アーカイブ・関連記事・サイトマップ）
+DEPLOY_PATHS = ["_posts", "areas", "symptoms", "_data", "sitemap.xml", "scripts/sitemap_state.json"]
+
 class UnifiedDeploySystem:
-    """統合デプロイシステム - 修正後システム完全対応"""
+    """統合デプロイシステム - 修正後システム完全対応
+    
+    in_process=True（既定）: SEOBlogSystem / SafeJekyllConverter を同一プロセスで直接呼び出し、
+    記事データをメモリ上で受け渡す。False の場合は従来通り各段階をサブプロセスで実行する
+    """
     
-    def __init__(self):
+    def __init__(self, in_process: bool = True):
         self.project_root = self._get_project_root()
         self.env_vars = self._load_environment_variables()
         self.git_dir = self.project_root / "data" / "github_pages"
+        self.in_process = in_process
+        self._blog_system = None
+        self._converter = None
         
     def _get_project_root(self) -> Path:
         """プロジェクトルート取得"""
@@ -43,10 +56,42 @@ class UnifiedDeploySystem:
             'PROJECT_ROOT': str(self.project_root)
         }
     
+    def _get_blog_system(self):
+        """記事生成システム取得（プロセス内で1度だけ構築）"""
+        if self._blog_system is None:
+            from seo_blog_system import SEOBlogSystem
+            self._blog_system = SEOBlogSystem()
+            self._blog_system.project_root = self.project_root
+        return self._blog_system
+    
+    def _get_converter(self):
+        """Jekyll変換システム取得（プロセス内で1度だけ構築）"""
+        if self._converter is None:
+            from safe_jekyll_converter import SafeJekyllConverter
+            self._converter = SafeJekyllConverter()
+            self._converter.project_root = self.project_root
+        return self._converter
+    
+    def _use_in_process(self) -> bool:
+        """プロセス内パイプラインが利用可能か判定（不可ならサブプロセスへフォールバック）"""
+        if not self.in_process:
+            return False
+        try:
+            self._get_blog_system()
+            self._get_converter()
+            return True
+        except ImportError as e:
+            print(f"⚠️  プロセス内パイプラインを利用できません（サブプロセスモードで継続）: {e}")
+            self.in_process = False
+            return False
+    
     def generate_article(self, condition: str, area: str, content_type: str) -> Dict[str, Any]:
         """記事生成（修正後システム使用）"""
         print(f"🎯 記事生成開始: {condition} × {area} × {content_type}")
         
+        if self._use_in_process():
+            return self._generate_article_in_process(condition, area, content_type)
+        
         # 環境変数を設定してseo_blog_system.py実行
         env = os.environ.copy()
         env.update(self.env_vars)
@@ -54,38 +99,25 @@ class UnifiedDeploySystem:
         cmd = [
             sys.executable,
             str(self.project_root / "scripts" / "seo_blog_system.py"),
-            condition, area, content_type
+            condition, area, content_type, "--json"
         ]
         
         try:
             result = subprocess.run(cmd, env=env, capture_output=True, text=True, cwd=self.project_root)
+            record = self._parse_result_record(result.stdout)
             
-            if result.returncode == 0:
+            if result.returncode == 0 and record and record.get("success"):
                 print("✅ 記事生成完了")
-                
-                # 生成された記事ファイルを検索
-                date_str = datetime.now().strftime('%Y-%m-%d')
-                article_dir = Path(os.environ.get('HOME', '/tmp')) / "Himawari" / "blog_articles" / date_str
-                
-                if article_dir.exists():
-                    articles = list(article_dir.glob(f"*{condition}*{area}*{content_type}*.md"))
-                    if articles:
-                        return {
-                            "success": True,
-                            "article_path": str(articles[0]),
-                            "output": result.stdout
-                        }
-                
+                # 生成側が返した出力パスをそのまま使用（ディレクトリ走査なし）
                 return {
                     "success": True,
-                    "article_path": None,
-                    "output": result.stdout,
-                    "note": "記事は生成されましたが、ファイルパスを特定できませんでした"
+                    "article_path": record["article_path"],
+                    "record": record
                 }
             else:
                 return {
                     "success": False,
-                    "error": result.stderr,
+                    "error": (record or {}).get("error") or result.stderr,
                     "output": result.stdout
                 }
                 
@@ -95,10 +127,46 @@ class UnifiedDeploySystem:
                 "error": str(e)
             }
     
-    def convert_to_jekyll(self, article_path: str) -> Dict[str, Any]:
-        """Jekyll変換（修正後システム使用）"""
+    def _parse_result_record(self, stdout: str) -> Optional[Dict[str, Any]]:
+        """サブプロセス標準出力の最終行から結果レコード(JSON)を取得"""
+        for line in reversed(stdout.splitlines()):
+            if line.strip():
+                try:
+                    return json.loads(line)
+                except json.JSONDecodeError:
+                    return None
+        return None
+    
+    def _generate_article_in_process(self, condition: str, area: str, content_type: str) -> Dict[str, Any]:
+        """記事生成（プロセス内実行）"""
+        try:
+            system = self._get_blog_system()
+            article_data = system._generate_structured_article(condition, area, content_type)
+            article_path = system.save_article(article_data)
+            print("✅ 記事生成完了")
+            
+            return {
+                "success": True,
+                "article_path": str(article_path),
+                "article": article_data
+            }
+            
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e)
+            }
+    
+    def convert_to_jekyll(self, article_path: str, article: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Jekyll変換（修正後システム使用）
+        
+        article（生成段階の記事データ）を渡すとプロセス内モードではファイルを読み直さない
+        """
         print(f"🔄 Jekyll変換開始: {Path(article_path).name}")
         
+        if self._use_in_process():
+            return self._convert_to_jekyll_in_process(article_path, article)
+        
         # 環境変数を設定してsafe_jekyll_converter.py実行
         env = os.environ.copy()
         env.update(self.env_vars)
@@ -106,33 +174,32 @@ class UnifiedDeploySystem:
         cmd = [
             sys.executable,
             str(self.project_root / "scripts" / "safe_jekyll_converter.py"),
-            article_path
+            article_path, "--json"
         ]
         
         try:
             result = subprocess.run(cmd, env=env, capture_output=True, text=True, cwd=self.project_root)
+            record = self._parse_result_record(result.stdout)
             
-            if result.returncode == 0:
+            if result.returncode == 0 and record and record.get("success"):
                 print("✅ Jekyll変換完了")
+                # 変換側が返した出力パスをそのまま使用（_posts の走査なし）
+                jekyll_filename = record["jekyll_filename"]
+                print(f"📄 生成ファイル: {jekyll_filename}")
                 
-                # 生成されたJekyllファイルを確認
-                jekyll_files = list((self.git_dir / "_posts").glob("*.md"))
-                if jekyll_files:
-                    latest_file = max(jekyll_files, key=lambda f: f.stat().st_mtime)
-                    print(f"📄 生成ファイル: {latest_file.name}")
-                    
-                    # ファイル名の地域確認
-                    if "area" in latest_file.name or "osaka" in latest_file.name:
-                        print(f"⚠️  注意: ファイル名に汎用地域名が含まれています: {latest_file.name}")
+                # ファイル名の地域確認
+                if "area" in jekyll_filename or "osaka" in jekyll_filename:
+                    print(f"⚠️  注意: ファイル名に汎用地域名が含まれています: {jekyll_filename}")
                 
                 return {
                     "success": True,
-                    "output": result.stdout
+                    "jekyll_path": record["jekyll_path"],
+                    "conversion": record
                 }
             else:
                 return {
                     "success": False,
-                    "error": result.stderr,
+                    "error": (record or {}).get("error") or result.stderr,
                     "output": result.stdout
                 }
                 
@@ -142,6 +209,64 @@ class UnifiedDeploySystem:
                 "error": str(e)
             }
     
+    def _convert_to_jekyll_in_process(self, article_path: str, article: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Jekyll変換（プロセス内実行）"""
+        try:
+            converter = self._get_converter()
+            source_content = article['content'] if article else None
+            result = converter.convert_article(Path(article_path), source_content)
+            
+            if not result["success"]:
+                return result
+            
+            print("✅ Jekyll変換完了")
+            print(f"📄 生成ファイル: {result['jekyll_filename']}")
+            
+            if "area" in result['jekyll_filename'] or "osaka" in result['jekyll_filename']:
+                print(f"⚠️  注意: ファイル名に汎用地域名が含まれています: {result['jekyll_filename']}")
+            
+            return {
+                "success": True,
+                "jekyll_path": result["jekyll_path"],
+                "conversion": result
+            }
+            
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e)
+            }
+    
+    def update_archive_index(self) -> Dict[str, Any]:
+        """地域・症状アーカイブ索引の再生成（変更のあったファイルのみ書き込み）"""
+        try:
+            from archive_index_builder import ArchiveIndexBuilder
+        except ImportError as e:
+            print(f"⚠️  アーカイブ索引を更新できません（スキップ）: {e}")
+            return {"success": False, "error": str(e)}
+        
+        return ArchiveIndexBuilder(self.project_root).build()
+    
+    def update_related_posts(self) -> Dict[str, Any]:
+        """関連記事索引 _data/related.json の再生成（追加・変更された記事の影響範囲のみ再計算）"""
+        try:
+            from related_posts_builder import RelatedPostsBuilder
+        except ImportError as e:
+            print(f"⚠️  関連記事索引を更新できません（スキップ）: {e}")
+            return {"success": False, "error": str(e)}
+        
+        return RelatedPostsBuilder(self.project_root).build()
+    
+    def update_sitemap(self) -> Dict[str, Any]:
+        """sitemap.xml の再生成（URL集合・内容に変化がなければ書き換えない）"""
+        try:
+            from sitemap_builder import SitemapBuilder
+        except ImportError as e:
+            print(f"⚠️  サイトマップを更新できません（スキップ）: {e}")
+            return {"success": False, "error": str(e)}
+        
+        return SitemapBuilder(self.project_root).build()
+    
     def deploy_to_git(self, commit_message: Optional[str] = None) -> Dict[str, Any]:
         """Git自動デプロイ"""
         print("🚀 Git デプロイ開始")
@@ -153,11 +278,30 @@ class UnifiedDeploySystem:
             }
         
         try:
-            # Git ディレクトリに移動
-            os.chdir(self.git_dir)
+            # アーカイブ索引・関連記事索引・サイトマップを記事と同じコミットに含める（失敗時はデプロイ中止）
+            for name, update in (("アーカイブ索引", self.update_archive_index),
+                                 ("関連記事索引", self.update_related_posts),
+                                 ("サイトマップ", self.update_sitemap)):
+                index_result = update()
+                if not index_result.get("success"):
+                    return {
+                        "success": False,
+                        "error": f"{name}の更新に失敗したためデプロイを中止: {index_result.get('error')}"
+                    }
+            
+            # リポジトリルートから、記事・索引と git_dir を明示的に指定して操作
+            repo_root = subprocess.run(
+                ["git", "rev-parse", "--show-toplevel"], cwd=self.git_dir, capture_output=True, text=True, check=True
+            ).stdout.strip()
+            deploy_paths = [
+                str(path) for path in [self.project_root / name for name in DEPLOY_PATHS] + [self.git_dir]
+                if path.exists()
+            ]
             
             # Git 状態確認
-            status_result = subprocess.run(["git", "status", "--porcelain"], capture_output=True, text=True)
+            status_result = subprocess.run(
+                ["git", "status", "--porcelain", "--", *deploy_paths], cwd=repo_root, capture_output=True, text=True
+            )
             
             if not status_result.stdout.strip():
                 return {
@@ -169,7 +313,7 @@ class UnifiedDeploySystem:
             print("📝 変更を検出 - デプロイ実行")
             
             # Git add
-            subprocess.run(["git", "add", "."], check=True)
+            subprocess.run(["git", "add", "--", *deploy_paths], cwd=repo_root, check=True)
             
             # コミットメッセージ生成
             if not commit_message:
@@ -186,11 +330,11 @@ class UnifiedDeploySystem:
 
 Co-Authored-By: Claude <noreply@anthropic.com>"""
             
-            # Git commit
-            subprocess.run(["git", "commit", "-m", commit_message], check=True)
+            # Git commit（事前にステージ済みの無関係な変更を含めないようパスを限定）
+            subprocess.run(["git", "commit", "-m", commit_message, "--", *deploy_paths], cwd=repo_root, check=True)
             
             # Git push
-            subprocess.run(["git", "push"], check=True)
+            subprocess.run(["git", "push"], cwd=repo_root, check=True)
             
             print("✅ デプロイ完了")
             return {
@@ -237,7 +381,7 @@ Co-Authored-By: Claude <noreply@anthropic.com>"""
         
         # Step 2: Jekyll変換
         print("🔄 Step 2: Jekyll変換")
-        conv_result = self.convert_to_jekyll(article_path)
+        conv_result = self.convert_to_jekyll(article_path, gen_result.get("article"))
         workflow_result["conversion"] = conv_result
         
         if not conv_result["success"]:
@@ -258,6 +402,129 @@ Co-Authored-By: Claude <noreply@anthropic.com>"""
         
         return workflow_result
 
+    def batch_workflow(self, entries: List[Dict[str, str]], commit_message: Optional[str] = None,
+                       deploy: bool = True) -> Dict[str, Any]:
+        """バッチワークフロー: 全記事を生成 → 変換した後、Git コミット・プッシュを1回だけ実行"""
+        print("🌟 統合デプロイシステム v3.0 バッチモード開始")
+        print(f"📋 対象記事: {len(entries)}件")
+        print("=" * 60)
+        
+        articles = []
+        for index, entry in enumerate(entries, 1):
+            condition, area, content_type = entry["condition"], entry["area"], entry["content_type"]
+            print(f"\n[{index}/{len(entries)}] {condition} × {area} × {content_type}")
+            
+            article_result = {
+                "condition": condition,
+                "area": area,
+                "content_type": content_type,
+                "success": False
+            }
+            articles.append(article_result)
+            
+            gen_result = self.generate_article(condition, area, content_type)
+            article_path = gen_result.get("article_path")
+            if not gen_result["success"] or not article_path:
+                article_result["stage"] = "generation"
+                article_result["error"] = gen_result.get("error") or gen_result.get("note", "記事パスを特定できませんでした")
+                print(f"❌ 記事生成失敗: {article_result['error']}")
+                continue
+            article_result["article_path"] = article_path
+            
+            conv_result = self.convert_to_jekyll(article_path, gen_result.get("article"))
+            if not conv_result["success"]:
+                article_result["stage"] = "conversion"
+                article_result["error"] = conv_result.get("error", "Unknown error")
+                print(f"❌ Jekyll変換失敗: {article_result['error']}")
+                continue
+            
+            article_result["jekyll_path"] = conv_result.get("jekyll_path")
+            article_result["success"] = True
+        
+        succeeded = [article for article in articles if article["success"]]
+        failed = [article for article in articles if not article["success"]]
+        
+        batch_result = {
+            "articles": articles,
+            "succeeded": len(succeeded),
+            "failed": len(failed),
+            "deployment": None,
+            "overall_success": False
+        }
+        
+        # 成功記事がある場合のみ、まとめて1回だけデプロイ（Netlifyビルドも1回）
+        if deploy and succeeded:
+            print("\n🚀 バッチ一括 Git デプロイ")
+            if not commit_message:
+                commit_message = self._build_batch_commit_message(succeeded)
+            deploy_result = self.deploy_to_git(commit_message)
+            batch_result["deployment"] = deploy_result
+            batch_result["overall_success"] = deploy_result["success"] and not failed
+        else:
+            batch_result["overall_success"] = not failed and bool(succeeded)
+        
+        self._print_batch_report(batch_result)
+        return batch_result
+    
+    def _build_batch_commit_message(self, articles: List[Dict[str, Any]]) -> str:
+        """バッチデプロイ用コミットメッセージ生成"""
+        date_str = datetime.now().strftime('%Y-%m-%d %H:%M')
+        lines = [f"記事一括デプロイ {len(articles)}件 ({date_str})", ""]
+        for article in articles:
+            lines.append(f"- {article['condition']} × {article['area']} × {article['content_type']}")
+        return "\n".join(lines)
+    
+    def _print_batch_report(self, batch_result: Dict[str, Any]):
+        """記事別の結果レポート表示"""
+        print("\n" + "=" * 60)
+        print("📊 バッチ結果")
+        print("=" * 60)
+        for article in batch_result["articles"]:
+            label = f"{article['condition']} × {article['area']} × {article['content_type']}"
+            if article["success"]:
+                print(f"✅ {label}")
+            else:
+                print(f"❌ {label} [{article['stage']}] {article['error']}")
+        
+        print(f"\n成功: {batch_result['succeeded']}件 / 失敗: {batch_result['failed']}件")
+        deployment = batch_result["deployment"]
+        if deployment:
+            if deployment["success"]:
+                print(f"🚀 デプロイ: {deployment.get('message', '完了')}")
+            else:
+                print(f"❌ デプロイ失敗: {deployment.get('error', 'Unknown error')}")
+
+def load_manifest(manifest_path: Path) -> List[Dict[str, str]]:
+    """マニフェスト読み込み（JSON配列 または CSV: condition,area,content_type）"""
+    text = manifest_path.read_text(encoding='utf-8')
+    fields = ("condition", "area", "content_type")
+    entries = []
+    
+    if manifest_path.suffix == '.json':
+        items = json.loads(text)
+        if not isinstance(items, list):
+            raise ValueError(f"マニフェストは配列で指定してください: {manifest_path}")
+        for item in items:
+            if isinstance(item, dict) and all(field in item for field in fields):
+                entry = {field: item[field] for field in fields}
+            elif isinstance(item, list) and len(item) >= 3:
+                entry = dict(zip(fields, item))
+            else:
+                raise ValueError(f"マニフェスト項目の形式が不正です: {item!r}")
+            if not all(isinstance(value, str) for value in entry.values()):
+                raise ValueError(f"マニフェスト項目の値は文字列で指定してください: {item!r}")
+            entries.append(entry)
+    else:
+        for row in csv.reader(line for line in text.splitlines() if line.strip() and not line.startswith('#')):
+            row = [cell.strip() for cell in row]
+            if row[:3] == list(fields):
+                continue
+            if len(row) < 3:
+                raise ValueError(f"マニフェスト行の形式が不正です: {row}")
+            entries.append(dict(zip(fields, row)))
+    
+    return entries
+
 def main():
     """メイン実行関数"""
     parser = argparse.ArgumentParser(description='統合デプロイシステム v3.0')
@@ -269,6 +536,15 @@ def main():
     workflow_parser.add_argument('condition', help='症状名（例: パーキンソン病）')
     workflow_parser.add_argument('area', help='地域名（例: 浪速区）')
     workflow_parser.add_argument('content_type', help='コンテンツタイプ（例: symptom_guide）')
+    workflow_parser.add_argument('--subprocess', action='store_true', help='各段階をサブプロセスで実行（従来モード）')
+    
+    # バッチワークフロー
+    batch_parser = subparsers.add_parser('batch', help='マニフェスト記載の全記事を生成・変換し、1回のコミット・プッシュでデプロイ')
+    batch_parser.add_argument('manifest', help='マニフェストファイル（.json または condition,area,content_type のCSV）')
+    batch_parser.add_argument('--message', '-m', help='コミットメッセージ')
+    batch_parser.add_argument('--no-deploy', action='store_true', help='生成・変換のみ実行しデプロイしない')
+    batch_parser.add_argument('--subprocess', action='store_true', help='各段階をサブプロセスで実行（従来モード）')
+    batch_parser.add_argument('--report', help='記事別結果レポート(JSON)の出力先')
     
     # 個別コマンド
     deploy_parser = subparsers.add_parser('deploy', help='Git デプロイのみ実行')
@@ -280,7 +556,7 @@ def main():
         parser.print_help()
         return
     
-    system = UnifiedDeploySystem()
+    system = UnifiedDeploySystem(in_process=not getattr(args, 'subprocess', False))
     
     if args.command == 'workflow':
         result = system.full_workflow(args.condition, args.area, args.content_type)
@@ -288,6 +564,17 @@ def main():
         if not result["overall_success"]:
             sys.exit(1)
     
+    elif args.command == 'batch':
+        entries = load_manifest(Path(args.manifest))
+        result = system.batch_workflow(entries, commit_message=args.message, deploy=not args.no_deploy)
+        
+        if args.report:
+            with open(args.report, 'w', encoding='utf-8') as f:
+                json.dump(result, f, indent=2, ensure_ascii=False)
+        
+        if not result["overall_success"]:
+            sys.exit(1)
+    
     elif args.command == 'deploy':
         result = system.deploy_to_git(args.message)
         
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Webhook バックグラウンドジョブキュー
+Webhook リクエスト内で重い処理（ログ取得・Gemfile修正・git push）を実行せず、
+ワーカースレッドプールで非同期処理する
+
+- 同一ジョブキー（GitHub run_id / Netlify deploy id）の重複投入を排除
+- キュー深さ・待ち時間・処理時間の統計を /health 向けに提供
+"""
+
+import time
+import queue
+import logging
+import itertools
+import threading
+import statistics
+from collections import OrderedDict, deque
+from typing import Callable, Dict, List, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = 4
+DEDUP_TTL_SECONDS = 3600  # GitHub / Netlify の再送を完了後も一定時間は重複扱い
+LATENCY_SAMPLES = 500
+
+class WebhookJobQueue:
+    """ワーカースレッドプール付きジョブキュー（ジョブキーによる重複排除）"""
+
+    def __init__(self, workers: int = DEFAULT_WORKERS, dedup_ttl: float = DEDUP_TTL_SECONDS):
+        self.workers = workers
+        self.dedup_ttl = dedup_ttl
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+        self._active_keys: Dict[str, int] = {}
+        self._recent_keys: "OrderedDict[str, float]" = OrderedDict()
+        self._job_ids = itertools.count(1)
+        self._wait_ms: deque = deque(maxlen=LATENCY_SAMPLES)
+        self._run_ms: deque = deque(maxlen=LATENCY_SAMPLES)
+        self._counters = {'submitted': 0, 'deduplicated': 0, 'succeeded': 0, 'failed': 0}
+        self._running = 0
+
+    def _start_workers(self):
+        """ワーカー起動（初回投入時のみ。Flask リローダーの監視プロセスではスレッドを作らない）"""
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._worker_loop, name=f"webhook-worker-{index + 1}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(self, job_key: Optional[str], func: Callable, *args, **kwargs) -> Dict[str, Any]:
+        """ジョブ投入（同一キーが処理待ち・処理中・直近完了の場合は投入しない）"""
+        with self._lock:
+            if not self._threads:
+                self._start_workers()
+
+            self._expire_recent_keys()
+            if job_key and (job_key in self._active_keys or job_key in self._recent_keys):
+                self._counters['deduplicated'] += 1
+                return {
+                    'accepted': False,
+                    'duplicate': True,
+                    'job_id': self._active_keys.get(job_key),
+                    'job_key': job_key
+                }
+
+            job_id = next(self._job_ids)
+            if job_key:
+                self._active_keys[job_key] = job_id
+            self._counters['submitted'] += 1
+
+        self._queue.put({
+            'job_id': job_id,
+            'job_key': job_key,
+            'func': func,
+            'args': args,
+            'kwargs': kwargs,
+            'enqueued_at': time.monotonic()
+        })
+        return {'accepted': True, 'duplicate': False, 'job_id': job_id, 'job_key': job_key}
+
+    def _expire_recent_keys(self):
+        """重複排除期間を過ぎた完了済みキーを削除（呼び出し側でロック取得済み）"""
+        now = time.monotonic()
+        while self._recent_keys:
+            key, completed_at = next(iter(self._recent_keys.items()))
+            if now - completed_at < self.dedup_ttl:
+                break
+            self._recent_keys.popitem(last=False)
+
+    def _worker_loop(self):
+        """ワーカー: キューからジョブを取り出して実行"""
+        while True:
+            job = self._queue.get()
+            if job is None:
+                self._queue.task_done()
+                return
+
+            started = time.monotonic()
+            with self._lock:
+                self._running += 1
+                self._wait_ms.append((started - job['enqueued_at']) * 1000)
+
+            succeeded = False
+            try:
+                job['func'](*job['args'], **job['kwargs'])
+                succeeded = True
+            except Exception as e:
+                logger.error(f"ジョブ失敗 #{job['job_id']} ({job['job_key']}): {e}")
+            finally:
+                finished = time.monotonic()
+                with self._lock:
+                    self._running -= 1
+                    self._run_ms.append((finished - started) * 1000)
+                    self._counters['succeeded' if succeeded else 'failed'] += 1
+                    if job['job_key']:
+                        self._active_keys.pop(job['job_key'], None)
+                        self._recent_keys[job['job_key']] = finished
+                        self._recent_keys.move_to_end(job['job_key'])
+                self._queue.task_done()
+
+    def stats(self) -> Dict[str, Any]:
+        """キュー統計（/health 用）"""
+        with self._lock:
+            return {
+                'workers': len(self._threads) or self.workers,
+                'queue_depth': self._queue.qsize(),
+                'running': self._running,
+                **self._counters,
+                'wait_ms': self._summarize(self._wait_ms),
+                'run_ms': self._summarize(self._run_ms)
+            }
+
+    @staticmethod
+    def _summarize(samples: deque) -> Dict[str, Optional[float]]:
+        """直近サンプルの p50 / p99 / 最大"""
+        if not samples:
+            return {'p50': None, 'p99': None, 'max': None}
+        ordered = sorted(samples)
+        return {
+            'p50': round(statistics.median(ordered), 1),
+            'p99': round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))], 1),
+            'max': round(ordered[-1], 1)
+        }
+
+    def shutdown(self, wait: bool = True):
+        """全ワーカー停止（投入済みジョブは処理してから終了）"""
+        for _ in self._threads:
+            self._queue.put(None)
+        if wait:
+            for thread in self._threads:
+                thread.join()
+        self._threads = []